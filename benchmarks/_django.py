@@ -0,0 +1,26 @@
+import os
+import tempfile
+
+import django
+from django.conf import settings
+from django.core.management import call_command
+from django.test.utils import setup_test_environment
+
+
+def setup_django(db_path: str | None = None) -> str:
+    """Point the project at a throwaway SQLite file, migrate it and return
+    its path. Must run before anything touches the database connection."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.django_project.settings")
+
+    if db_path is None:
+        fd, db_path = tempfile.mkstemp(prefix="millenium-bench-", suffix=".sqlite3")
+        os.close(fd)
+
+    settings.DATABASES["default"]["NAME"] = db_path
+    settings.DEBUG = False
+
+    django.setup()
+    setup_test_environment()
+    call_command("migrate", verbosity=0)
+
+    return db_path
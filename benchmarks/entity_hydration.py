@@ -0,0 +1,120 @@
+"""Time and retained memory per hydrated aggregate, built the way the Django
+mappers rebuild them from rows.
+
+    python -m benchmarks.entity_hydration [--entities 1000] [--repeat 5]
+"""
+import argparse
+import contextlib
+import datetime
+from decimal import Decimal
+import os
+import time
+import tracemalloc
+import uuid
+from typing import Callable, Dict
+
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberId
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.category.domain.category import Category, CategoryId
+from src.core.genre.domain.genre import Genre, GenreId
+from src.core.video.domain.audio_video_media import Rating
+from src.core.video.domain.video import Video, VideoId
+
+NOW = datetime.datetime.now(datetime.UTC)
+CATEGORY_IDS = [uuid.uuid4() for _ in range(3)]
+GENRE_IDS = [uuid.uuid4() for _ in range(3)]
+CAST_MEMBER_IDS = [uuid.uuid4() for _ in range(3)]
+
+
+def category() -> Category:
+    return Category(
+        id=CategoryId(uuid.uuid4()),
+        name="Movie",
+        description="Movie description",
+        is_active=True,
+        created_at=NOW,
+    )
+
+
+def genre() -> Genre:
+    return Genre(
+        id=GenreId(uuid.uuid4()),
+        name="Drama",
+        categories_id={CategoryId(_id) for _id in CATEGORY_IDS},
+        created_at=NOW,
+    )
+
+
+def cast_member() -> CastMember:
+    return CastMember(
+        id=CastMemberId(uuid.uuid4()),
+        name="Actor",
+        type=CastMemberType.ACTOR,
+        created_at=NOW,
+    )
+
+
+def video() -> Video:
+    return Video(
+        id=VideoId(uuid.uuid4()),
+        title="Video",
+        description="Video description",
+        launch_year=2024,
+        duration=Decimal("90.5"),
+        rating=Rating.L,
+        opened=True,
+        published=False,
+        categories_id={CategoryId(_id) for _id in CATEGORY_IDS},
+        genres_id={GenreId(_id) for _id in GENRE_IDS},
+        cast_members_id={CastMemberId(_id) for _id in CAST_MEMBER_IDS},
+        created_at=NOW,
+    )
+
+
+BUILDERS: Dict[str, Callable[[], object]] = {
+    "Category": category,
+    "Genre": genre,
+    "CastMember": cast_member,
+    "Video": video,
+}
+
+
+def microseconds_per_entity(build: Callable[[], object], entities: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(entities):
+            build()
+        best = min(best, time.perf_counter() - started)
+    return best / entities * 1_000_000
+
+
+def bytes_per_entity(build: Callable[[], object], entities: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    hydrated = [build() for _ in range(entities)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hydrated
+    return (after - before) / entities
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'aggregate':<12} {'us/entity':>10} {'bytes/entity':>13}")
+
+    for name, build in BUILDERS.items():
+        # Some collaborators print on construction; keep that out of the table.
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            elapsed = microseconds_per_entity(build, args.entities, args.repeat)
+            retained = bytes_per_entity(build, args.entities)
+
+        print(f"{name:<12} {elapsed:>10.2f} {retained:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
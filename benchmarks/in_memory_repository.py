@@ -0,0 +1,102 @@
+"""Per-operation latency of the in-memory repositories (id-keyed dict,
+sorted indexes) against the list scans and full sorts they replaced, at
+catalog scale.
+
+    python -m benchmarks.in_memory_repository [--entities 100000] [--repeat 50]
+"""
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from src.core._shared.domain.repositories.search_params import SortDirection
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategorySearchParams
+from src.core.category.infra.category_in_memory_repository import (
+    CategoryInMemoryRepository,
+)
+
+
+class ListScan:
+    """The previous list-backed lookups and search, kept as the baseline."""
+
+    def __init__(self, items: List[Category]):
+        self.items = list(items)
+
+    def find_by_id(self, entity_id):
+        return next(filter(lambda i: i.entity_id == entity_id, self.items), None)
+
+    def update(self, entity: Category) -> None:
+        index = self.items.index(self.find_by_id(entity.entity_id))
+        self.items[index] = entity
+
+    def exists_by_id(self, entity_ids):
+        found = {entity.id.value for entity in self.items if entity.id.value in entity_ids}
+        return [entity_id for entity_id in entity_ids if entity_id in found]
+
+    def delete(self, entity_id) -> None:
+        self.items.remove(self.find_by_id(entity_id))
+
+    def search(self, params: CategorySearchParams):
+        items = self.items
+        if params.filter:
+            items = list(
+                filter(lambda i: params.filter.lower() in i.name.lower(), items)
+            )
+        sort = params.sort or "created_at"
+        reverse = params.sort_dir == SortDirection.DESC or not params.sort
+        items = sorted(items, key=lambda item: getattr(item, sort), reverse=reverse)
+        start = (params.page - 1) * params.per_page
+        return items[start : start + params.per_page]
+
+
+def microseconds(call: Callable[[], object], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        call()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    categories = [Category(name=f"Category {i}") for i in range(args.entities)]
+    ids = [category.id.value for category in categories]
+
+    repository = CategoryInMemoryRepository()
+    repository.bulk_insert(categories)
+    baseline = ListScan(categories)
+
+    def operations(repo):
+        deleted = iter(rng.sample(ids, args.repeat))
+        return {
+            "find_by_id": lambda: repo.find_by_id(rng.choice(ids)),
+            "update": lambda: repo.update(categories[rng.randrange(len(ids))]),
+            "exists_by_id (100 ids)": lambda: repo.exists_by_id(rng.sample(ids, 100)),
+            "delete": lambda: repo.delete(next(deleted)),
+            "search (default page)": lambda: repo.search(CategorySearchParams()),
+            "search (name, page 50)": lambda: repo.search(
+                CategorySearchParams(init_sort="name", init_page=50)
+            ),
+            "search (filter)": lambda: repo.search(
+                CategorySearchParams(init_filter="Category 99")
+            ),
+        }
+
+    print(f"{args.entities} categories")
+    print(f"{'operation':<24} {'list scan us':>14} {'indexed us':>10}")
+    for (name, scan), (_, lookup) in zip(
+        operations(baseline).items(), operations(repository).items()
+    ):
+        print(
+            f"{name:<24} {microseconds(scan, args.repeat):>14.1f} "
+            f"{microseconds(lookup, args.repeat):>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""LocalStorage on large media files: kernel-side copies, moves of spooled
+uploads and memory-mapped reads against the previous implementation, which
+read the upload into a bytes object, wrote it out and read files whole.
+
+    python -m benchmarks.local_storage [--size-mb 1024] [--repeat 3] [--dir /tmp]
+
+Times are wall clock with a warm page cache; "python peak" is the largest
+amount of memory Python allocated during the operation (tracemalloc).
+"""
+import argparse
+import os
+from pathlib import Path
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from src.core._shared.infra.storage.local_storage import LocalStorage
+
+WRITE_CHUNK = 64 * 1024 * 1024
+SLICE = 1024 * 1024
+
+
+class BufferedStorage:
+    """The previous LocalStorage, kept as the baseline."""
+
+    def __init__(self, bucket: Path):
+        self.bucket = bucket
+
+    def store(self, file_path: Path, content: bytes) -> None:
+        full_path = self.bucket.joinpath(file_path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(full_path, "wb") as file:
+            file.write(content)
+
+    def get(self, file_path: Path) -> bytes:
+        with open(self.bucket.joinpath(file_path), "rb") as file:
+            return file.read()
+
+
+def write_random_file(path: Path, size: int) -> None:
+    with open(path, "wb") as file:
+        remaining = size
+        while remaining:
+            chunk = os.urandom(min(WRITE_CHUNK, remaining))
+            file.write(chunk)
+            remaining -= len(chunk)
+
+
+def measure(call: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """Best wall time in seconds and the largest Python allocation peak."""
+    times: List[float] = []
+    peak = 0
+
+    for _ in range(repeat):
+        tracemalloc.start()
+        started = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - started)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return min(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--dir", default=tempfile.gettempdir(), help="where the files are written"
+    )
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    root = Path(tempfile.mkdtemp(prefix="millenium-storage-bench-", dir=args.dir))
+    rng = random.Random(42)
+
+    try:
+        upload = root / "upload.bin"
+        write_random_file(upload, size)
+
+        baseline = BufferedStorage(root / "baseline")
+        storage = LocalStorage(str(root / "storage"))
+        target = Path("videos") / "video.mp4"
+
+        def store_buffered():
+            with open(upload, "rb") as file:
+                baseline.store(target, file.read())
+
+        def store_stream():
+            with open(upload, "rb") as file:
+                storage.store_stream(target, file)
+
+        def move_spooled():
+            spooled = root / "spooled.bin"
+            os.link(upload, spooled)
+            storage.store_file(target, spooled, move=True)
+
+        offsets = [rng.randrange(size - SLICE) for _ in range(100)]
+
+        def read_buffered():
+            content = baseline.get(target)
+            for offset in offsets:
+                content[offset : offset + SLICE]
+
+        def read_mapped():
+            view = storage.get(target)
+            for offset in offsets:
+                # Copied out, as slicing bytes does, so both touch the pages.
+                bytes(view[offset : offset + SLICE])
+
+        rows = [
+            ("store", "bytes + write (before)", store_buffered),
+            ("store", "store_stream (kernel copy)", store_stream),
+            ("store", "store_file(move=True)", move_spooled),
+            ("read 100 x 1 MiB", "read whole file (before)", read_buffered),
+            ("read 100 x 1 MiB", "get (mmap view)", read_mapped),
+        ]
+
+        print(f"{args.size_mb} MiB file in {root}")
+        print(
+            f"{'operation':<18} {'implementation':<28} {'best s':>8} "
+            f"{'python peak MiB':>16}"
+        )
+        for operation, implementation, call in rows:
+            seconds, peak = measure(call, args.repeat)
+            print(
+                f"{operation:<18} {implementation:<28} {seconds:>8.3f} "
+                f"{peak / 2**20:>16.1f}"
+            )
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Serialization time of the collection presenters at ``per_page=500``,
+split into ``serialize()`` and the DRF JSON render of its result.
+
+    python -m benchmarks.presenters [--per-page 500] [--repeat 10]
+"""
+import argparse
+import contextlib
+import datetime
+from decimal import Decimal
+import os
+import time
+import uuid
+from typing import Any, Callable, Dict
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.django_project.settings")
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from src.core.cast_member.application.use_cases.common.cast_member_output import (  # noqa: E402
+    CastMemberOutput,
+)
+from src.core.cast_member.application.use_cases.list_cast_members import (  # noqa: E402
+    ListCastMembersOutput,
+)
+from src.core.cast_member.domain.cast_member_type import CastMemberType  # noqa: E402
+from src.core.category.application.use_cases.common.category_output import (  # noqa: E402
+    CategoryOutput,
+)
+from src.core.category.application.use_cases.list_categories import (  # noqa: E402
+    ListCategoriesOutput,
+)
+from src.core.genre.application.use_cases.common.genre_output import GenreOutput  # noqa: E402
+from src.core.genre.application.use_cases.list_genres import ListGenresOutput  # noqa: E402
+from src.core.video.application.use_cases.common.video_output import VideoOutput  # noqa: E402
+from src.core.video.application.use_cases.list_videos import ListVideosOutput  # noqa: E402
+from src.core.video.domain.audio_video_media import (  # noqa: E402
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.django_project.cast_member_app.presenters import (  # noqa: E402
+    CastMemberCollectionPresenter,
+)
+from src.django_project.category_app.presenters import (  # noqa: E402
+    CategoryCollectionPresenter,
+)
+from src.django_project.genre_app.presenters import GenreCollectionPresenter  # noqa: E402
+from src.django_project.video_app.presenters import VideoCollectionPresenter  # noqa: E402
+
+NOW = datetime.datetime.now(datetime.UTC)
+
+
+def page(output_cls, items):
+    return output_cls(
+        items=items,
+        total=len(items),
+        current_page=1,
+        per_page=len(items),
+        last_page=1,
+    )
+
+
+def video_output(i: int) -> VideoOutput:
+    return VideoOutput(
+        id=uuid.uuid4(),
+        title=f"Video {i}",
+        description="Video description",
+        launch_year=2024,
+        duration=Decimal("90.5"),
+        rating=Rating.AGE_12,
+        opened=True,
+        published=False,
+        categories_id={str(uuid.uuid4()) for _ in range(3)},
+        genres_id={str(uuid.uuid4()) for _ in range(2)},
+        cast_members_id={str(uuid.uuid4()) for _ in range(4)},
+        banner=ImageMedia(name="banner.png", raw_location="videos/banner.png"),
+        thumbnail=None,
+        thumbnail_half=None,
+        trailer=None,
+        video=AudioVideoMedia(
+            name="video.mp4",
+            raw_location="videos/video.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+        ),
+        created_at=NOW,
+    )
+
+
+def presenters(per_page: int) -> Dict[str, Callable[[], Any]]:
+    videos = page(ListVideosOutput, [video_output(i) for i in range(per_page)])
+    categories = page(
+        ListCategoriesOutput,
+        [
+            CategoryOutput(
+                id=uuid.uuid4(),
+                name=f"Category {i}",
+                description="Category description",
+                is_active=True,
+                created_at=NOW,
+            )
+            for i in range(per_page)
+        ],
+    )
+    genres = page(
+        ListGenresOutput,
+        [
+            GenreOutput(
+                id=uuid.uuid4(),
+                name=f"Genre {i}",
+                categories_id={str(uuid.uuid4()) for _ in range(3)},
+                is_active=True,
+                created_at=NOW,
+            )
+            for i in range(per_page)
+        ],
+    )
+    cast_members = page(
+        ListCastMembersOutput,
+        [
+            CastMemberOutput(
+                id=uuid.uuid4(),
+                name=f"Actor {i}",
+                type=CastMemberType.ACTOR,
+                created_at=NOW,
+            )
+            for i in range(per_page)
+        ],
+    )
+
+    return {
+        "VideoCollectionPresenter": lambda: VideoCollectionPresenter(videos),
+        "CategoryCollectionPresenter": lambda: CategoryCollectionPresenter(categories),
+        "GenreCollectionPresenter": lambda: GenreCollectionPresenter(genres),
+        "CastMemberCollectionPresenter": lambda: CastMemberCollectionPresenter(
+            cast_members
+        ),
+    }
+
+
+def best_of(call: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    renderer = JSONRenderer()
+
+    print(f"{'presenter':<32} {'serialize ms':>13} {'render ms':>10}")
+
+    for name, build in presenters(args.per_page).items():
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            serialize = best_of(lambda: build().serialize(), args.repeat)
+            data = build().serialize()
+            render = best_of(lambda: renderer.render(data), args.repeat)
+
+        print(f"{name:<32} {serialize:>13.2f} {render:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""Repository operations timed at catalog scale, for the Django (SQLite) and
+in-memory implementations of every aggregate.
+
+    python -m benchmarks.repositories [--sizes 10000 100000 1000000]
+        [--aggregates category genre cast_member video]
+        [--implementations django in_memory] [--db catalog.sqlite3]
+        [--repeat 50] [--max-seconds 10] [--output results.json]
+
+Each size is reached by topping up the rows left by the previous one, so a
+run seeds the largest size only once. Results are written as JSON, one
+entry per (aggregate, implementation, size, operation, variant). An
+operation an implementation cannot perform is recorded with its ``error``
+instead of timings, and the run goes on.
+"""
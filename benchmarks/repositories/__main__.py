@@ -0,0 +1,265 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from benchmarks._django import setup_django
+from benchmarks.repositories import __doc__ as DESCRIPTION
+
+SEED_CHUNK = 5000
+SAMPLE = 100
+
+
+class Runner:
+    def __init__(self, repeat: int, max_seconds: float, batch: int):
+        self.repeat = repeat
+        self.max_seconds = max_seconds
+        self.batch = batch
+        self.results: List[Dict[str, Any]] = []
+
+    def measure(
+        self,
+        labels: Dict[str, Any],
+        call: Callable[..., object],
+        prepare: Callable[[], tuple] = tuple,
+    ) -> None:
+        """Time ``call(*prepare())`` up to ``repeat`` times, stopping early
+        once ``max_seconds`` have gone by; ``prepare`` is not timed."""
+        durations: List[float] = []
+        started = time.perf_counter()
+
+        try:
+            while len(durations) < self.repeat:
+                args = prepare()
+                call_started = time.perf_counter()
+                call(*args)
+                durations.append(time.perf_counter() - call_started)
+
+                if time.perf_counter() - started > self.max_seconds:
+                    break
+        except Exception as error:
+            result = {**labels, "error": f"{type(error).__name__}: {error}"}
+        else:
+            result = {**labels, **summary(durations)}
+
+        self.results.append(result)
+        print(format_result(result), flush=True)
+
+    def run(self, workload, implementation: str, sizes: List[int], pools) -> None:
+        from django.core.cache import cache
+
+        repository = workload.implementations[implementation]()
+        rng = random.Random(42)
+        # Raw UUIDs, as the use cases pass them.
+        ids: List[Any] = []
+        inserted: List[Any] = []
+        numbers = iter(range(10**9))
+
+        def make():
+            return workload.make(next(numbers), rng, pools)
+
+        def search(params):
+            cache.clear()
+            return repository.search(params)
+
+        for size in sizes:
+            labels = {
+                "aggregate": workload.name,
+                "implementation": implementation,
+                "size": size,
+            }
+
+            started = time.perf_counter()
+            while len(ids) < size:
+                chunk = [make() for _ in range(min(SEED_CHUNK, size - len(ids)))]
+                repository.bulk_insert(chunk)
+                ids.extend(entity.id.value for entity in chunk)
+            print(
+                f"{workload.name} {implementation}: seeded {size} rows "
+                f"in {time.perf_counter() - started:.1f}s",
+                flush=True,
+            )
+
+            def changed(entity_id):
+                entity = repository.find_by_id(entity_id)
+                workload.change(entity, next(numbers))
+                return (entity,)
+
+            def measure(operation: str, call, prepare=tuple, variant=""):
+                self.measure(
+                    {**labels, "operation": operation, "variant": variant},
+                    call,
+                    prepare,
+                )
+
+            measure(
+                "find_by_id",
+                repository.find_by_id,
+                lambda: (rng.choice(ids),),
+            )
+            measure(
+                "find_by_ids",
+                repository.find_by_ids,
+                lambda: (set(rng.sample(ids, SAMPLE)),),
+                variant=f"{SAMPLE} ids",
+            )
+            measure(
+                "exists_by_id",
+                repository.exists_by_id,
+                lambda: (
+                    rng.sample(ids, SAMPLE // 2)
+                    + [uuid.uuid4() for _ in range(SAMPLE // 2)],
+                ),
+                variant=f"{SAMPLE} ids, half missing",
+            )
+
+            for variant, params in search_variants(workload, pools):
+                measure(
+                    "search",
+                    search,
+                    lambda params=params: (params,),
+                    variant=variant,
+                )
+
+            measure("update", repository.update, lambda: changed(rng.choice(ids)))
+
+            def insert(entity):
+                repository.insert(entity)
+                inserted.append(entity.id.value)
+
+            measure("insert", insert, lambda: (make(),))
+            measure("delete", repository.delete, lambda: (inserted.pop(),))
+            inserted.clear()
+
+            def bulk_insert(entities):
+                repository.bulk_insert(entities)
+                ids.extend(entity.id.value for entity in entities)
+
+            measure(
+                "bulk_insert",
+                bulk_insert,
+                lambda: ([make() for _ in range(self.batch)],),
+                variant=f"{self.batch} rows",
+            )
+
+
+def search_variants(workload, pools):
+    params = workload.search_params
+
+    yield "default", params(init_count="exact")
+
+    for sort in workload.sorts:
+        for sort_dir in ("asc", "desc"):
+            yield f"sort={sort} {sort_dir}", params(
+                init_sort=sort, init_sort_dir=sort_dir, init_count="exact"
+            )
+
+    for label, _filter in workload.filters(pools).items():
+        yield f"filter={label}", params(init_filter=_filter, init_count="exact")
+
+
+def summary(durations: List[float]) -> Dict[str, Any]:
+    milliseconds = sorted(duration * 1000 for duration in durations)
+
+    return {
+        "runs": len(milliseconds),
+        "mean_ms": statistics.fmean(milliseconds),
+        "p50_ms": milliseconds[len(milliseconds) // 2],
+        "p95_ms": milliseconds[min(len(milliseconds) - 1, int(len(milliseconds) * 0.95))],
+        "min_ms": milliseconds[0],
+        "max_ms": milliseconds[-1],
+    }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    name = (
+        f"{result['aggregate']:<12} {result['implementation']:<10} "
+        f"{result['size']:>8} {result['operation']:<13} {result['variant']:<28}"
+    )
+    if "error" in result:
+        return f"{name} {result['error']}"
+    return (
+        f"{name} {result['mean_ms']:>10.3f} ms mean "
+        f"{result['p95_ms']:>10.3f} ms p95 ({result['runs']} runs)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--aggregates",
+        nargs="+",
+        default=["category", "genre", "cast_member", "video"],
+    )
+    parser.add_argument(
+        "--implementations", nargs="+", default=["django", "in_memory"]
+    )
+    parser.add_argument(
+        "--db", help="SQLite file to create and keep (default: a temporary one)"
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=10.0,
+        help="stop repeating an operation after this long",
+    )
+    parser.add_argument("--batch", type=int, default=1000, help="bulk_insert rows")
+    parser.add_argument(
+        "--output",
+        default=f"repositories-{datetime.datetime.now():%Y%m%dT%H%M%S}.json",
+    )
+    args = parser.parse_args()
+
+    if args.db and os.path.exists(args.db):
+        parser.error(f"{args.db} already exists")
+
+    db_path = setup_django(args.db)
+
+    from benchmarks.repositories.workloads import WORKLOADS, Pools
+
+    runner = Runner(args.repeat, args.max_seconds, args.batch)
+    started_at = datetime.datetime.now(datetime.UTC)
+
+    try:
+        pools = Pools.seed()
+
+        for workload in WORKLOADS:
+            if workload.name not in args.aggregates:
+                continue
+            for implementation in args.implementations:
+                runner.run(workload, implementation, sorted(args.sizes), pools)
+    finally:
+        if not args.db:
+            os.remove(db_path)
+
+        with open(args.output, "w") as output:
+            json.dump(
+                {
+                    "started_at": started_at.isoformat(),
+                    "python": platform.python_version(),
+                    "sqlite": sqlite3.sqlite_version,
+                    "platform": platform.platform(),
+                    "arguments": vars(args),
+                    "results": runner.results,
+                },
+                output,
+                indent=2,
+            )
+        print(f"wrote {len(runner.results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
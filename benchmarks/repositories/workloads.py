@@ -0,0 +1,168 @@
+"""What to build, change and search for each aggregate. Imported only after
+``setup_django`` since the Django repositories load their models."""
+from dataclasses import dataclass, field
+from decimal import Decimal
+import random
+from typing import Any, Callable, Dict, List
+
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.cast_member_repository import (
+    CastMemberFilter,
+    CastMemberSearchParams,
+)
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.cast_member.infra.cast_member_in_memory_repository import (
+    CastMemberInMemoryRepository,
+)
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategorySearchParams
+from src.core.category.infra.category_in_memory_repository import (
+    CategoryInMemoryRepository,
+)
+from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import GenreFilter, GenreSearchParams
+from src.core.genre.infra.genre_in_memory_repository import GenreInMemoryRepository
+from src.core.video.domain.audio_video_media import Rating
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoFilter, VideoSearchParams
+from src.core.video.infra.video_in_memory_repository import VideoInMemoryRepository
+from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.genre_app.repository import GenreDjangoRepository
+from src.django_project.video_app.repository import VideoDjangoRepository
+
+WORDS = ["action", "drama", "comedy", "horror", "space", "night", "river", "stone"]
+POOL_SIZE = 50
+
+
+@dataclass
+class Pools:
+    """Categories, genres and cast members that genres and videos link to.
+    They live in the database for the Django repositories (foreign keys)
+    and are plain ids for the in-memory ones."""
+
+    categories: List[Any] = field(default_factory=list)
+    genres: List[Any] = field(default_factory=list)
+    cast_members: List[Any] = field(default_factory=list)
+
+    @classmethod
+    def seed(cls) -> "Pools":
+        categories = [Category(name=f"Pool category {i}") for i in range(POOL_SIZE)]
+        CategoryDjangoRepository().bulk_insert(categories)
+
+        genres = [
+            Genre(name=f"Pool genre {i}", categories_id={categories[i].id})
+            for i in range(POOL_SIZE)
+        ]
+        GenreDjangoRepository().bulk_insert(genres)
+
+        cast_members = [
+            CastMember(name=f"Pool member {i}", type=CastMemberType.ACTOR)
+            for i in range(POOL_SIZE)
+        ]
+        CastMemberDjangoRepository().bulk_insert(cast_members)
+
+        return cls(
+            categories=[category.id for category in categories],
+            genres=[genre.id for genre in genres],
+            cast_members=[cast_member.id for cast_member in cast_members],
+        )
+
+
+def name(prefix: str, number: int) -> str:
+    return f"{prefix} {WORDS[number % len(WORDS)]} {number:07d}"
+
+
+@dataclass
+class Workload:
+    name: str
+    make: Callable[[int, random.Random, Pools], Any]
+    change: Callable[[Any, int], None]
+    search_params: type
+    sorts: List[str]
+    filters: Callable[[Pools], Dict[str, Any]]
+    implementations: Dict[str, Callable[[], Any]]
+
+
+WORKLOADS = [
+    Workload(
+        name="category",
+        make=lambda i, rng, pools: Category(
+            name=name("Category", i), description="Benchmark category"
+        ),
+        change=lambda category, i: category.change_name(name("Renamed", i)),
+        search_params=CategorySearchParams,
+        sorts=["name", "created_at"],
+        filters=lambda pools: {"name": "drama 0001"},
+        implementations={
+            "django": CategoryDjangoRepository,
+            "in_memory": CategoryInMemoryRepository,
+        },
+    ),
+    Workload(
+        name="genre",
+        make=lambda i, rng, pools: Genre(
+            name=name("Genre", i),
+            categories_id=set(rng.sample(pools.categories, 2)),
+        ),
+        change=lambda genre, i: genre.change_name(name("Renamed", i)),
+        search_params=GenreSearchParams,
+        sorts=["name", "created_at"],
+        filters=lambda pools: {
+            "name": GenreFilter(name="drama 0001"),
+            "categories_id": GenreFilter(categories_id={str(pools.categories[0])}),
+        },
+        implementations={
+            "django": GenreDjangoRepository,
+            "in_memory": GenreInMemoryRepository,
+        },
+    ),
+    Workload(
+        name="cast_member",
+        make=lambda i, rng, pools: CastMember(
+            name=name("Member", i),
+            type=CastMemberType.ACTOR if i % 3 else CastMemberType.DIRECTOR,
+        ),
+        change=lambda cast_member, i: cast_member.change_name(name("Renamed", i)),
+        search_params=CastMemberSearchParams,
+        sorts=["name", "created_at"],
+        filters=lambda pools: {
+            "name": CastMemberFilter(name="drama 0001"),
+            "type": CastMemberFilter(type=CastMemberType.DIRECTOR),
+        },
+        implementations={
+            "django": CastMemberDjangoRepository,
+            "in_memory": CastMemberInMemoryRepository,
+        },
+    ),
+    Workload(
+        name="video",
+        make=lambda i, rng, pools: Video(
+            title=name("Video", i),
+            description="Benchmark video",
+            launch_year=2000 + i % 25,
+            duration=Decimal("90.50"),
+            rating=Rating.L,
+            opened=False,
+            published=False,
+            categories_id=set(rng.sample(pools.categories, 2)),
+            genres_id=set(rng.sample(pools.genres, 2)),
+            cast_members_id=set(rng.sample(pools.cast_members, 3)),
+        ),
+        change=lambda video, i: video.change_title(name("Renamed", i)),
+        search_params=VideoSearchParams,
+        sorts=["title", "created_at"],
+        filters=lambda pools: {
+            "title": VideoFilter(title="drama 0001"),
+            "categories_id": VideoFilter(categories_id={str(pools.categories[0])}),
+            "genres_id": VideoFilter(genres_id={str(pools.genres[0])}),
+            "cast_members_id": VideoFilter(
+                cast_members_id={str(pools.cast_members[0])}
+            ),
+        },
+        implementations={
+            "django": VideoDjangoRepository,
+            "in_memory": VideoInMemoryRepository,
+        },
+    ),
+]
@@ -0,0 +1,91 @@
+"""Cost of ``Video.validate()`` and ``VideoCollectionPresenter.serialize()``
+at 1, 100 and 1000 items.
+
+    python -m benchmarks.type_adapters [--repeat 5]
+"""
+import argparse
+import contextlib
+import datetime
+from decimal import Decimal
+import os
+import time
+import uuid
+from typing import Callable, List
+
+from src.core.cast_member.domain.cast_member import CastMemberId
+from src.core.category.domain.category import CategoryId
+from src.core.genre.domain.genre import GenreId
+from src.core.video.application.use_cases.common.video_output import VideoOutput
+from src.core.video.application.use_cases.list_videos import ListVideosOutput
+from src.core.video.domain.audio_video_media import ImageMedia, Rating
+from src.core.video.domain.video import Video
+from src.django_project.video_app.presenters import VideoCollectionPresenter
+
+SIZES = (1, 100, 1000)
+
+
+def videos(size: int) -> List[Video]:
+    return [
+        Video(
+            title=f"Video {i}",
+            description="Video description",
+            launch_year=2024,
+            duration=Decimal("90.5"),
+            rating=Rating.L,
+            opened=True,
+            published=False,
+            categories_id={CategoryId(uuid.uuid4())},
+            genres_id={GenreId(uuid.uuid4())},
+            cast_members_id={CastMemberId(uuid.uuid4())},
+            banner=ImageMedia(name="banner.png", raw_location="banner.png"),
+            created_at=datetime.datetime.now(datetime.UTC),
+        )
+        for i in range(size)
+    ]
+
+
+def best_of(call: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':<40} {'items':>6} {'ms':>10}")
+
+    for size in SIZES:
+        entities = videos(size)
+        output = ListVideosOutput(
+            items=[VideoOutput.from_entity(video) for video in entities],
+            total=size,
+            current_page=1,
+            per_page=size,
+            last_page=1,
+        )
+
+        def validate():
+            for video in entities:
+                video.validate()
+
+        def serialize():
+            VideoCollectionPresenter(output).serialize()
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            cases = {
+                "Video.validate()": best_of(validate, args.repeat),
+                "VideoCollectionPresenter.serialize()": best_of(serialize, args.repeat),
+            }
+
+        for name, elapsed in cases.items():
+            print(f"{name:<40} {size:>6} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Latency of VideoDjangoRepository.search with filter[title] through the
+FTS5 index versus the title__icontains scan.
+
+    python -m benchmarks.video_search [--videos 1000000] [--repeat 5]
+"""
+import argparse
+import itertools
+import os
+import time
+from typing import Callable
+
+SYLLABLES = ["ka", "lo", "mi", "ra", "te", "vo", "sun", "dar", "bel", "nor"]
+WORDS = ["".join(pair) for pair in itertools.product(SYLLABLES, repeat=3)]
+
+
+def seed(videos: int) -> None:
+    """Insert ``videos`` rows straight through SQL (the FTS triggers still
+    fire), titles and descriptions drawn deterministically from WORDS."""
+    from django.db import connection, transaction
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("CREATE TEMP TABLE words (i INTEGER PRIMARY KEY, w TEXT)")
+        cursor.executemany(
+            "INSERT INTO words (i, w) VALUES (%s, %s)", list(enumerate(WORDS))
+        )
+        cursor.execute(
+            """
+            WITH RECURSIVE n(x) AS (
+                SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < %s
+            )
+            INSERT INTO video (
+                id, title, description, launch_year, duration, opened,
+                published, rating, created_at
+            )
+            SELECT
+                lower(hex(randomblob(16))),
+                (SELECT w FROM words WHERE i = (x * 7) %% %s) || ' ' ||
+                (SELECT w FROM words WHERE i = (x * 31 + 11) %% %s),
+                (SELECT w FROM words WHERE i = (x * 131 + 3) %% %s) || ' ' ||
+                (SELECT w FROM words WHERE i = (x * 17 + 5) %% %s),
+                2000 + x %% 25, 90, 0, 0, 'L',
+                strftime('%%Y-%%m-%%d %%H:%%M:%%f', 'now', '-' || x || ' seconds')
+            FROM n
+            """,
+            [videos, *[len(WORDS)] * 4],
+        )
+
+
+def milliseconds(call: Callable[[], object], repeat: int) -> float:
+    call()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        call()
+
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--videos", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from benchmarks._django import setup_django
+
+    db_path = setup_django()
+
+    from django.conf import settings
+    from django.core.cache import cache
+
+    from src.core.video.domain.video_repository import VideoFilter, VideoSearchParams
+    from src.django_project.video_app.repository import VideoDjangoRepository
+
+    try:
+        started = time.perf_counter()
+        seed(args.videos)
+        print(f"seeded {args.videos} videos in {time.perf_counter() - started:.1f}s")
+
+        repo = VideoDjangoRepository()
+        terms = {
+            "word": WORDS[123],
+            "prefix": WORDS[321][:4],
+            "two words": f"{WORDS[7]} {WORDS[31 + 11]}",
+        }
+
+        print(f"{'term':<12} {'mode':<10} {'page ms':>10} {'page+count ms':>14}")
+        for (label, term), fts in itertools.product(terms.items(), (False, True)):
+            settings.VIDEO_FULL_TEXT_SEARCH = fts
+
+            def page(count: str):
+                cache.clear()
+                return repo.search(
+                    VideoSearchParams(
+                        init_filter=VideoFilter(title=term), init_count=count
+                    )
+                )
+
+            mode = "fts5" if fts else "icontains"
+            print(
+                f"{label:<12} {mode:<10} "
+                f"{milliseconds(lambda: page('none'), args.repeat):>10.2f} "
+                f"{milliseconds(lambda: page('exact'), args.repeat):>14.2f}"
+            )
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Requests per second on the ``/api/videos`` list and retrieve endpoints.
+
+    python -m benchmarks.videos_api [--videos 50] [--duration 3]
+"""
+import argparse
+import os
+import time
+from decimal import Decimal
+from typing import Callable
+
+from benchmarks._django import setup_django
+
+
+def seed(videos: int) -> str:
+    from src.core.cast_member.domain.cast_member import CastMember
+    from src.core.cast_member.domain.cast_member_type import CastMemberType
+    from src.core.category.domain.category import Category
+    from src.core.genre.domain.genre import Genre
+    from src.core.video.domain.audio_video_media import Rating
+    from src.core.video.domain.video import Video
+    from src.django_project.cast_member_app.repository import (
+        CastMemberDjangoRepository,
+    )
+    from src.django_project.category_app.repository import CategoryDjangoRepository
+    from src.django_project.genre_app.repository import GenreDjangoRepository
+    from src.django_project.video_app.repository import VideoDjangoRepository
+
+    categories = [Category(name=f"Category {i}") for i in range(5)]
+    CategoryDjangoRepository().bulk_insert(categories)
+
+    genres = [
+        Genre(name=f"Genre {i}", categories_id={categories[i].id})
+        for i in range(5)
+    ]
+    genre_repo = GenreDjangoRepository()
+    for genre in genres:
+        genre_repo.insert(genre)
+
+    cast_members = [
+        CastMember(name=f"Actor {i}", type=CastMemberType.ACTOR) for i in range(5)
+    ]
+    CastMemberDjangoRepository().bulk_insert(cast_members)
+
+    video_repo = VideoDjangoRepository()
+    video = None
+    for i in range(videos):
+        video = Video(
+            title=f"Video {i}",
+            description="Benchmark video",
+            launch_year=2024,
+            duration=Decimal("90.5"),
+            rating=Rating.L,
+            opened=True,
+            published=False,
+            categories_id={c.id for c in categories[:2]},
+            genres_id={g.id for g in genres[:2]},
+            cast_members_id={m.id for m in cast_members[:2]},
+        )
+        video_repo.insert(video)
+
+    return str(video.id.value)
+
+
+def requests_per_second(call: Callable[[], object], duration: float) -> float:
+    for _ in range(20):
+        call()
+
+    requests = 0
+    started = time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < duration:
+        call()
+        requests += 1
+
+    return requests / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--videos", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    db_path = setup_django()
+
+    from django.test import Client
+
+    try:
+        video_id = seed(args.videos)
+        client = Client()
+
+        endpoints = {
+            "GET /api/videos/": lambda: client.get("/api/videos/"),
+            "GET /api/videos/<id>/": lambda: client.get(f"/api/videos/{video_id}/"),
+        }
+
+        for name, call in endpoints.items():
+            assert call().status_code == 200, name
+            print(f"{name:<24} {requests_per_second(call, args.duration):>8.1f} req/s")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
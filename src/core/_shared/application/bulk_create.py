@@ -0,0 +1,106 @@
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from typing import Generic, List, Sequence, TypeVar
+
+from pydantic import ValidationError
+
+from src.core._shared.application.use_cases import UseCase
+from src.core._shared.domain.entity import AggregateRoot
+from src.core._shared.domain.exceptions import (
+    EntityValidationException,
+    InvalidArgumentException,
+    NotFoundException,
+    RelatedNotFoundException,
+)
+from src.core._shared.domain.repositories.repository_interface import IRepository
+from src.core._shared.domain.repositories.unit_of_work_interface import IUnitOfWork
+
+ItemInput = TypeVar("ItemInput")
+ItemOutput = TypeVar("ItemOutput")
+E = TypeVar("E", bound=AggregateRoot)
+
+# Errors a single create reports back to the client. Anything else is a bug
+# and aborts the whole batch.
+ITEM_ERRORS = (
+    EntityValidationException,
+    InvalidArgumentException,
+    NotFoundException,
+    RelatedNotFoundException,
+    ValidationError,
+)
+
+
+@dataclass(slots=True)
+class BulkCreateInput(Generic[ItemInput]):
+    items: List[ItemInput]
+    batch_size: int = 500
+
+
+@dataclass(slots=True)
+class BulkItemResult(Generic[ItemOutput]):
+    index: int
+    output: ItemOutput | None = None
+    error: Exception | None = None
+
+
+@dataclass(slots=True)
+class BulkCreateOutput(Generic[ItemOutput]):
+    items: List[BulkItemResult[ItemOutput]] = field(default_factory=list)
+
+    @property
+    def has_errors(self) -> bool:
+        return any(item.error is not None for item in self.items)
+
+
+class BulkCreateUseCase(UseCase, Generic[ItemInput, E, ItemOutput]):
+    """Creates many aggregates at once: relations are checked with one
+    lookup per relation type for the whole batch, failing items are reported
+    individually and the rest are written through ``bulk_insert`` in
+    ``batch_size`` slices inside a single transaction."""
+
+    def __init__(self, repository: IRepository, uow: IUnitOfWork):
+        self.repository = repository
+        self.uow = uow
+
+    def execute(self, input: BulkCreateInput[ItemInput]) -> BulkCreateOutput[ItemOutput]:
+        relation_errors = self._check_relations(input.items)
+
+        results: List[BulkItemResult[ItemOutput]] = []
+        created: List[tuple[BulkItemResult[ItemOutput], E]] = []
+
+        for index, (item, error) in enumerate(zip(input.items, relation_errors)):
+            result = BulkItemResult[ItemOutput](index=index, error=error)
+            results.append(result)
+
+            if error is not None:
+                continue
+
+            try:
+                created.append((result, self._create(item)))
+            except ITEM_ERRORS as item_error:
+                result.error = item_error
+
+        entities = [entity for _, entity in created]
+        self.uow.do(lambda _: self._insert(entities, input.batch_size))
+
+        for result, entity in created:
+            result.output = self._to_output(entity)
+
+        return BulkCreateOutput(items=results)
+
+    def _check_relations(
+        self, items: Sequence[ItemInput]
+    ) -> List[Exception | None]:
+        return [None] * len(items)
+
+    def _insert(self, entities: List[E], batch_size: int) -> None:
+        for start in range(0, len(entities), batch_size):
+            self.repository.bulk_insert(entities[start : start + batch_size])
+
+    @abstractmethod
+    def _create(self, item: ItemInput) -> E:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _to_output(self, entity: E) -> ItemOutput:
+        raise NotImplementedError()
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, Generic, List, TypeVar
 
+from src.core._shared.domain.repositories.search_params import CountMode
 from src.core._shared.domain.repositories.search_result import SearchResult
 
 
@@ -10,10 +11,13 @@ PaginationOutputItem = TypeVar("PaginationOutputItem")
 @dataclass(slots=True)
 class PaginationOutput(Generic[PaginationOutputItem]):
     items: List[PaginationOutputItem]
-    total: int
+    total: int | None
     current_page: int
     per_page: int
-    last_page: int
+    last_page: int | None
+    cursor: str | None = None
+    next_cursor: str | None = None
+    count: CountMode = CountMode.EXACT
 
     @classmethod
     def from_search_result(
@@ -27,4 +31,7 @@ class PaginationOutput(Generic[PaginationOutputItem]):
             current_page=result.current_page,
             per_page=result.per_page,
             last_page=result.last_page,
+            cursor=result.cursor,
+            next_cursor=result.next_cursor,
+            count=result.count,
         )
@@ -1,7 +1,12 @@
 from dataclasses import dataclass
 from typing import Generic, TypeVar, TypedDict
 
-from src.core._shared.domain.repositories.search_params import SortDirection, SortDirectionValues
+from src.core._shared.domain.repositories.search_params import (
+    CountMode,
+    CountModeValues,
+    SortDirection,
+    SortDirectionValues,
+)
 
 
 Filter = TypeVar("Filter", bound=str)
@@ -14,6 +19,8 @@ class SearchInput(Generic[Filter]):
     sort: str | None = None
     sort_dir: SortDirection | SortDirectionValues | None = None
     filter: Filter | None = None
+    cursor: str | None = None
+    count: CountMode | CountModeValues | None = None
 
     def to_input(self):
         typed_dict = TypedDict(
@@ -24,6 +31,8 @@ class SearchInput(Generic[Filter]):
                 "init_sort": str | None,
                 "init_sort_dir": SortDirection | SortDirectionValues | None,
                 "init_filter": Filter | None,
+                "init_cursor": str | None,
+                "init_count": CountMode | CountModeValues | None,
             },
         )
         return typed_dict(
@@ -32,4 +41,6 @@ class SearchInput(Generic[Filter]):
             init_sort=self.sort,
             init_sort_dir=self.sort_dir,
             init_filter=self.filter,
+            init_cursor=self.cursor,
+            init_count=self.count,
         )
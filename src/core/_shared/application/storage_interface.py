@@ -1,12 +1,43 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import BinaryIO
+
+from src.core._shared import metrics
+from src.core._shared.domain.exceptions import InvalidArgumentException
+
+
+def check_file_name(file_name: str) -> str:
+    """``file_name`` as the last part of a storage path: a bare name, so it
+    can neither replace nor climb out of the directory it is stored in."""
+    if (
+        not file_name
+        or file_name in (".", "..")
+        or "/" in file_name
+        or "\\" in file_name
+        or "\0" in file_name
+    ):
+        raise InvalidArgumentException(f"Invalid file name: {file_name!r}")
+
+    return file_name
 
 
 class IStorage(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        metrics.instrument_methods(cls, metrics.STORAGE_SECONDS, "storage")
+
     @abstractmethod
     def store(self, file_path: Path, content: bytes, content_type: str = "") -> str:
         pass
 
     @abstractmethod
-    def get(self, file_path: Path) -> bytes:
+    def store_stream(
+        self, file_path: Path, fileobj: BinaryIO, content_type: str = ""
+    ) -> str:
+        """Store what is left of ``fileobj`` without reading it all into
+        memory; returns the location, as ``store`` does."""
+        pass
+
+    @abstractmethod
+    def get(self, file_path: Path) -> bytes | memoryview:
         pass
@@ -1,12 +1,21 @@
 from abc import ABC, abstractmethod
 from typing import TypeVar, Generic, Awaitable
 
+from src.core._shared import metrics
+
 
 Input = TypeVar("Input")
 Output = TypeVar("Output")
 
 
 class UseCase(ABC, Generic[Input, Output]):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        execute = cls.__dict__.get("execute")
+        if execute is not None and not getattr(execute, "__isabstractmethod__", False):
+            cls.execute = metrics.instrument_use_case(execute)
+
     @abstractmethod
     def execute(self, input: Input) -> Output:
         pass
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 from dataclasses import dataclass, field
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
 from src.core._shared.domain.events.domain_event_interface import (
     IDomainEvent,
@@ -10,20 +10,39 @@ from src.core._shared.domain.events.domain_event_interface import (
 from src.core._shared.domain.events.domain_event_mediator import DomainEventMediator
 from src.core._shared.domain.value_objects import ValueObject
 from src.core._shared.domain.validators.notification import Notification
+from src.core._shared.domain.validators.type_adapter_registry import (
+    TypeAdapterRegistry,
+)
 
 
 @dataclass(slots=True)
 class Entity(ABC):
-    notification: Notification = field(init=False)
     events: list[IDomainEvent] = field(default_factory=list, init=False)
-    local_mediator: IIntegrationEvent = field(
-        default_factory=DomainEventMediator, init=False
+
+    # Built on first use: read paths hydrate entities that never validate or
+    # apply an event, and the mediator wires up the message broker.
+    _notification: Notification | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _local_mediator: IIntegrationEvent | None = field(
+        default=None, init=False, repr=False, compare=False
     )
 
-    def __post_init__(self):
-        self.notification = Notification()
-        self.local_mediator = DomainEventMediator()
+    @property
+    def notification(self) -> Notification:
+        if self._notification is None:
+            self._notification = Notification()
+        return self._notification
+
+    @property
+    def local_mediator(self) -> IIntegrationEvent:
+        if self._local_mediator is None:
+            self._local_mediator = DomainEventMediator()
+        return self._local_mediator
 
+    @local_mediator.setter
+    def local_mediator(self, mediator: IIntegrationEvent) -> None:
+        self._local_mediator = mediator
 
     @property
     @abstractmethod
@@ -37,9 +56,7 @@ class Entity(ABC):
 
     def _validate(self, data: Any):
         try:
-            TypeAdapter(
-                self.__class__,
-            ).validate_python(data)
+            TypeAdapterRegistry.get(self.__class__).validate_python(data)
         except ValidationError as e:
             for error in e.errors():
                 self.notification.add_error(error["msg"], str(error["loc"][0]))
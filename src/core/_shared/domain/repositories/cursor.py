@@ -0,0 +1,38 @@
+import base64
+import binascii
+from dataclasses import dataclass
+import datetime
+import json
+from typing import Any
+
+from src.core._shared.domain.exceptions import InvalidArgumentException
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    sort: str
+    value: Any
+    id: str
+
+    def encode(self) -> str:
+        value = (
+            self.value.isoformat()
+            if isinstance(self.value, (datetime.datetime, datetime.date))
+            else self.value
+        )
+        raw = json.dumps([self.sort, value, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            padding = "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(token + padding)
+            sort, value, _id = json.loads(raw)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise InvalidArgumentException(f"Invalid cursor: {token}")
+
+        if not isinstance(sort, str) or not isinstance(_id, str):
+            raise InvalidArgumentException(f"Invalid cursor: {token}")
+
+        return cls(sort=sort, value=value, id=_id)
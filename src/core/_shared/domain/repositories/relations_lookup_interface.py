@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Set, Type
+
+from src.core._shared.domain.entity import AggregateRoot
+
+
+class IRelationsLookup(ABC):
+    """Checks ids of several aggregates at once, e.g. the categories,
+    genres and cast members a video points to."""
+
+    @abstractmethod
+    def find_missing(
+        self, requested: Dict[Type[AggregateRoot], Set[Any]]
+    ) -> Dict[Type[AggregateRoot], Set[Any]]:
+        """The ids of each requested aggregate that do not exist, exactly as
+        they were passed in (an empty set when all of them do)."""
+        raise NotImplementedError()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Set, Type, Optional, TypeVar, Generic
+from typing import Any, Dict, Iterator, List, Set, Type, Optional, TypeVar, Generic
 
+from src.core._shared import metrics
 from src.core._shared.domain.value_objects import ValueObject
 from src.core._shared.domain.entity import AggregateRoot
 
@@ -9,6 +10,10 @@ EntityId = TypeVar("EntityId", bound=ValueObject)
 
 
 class IRepository(ABC, Generic[E, EntityId]):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        metrics.instrument_methods(cls, metrics.REPOSITORY_SECONDS, "repository")
+
     @abstractmethod
     def insert(self, entity: E) -> None:
         raise NotImplementedError()
@@ -25,6 +30,11 @@ class IRepository(ABC, Generic[E, EntityId]):
     def find_all(self) -> List[E]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def stream_all(self, chunk_size: int = 500) -> Iterator[E]:
+        """Yield every entity, loading at most ``chunk_size`` rows at a time."""
+        raise NotImplementedError()
+
     @abstractmethod
     def find_by_ids(self, entity_ids: Set[EntityId]) -> List[E]:
         raise NotImplementedError()
@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 import math
 from typing import Any, Generic, List, TypeVar
 
+from src.core._shared.domain.repositories.search_params import CountMode
+
 
 SearchResultItem = TypeVar("SearchResultItem", bound=Any)
 
@@ -9,10 +11,16 @@ SearchResultItem = TypeVar("SearchResultItem", bound=Any)
 @dataclass(slots=True, kw_only=True)
 class SearchResult(Generic[SearchResultItem]):
     items: List[SearchResultItem]
-    total: int
+    total: int | None
     current_page: int
     per_page: int
-    last_page: int = field(init=False)
+    last_page: int | None = field(init=False)
+    cursor: str | None = None
+    next_cursor: str | None = None
+    count: CountMode = CountMode.EXACT
 
     def __post_init__(self):
-        object.__setattr__(self, "last_page", math.ceil(self.total / self.per_page))
+        last_page = (
+            math.ceil(self.total / self.per_page) if self.total is not None else None
+        )
+        object.__setattr__(self, "last_page", last_page)
@@ -0,0 +1,32 @@
+import threading
+from typing import Any, Dict, Type, TypeVar
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+class TypeAdapterRegistry:
+    """One compiled ``TypeAdapter`` per class for the life of the process.
+    Building the pydantic schema costs far more than running it, so callers
+    should never instantiate ``TypeAdapter`` on a hot path."""
+
+    _adapters: Dict[Any, TypeAdapter] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, _type: Type[T]) -> TypeAdapter[T]:
+        adapter = cls._adapters.get(_type)
+
+        if adapter is None:
+            with cls._lock:
+                adapter = cls._adapters.get(_type)
+                if adapter is None:
+                    adapter = cls._adapters[_type] = TypeAdapter(_type)
+
+        return adapter
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._adapters.clear()
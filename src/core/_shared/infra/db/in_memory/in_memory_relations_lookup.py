@@ -0,0 +1,26 @@
+from typing import Any, Dict, Set, Type
+
+from src.core._shared.domain.entity import AggregateRoot
+from src.core._shared.domain.repositories.relations_lookup_interface import (
+    IRelationsLookup,
+)
+from src.core._shared.domain.repositories.repository_interface import IRepository
+
+
+class InMemoryRelationsLookup(IRelationsLookup):
+    """One ``exists_by_id`` per aggregate, each a set of dict lookups."""
+
+    def __init__(self, repositories: Dict[Type[AggregateRoot], IRepository]):
+        self.repositories = repositories
+
+    def find_missing(
+        self, requested: Dict[Type[AggregateRoot], Set[Any]]
+    ) -> Dict[Type[AggregateRoot], Set[Any]]:
+        return {
+            entity: (
+                set(self.repositories[entity].exists_by_id(list(ids))["not_exists"])
+                if ids
+                else set()
+            )
+            for entity, ids in requested.items()
+        }
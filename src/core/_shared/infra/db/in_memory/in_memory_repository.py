@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Generic, List, Set, Type, TypeVar
+from itertools import count
+from typing import Any, Dict, Generic, Iterator, List, Set, Tuple, Type, TypeVar
 from uuid import UUID
 from src.core._shared.domain.value_objects import ValueObject
 from src.core._shared.domain.exceptions import NotFoundException
@@ -13,65 +14,107 @@ EntityId = TypeVar("EntityId", bound=ValueObject)
 
 @dataclass(slots=True)
 class InMemoryRepository(IRepository[E, EntityId], ABC):
-    items: List[E] = field(default_factory=lambda: [])
+    """Entities in a dict keyed by insertion sequence, plus a dict from id to
+    the sequences holding it, so lookups, updates and deletes are O(1).
+    Dicts keep insertion order and an update replaces the value in place, so
+    ``items`` comes back in the order entities were inserted.
+
+    As with a list, inserting an id twice keeps both entities; lookups,
+    updates and deletes act on the first one.
+
+    Ids are accepted either as value objects or as the raw values they wrap
+    (``Uuid`` or ``UUID``), whichever the entity's ``entity_id`` returns."""
+
+    _entities: Dict[int, E] = field(default_factory=dict, init=False, repr=False)
+    _slots: Dict[Any, List[int]] = field(default_factory=dict, init=False, repr=False)
+    _sequence: Iterator[int] = field(default_factory=count, init=False, repr=False)
+
+    @property
+    def items(self) -> Tuple[E, ...]:
+        """A snapshot in insertion order; it is a tuple so that writes have
+        to go through ``insert``, ``update`` and ``delete``."""
+        return tuple(self._entities.values())
 
     def insert(self, entity: E) -> None:
-        self.items.append(entity)
+        self.bulk_insert([entity])
 
     def bulk_insert(self, entities: List[E]) -> None:
-        self.items.extend(entities)
+        entries = []
+        for entity in entities:
+            slot = next(self._sequence)
+            self._slots.setdefault(_key(entity.entity_id), []).append(slot)
+            entries.append((slot, entity))
+
+        self._store(entries)
 
     def find_by_id(self, entity_id: EntityId) -> E | None:
         return self._get(entity_id)
 
     def find_all(self) -> List[E]:
-        return self.items
+        return list(self._entities.values())
+
+    def stream_all(self, chunk_size: int = 500) -> Iterator[E]:
+        yield from self.items
 
     def find_by_ids(self, ids: Set[EntityId]) -> List[E]:
-        return [entity for entity in self._items if entity.id in ids]
-    
+        slots = [
+            slot for entity_id in ids for slot in self._slots.get(_key(entity_id), ())
+        ]
+        return [self._entities[slot] for slot in sorted(slots)]
+
     def exists_by_id(self, entity_ids: List[EntityId]) -> Dict[str, List[EntityId]]:
         if not entity_ids:
             raise ValueError("entity_ids must be a list with at least one element")
 
-        if not self.items:
-            return {
-                "exists": [],
-                "not_exists": entity_ids,
-            }
-
-        exists_id = set()
-        not_exists_id = set(entity_ids)
-        for entity in self.items:
-            if entity.id in entity_ids:
-                exists_id.add(entity.id)
-                not_exists_id.discard(entity.id)
+        exists_id = []
+        not_exists_id = []
+        for entity_id in dict.fromkeys(entity_ids):
+            if _key(entity_id) in self._slots:
+                exists_id.append(entity_id)
+            else:
+                not_exists_id.append(entity_id)
 
         return {
-            "exists": list(exists_id),
-            "not_exists": list(not_exists_id),
+            "exists": exists_id,
+            "not_exists": not_exists_id,
         }
 
-
-
     def update(self, entity: E) -> None:
-        entity_found = self._get(entity.entity_id)
+        slots = self._slots.get(_key(entity.entity_id))
 
-        if not entity_found:
+        if not slots:
             raise NotFoundException(entity.entity_id, self.get_entity())
 
-        index = self.items.index(entity_found)
-        self.items[index] = entity
+        self._store([(slots[0], entity)])
 
     def delete(self, entity_id: EntityId) -> None:
-        if entity_found := self._get(entity_id):
-            self.items.remove(entity_found)
-        else:
+        key = _key(entity_id)
+        slots = self._slots.get(key)
+
+        if not slots:
             raise NotFoundException(entity_id, self.get_entity())
 
+        slot = slots.pop(0)
+        if not slots:
+            del self._slots[key]
+        self._discard(slot)
+
     def _get(self, entity_id: EntityId) -> E | None:
-        return next(filter(lambda i: i.entity_id == entity_id, self.items), None)
+        slots = self._slots.get(_key(entity_id))
+        return self._entities[slots[0]] if slots else None
+
+    def _store(self, entries: List[Tuple[int, E]]) -> None:
+        """Every write goes through here and ``_discard``, keyed by insertion
+        sequence, so subclasses can keep derived structures in step."""
+        self._entities.update(entries)
+
+    def _discard(self, slot: int) -> E | None:
+        return self._entities.pop(slot, None)
 
     @abstractmethod
     def get_entity(self) -> Type[E]:
         pass
+
+
+def _key(entity_id: EntityId | UUID) -> Any:
+    return getattr(entity_id, "value", entity_id)
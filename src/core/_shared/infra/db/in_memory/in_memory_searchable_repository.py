@@ -1,6 +1,20 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Generic, List, TypeVar
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+import heapq
+from itertools import islice
+from operator import attrgetter
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
 
 from src.core._shared.domain.value_objects import ValueObject
 from src.core._shared.domain.entity import AggregateRoot
@@ -13,6 +27,11 @@ E = TypeVar("E", bound=AggregateRoot)
 EntityId = TypeVar("EntityId", bound=ValueObject)
 Filter = TypeVar("Filter", bound=str)
 
+# (sort value, insertion sequence): the sequence keeps equal values in
+# insertion order, the way a stable sort of ``items`` would.
+IndexEntry = Tuple[Any, int]
+
+
 @dataclass(slots=True)
 class InMemorySearchableRepository(
     Generic[E, EntityId, Filter],
@@ -23,37 +42,127 @@ class InMemorySearchableRepository(
     ],
     ABC,
 ):
+    """Keeps a sorted index per ``sortable_fields`` entry, maintained on
+    every write, so an unfiltered page is a slice of the index and a
+    filtered page only sorts its first ``page * per_page`` matches.
+
+    Results are the same as filtering ``items``, stable-sorting them and
+    slicing the page. A falsy filter matches everything, and entities
+    changed in place must be passed to ``update`` to be re-indexed."""
+
+    # Sort used when the search names none, e.g. ("created_at", DESC).
+    default_sort: ClassVar[Tuple[str, SortDirection] | None] = None
+
+    _indexes: Dict[str, List[IndexEntry]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _indexed: Dict[int, Tuple[Any, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def search(self, input_params: SearchParams[Filter]) -> SearchResult[E]:
-        items_filtered = self._apply_filter(self.items, input_params.filter)
-        items_sorted = self._apply_sort(
-            items_filtered, input_params.sort, input_params.sort_dir
-        )
-        items_paginated = self._apply_paginate(
-            items_sorted, input_params.page, input_params.per_page
-        )
+        sort, sort_dir = self._resolve_sort(input_params.sort, input_params.sort_dir)
+        start = (input_params.page - 1) * input_params.per_page
+        stop = start + input_params.per_page
+
+        if input_params.filter:
+            items_filtered = self._apply_filter(
+                self._entities.values(), input_params.filter
+            )
+            total = len(items_filtered)
+            items_paginated = self._first(items_filtered, sort, sort_dir, stop)[start:]
+        else:
+            total = len(self._entities)
+            items_paginated = self._slice(sort, sort_dir, start, stop)
 
         return SearchResult(
             items=items_paginated,
-            total=len(items_filtered),
+            total=total,
             current_page=input_params.page,
             per_page=input_params.per_page,
         )
 
     @abstractmethod
-    def _apply_filter(self, items: List[E], filter_param: Filter | None) -> List[E]:
+    def _apply_filter(
+        self, items: Iterable[E], filter_param: Filter | None
+    ) -> List[E]:
         raise NotImplementedError()
 
-    def _apply_sort(
-        self, items: List[E], sort: str | None, sort_dir: SortDirection | None
-    ) -> List[E]:
+    def _resolve_sort(
+        self, sort: str | None, sort_dir: SortDirection | None
+    ) -> Tuple[str | None, SortDirection | None]:
+        if not sort and self.default_sort:
+            return self.default_sort
         if sort and sort in self.sortable_fields:
-            is_reverse = sort_dir == SortDirection.DESC
-            return sorted(
-                items, key=lambda item: getattr(item, sort), reverse=is_reverse
-            )
-        return items
+            return sort, sort_dir
+        return None, None
+
+    def _first(
+        self, items: List[E], sort: str | None, sort_dir: SortDirection | None, n: int
+    ) -> List[E]:
+        """``sorted(items)[:n]``; ``heapq`` keeps ties in input order too."""
+        if not sort:
+            return items[:n]
+        if sort_dir == SortDirection.DESC:
+            return heapq.nlargest(n, items, key=attrgetter(sort))
+        return heapq.nsmallest(n, items, key=attrgetter(sort))
+
+    def _slice(
+        self, sort: str | None, sort_dir: SortDirection | None, start: int, stop: int
+    ) -> List[E]:
+        if not sort:
+            return list(islice(self._entities.values(), start, stop))
+
+        index = self._indexes.get(sort, [])
+        if sort_dir == SortDirection.DESC:
+            entries = islice(_descending(index), start, stop)
+        else:
+            entries = index[start:stop]
+        return [self._entities[slot] for _, slot in entries]
+
+    def _store(self, entries: List[Tuple[int, E]]) -> None:
+        InMemoryRepository._store(self, entries)
+
+        # Stale entries go first, while every index is still sorted.
+        for slot, _ in entries:
+            self._unindex(slot)
+
+        fields = self.sortable_fields
+        batch = len(entries) > 1
+
+        for slot, entity in entries:
+            values = tuple(getattr(entity, name) for name in fields)
+            self._indexed[slot] = values
+            for name, value in zip(fields, values):
+                index = self._indexes.setdefault(name, [])
+                if batch:
+                    index.append((value, slot))
+                else:
+                    insort(index, (value, slot))
+
+        if batch:
+            # The appended run is merged in linear time.
+            for name in fields:
+                self._indexes[name].sort()
+
+    def _discard(self, slot: int) -> E | None:
+        self._unindex(slot)
+        return InMemoryRepository._discard(self, slot)
+
+    def _unindex(self, slot: int) -> None:
+        """Drop ``slot`` from every index."""
+        if (values := self._indexed.pop(slot, None)) is None:
+            return
+        for name, value in zip(self.sortable_fields, values):
+            index = self._indexes[name]
+            del index[bisect_left(index, (value, slot))]
+
 
-    def _apply_paginate(self, items: List[E], page: int, per_page: int) -> List[E]:
-        start = (page - 1) * per_page
-        limit = start + per_page
-        return items[slice(start, limit)]
+def _descending(index: List[IndexEntry]) -> Iterator[IndexEntry]:
+    """``index`` by value, largest first, equal values still in insertion
+    order (what ``sorted(..., reverse=True)`` gives)."""
+    stop = len(index)
+    while stop:
+        start = bisect_left(index, (index[stop - 1][0],), 0, stop)
+        yield from index[start:stop]
+        stop = start
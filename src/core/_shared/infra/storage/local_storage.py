@@ -1,9 +1,23 @@
+import errno
+import mmap
+import os
 from pathlib import Path
+import shutil
+from typing import BinaryIO
+
 from src.core._shared.application.storage_interface import IStorage
 
 
 class LocalStorage(IStorage):
+    """Files under ``bucket``. Files with a descriptor are copied inside the
+    kernel (``copy_file_range``, else ``sendfile``) rather than through
+    Python buffers, and ``get`` returns a read-only memory-mapped view."""
+
     TMP_BUCKET = "/tmp/millenium-storage"
+    CHUNK_SIZE = 1024 * 1024
+    # Bytes per copy_file_range/sendfile call; both copy less when asked for
+    # more than 2 GiB at once.
+    COPY_SIZE = 1024 * 1024 * 1024
 
     def __init__(self, bucket: str = TMP_BUCKET):
         self.bucket = Path(bucket)
@@ -22,6 +36,87 @@ class LocalStorage(IStorage):
 
         return full_path.as_uri()
 
-    def get(self, file_path: Path) -> bytes:
+    def store_stream(
+        self, file_path: Path, fileobj: BinaryIO, content_type: str = ""
+    ) -> str:
+        full_path = self.bucket.joinpath(file_path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(full_path, "wb") as file:
+            try:
+                source = fileobj.fileno()
+            except (AttributeError, OSError):
+                # In-memory uploads and streams without a descriptor.
+                shutil.copyfileobj(fileobj, file, self.CHUNK_SIZE)
+            else:
+                offset = fileobj.tell()
+                copied = _copy_descriptor(source, file.fileno(), offset, self.COPY_SIZE)
+                fileobj.seek(offset + copied)
+
+        return full_path.as_uri()
+
+    def store_file(
+        self, file_path: Path, source_path: str | Path, move: bool = False
+    ) -> str:
+        """Store the file at ``source_path``, e.g. the
+        ``temporary_file_path()`` of a ``TemporaryUploadedFile``. ``move``
+        renames it into place when it is on the same filesystem, which
+        copies nothing; otherwise it is copied and the source removed."""
+        full_path = self.bucket.joinpath(file_path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if move:
+            try:
+                os.replace(source_path, full_path)
+                return full_path.as_uri()
+            except OSError as error:
+                if error.errno != errno.EXDEV:
+                    raise
+
+        with open(source_path, "rb") as source:
+            self.store_stream(file_path, source)
+        if move:
+            os.remove(source_path)
+
+        return full_path.as_uri()
+
+    def get(self, file_path: Path) -> memoryview:
+        """A read-only view of the file mapped into memory: slicing it copies
+        nothing, and pages are read as they are touched. The mapping is
+        released with the last view of it."""
         with open(self.bucket.joinpath(file_path), "rb") as file:
-            return file.read()
+            if os.fstat(file.fileno()).st_size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _copy_descriptor(source: int, target: int, offset: int, size: int) -> int:
+    """Copy ``source`` from ``offset`` to its end into ``target``; returns the
+    number of bytes copied."""
+    copied = 0
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while count := os.copy_file_range(source, target, size, offset + copied):
+                copied += count
+            return copied
+        except OSError as error:
+            # Not supported between these filesystems or on this kernel.
+            if copied or error.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL):
+                raise
+
+    if hasattr(os, "sendfile"):
+        try:
+            while count := os.sendfile(target, source, offset + copied, size):
+                copied += count
+            return copied
+        except OSError as error:
+            if copied or error.errno not in (errno.ENOSYS, errno.EINVAL):
+                raise
+
+    with open(source, "rb", closefd=False) as reader, open(
+        target, "wb", closefd=False
+    ) as writer:
+        reader.seek(offset)
+        shutil.copyfileobj(reader, writer)
+        return reader.tell() - offset
@@ -1,36 +1,130 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import boto3
 from pathlib import Path
 import mimetypes
+from typing import BinaryIO, Dict, Set
 from django.conf import settings
 from src.core._shared.application.storage_interface import IStorage
 
 
 class S3Storage(IStorage):
-    def __init__(self) -> None:
-        self.s3_client = boto3.client(
+    def __init__(
+        self,
+        s3_client=None,
+        bucket_name: str | None = None,
+        part_size: int | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        self.endpoint_url = settings.R2_ENDPOINT_URL
+        self.s3_client = s3_client or boto3.client(
             "s3",
             aws_access_key_id=settings.R2_ACCESS_KEY_ID,
             aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
-            endpoint_url=f"https://{settings.R2_ACCOUNT_ID}.r2.cloudflarestorage.com",
+            endpoint_url=self.endpoint_url,
             region_name="auto",
         )
-        self.bucket_name = settings.R2_BUCKET_NAME
+        self.bucket_name = bucket_name or settings.R2_BUCKET_NAME
+        self.part_size = part_size or settings.S3_MULTIPART_PART_SIZE
+        self.max_concurrency = max_concurrency or settings.S3_MULTIPART_CONCURRENCY
 
     def store(self, file_path: Path, content: bytes, content_type: str = "") -> str:
-        if not content_type:
-            content_type, _ = mimetypes.guess_type(str(file_path))
-
         self.s3_client.put_object(
             Bucket=self.bucket_name,
             Key=str(file_path),
             Body=content,
-            ContentType=content_type or "application/octet-stream",
+            ContentType=self._content_type(file_path, content_type),
+        )
+
+        return self._url(file_path)
+
+    def store_stream(
+        self, file_path: Path, fileobj: BinaryIO, content_type: str = ""
+    ) -> str:
+        """Multipart upload of ``part_size`` parts, ``max_concurrency`` of
+        them in flight at a time, so at most that many parts are in memory.
+        A stream that fits in one part is sent with a single ``put_object``."""
+        first = fileobj.read(self.part_size)
+        if len(first) < self.part_size:
+            return self.store(file_path, first, content_type)
+
+        key = str(file_path)
+        upload_id = self.s3_client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            ContentType=self._content_type(file_path, content_type),
+        )["UploadId"]
+
+        try:
+            parts = self._upload_parts(key, upload_id, first, fileobj)
+        except BaseException:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+            raise
+
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": number, "ETag": parts[number]}
+                    for number in sorted(parts)
+                ]
+            },
         )
 
-        return f"https://{settings.R2_ACCOUNT_ID}.r2.cloudflarestorage.com/{self.bucket_name}/{file_path}"
+        return self._url(file_path)
 
     def get(self, file_path: Path) -> bytes:
         response = self.s3_client.get_object(
             Bucket=self.bucket_name, Key=str(file_path)
         )
         return response["Body"].read()
+
+    def _upload_parts(
+        self, key: str, upload_id: str, first: bytes, fileobj: BinaryIO
+    ) -> Dict[int, str]:
+        """ETag per part number. Parts are read here, in order, and only
+        once fewer than ``max_concurrency`` are still uploading."""
+        parts: Dict[int, str] = {}
+        pending: Set[Future] = set()
+
+        def upload(number: int, body: bytes) -> None:
+            response = self.s3_client.upload_part(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )
+            parts[number] = response["ETag"]
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            try:
+                number, body = 1, first
+                while body:
+                    if len(pending) >= self.max_concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+
+                    pending.add(executor.submit(upload, number, body))
+                    number, body = number + 1, fileobj.read(self.part_size)
+
+                for future in pending:
+                    future.result()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        return parts
+
+    def _content_type(self, file_path: Path, content_type: str) -> str:
+        if not content_type:
+            content_type, _ = mimetypes.guess_type(str(file_path))
+        return content_type or "application/octet-stream"
+
+    def _url(self, file_path: Path) -> str:
+        return f"{self.endpoint_url}/{self.bucket_name}/{file_path}"
@@ -0,0 +1,306 @@
+"""Process-wide latency, error and in-flight metrics in Prometheus' text
+exposition format.
+
+Use cases, repositories and storages are instrumented by their base classes
+(``UseCase``, ``IRepository``, ``IStorage``), so implementations need no
+code of their own. Updates take a lock, so any number of threads can record
+into the same registry. With ``configure(directory)`` every process also
+writes its snapshot to ``<directory>/<pid>.json`` and ``render`` sums the
+snapshots of all processes sharing the directory (e.g. gunicorn workers).
+"""
+import atexit
+from bisect import bisect_left
+from dataclasses import dataclass
+import functools
+import inspect
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    name: str
+    type: str
+    help: str
+
+
+USE_CASE_SECONDS = Metric(
+    "usecase_duration_seconds", "histogram", "Use case execute() latency."
+)
+USE_CASE_ERRORS = Metric(
+    "usecase_errors_total", "counter", "Use case executions that raised."
+)
+USE_CASE_IN_PROGRESS = Metric(
+    "usecase_in_progress", "gauge", "Use case executions currently running."
+)
+REPOSITORY_SECONDS = Metric(
+    "repository_duration_seconds", "histogram", "Repository method latency."
+)
+STORAGE_SECONDS = Metric(
+    "storage_duration_seconds", "histogram", "Storage call latency."
+)
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+        self._values: Dict[str, Dict[Labels, Any]] = {}
+        self._directory: Path | None = None
+        self._dirty = threading.Event()
+
+    def inc(self, metric: Metric, labels: Dict[str, str], amount: float = 1) -> None:
+        key = _labels(labels)
+        with self._lock:
+            values = self._series(metric)
+            values[key] = values.get(key, 0) + amount
+        self._dirty.set()
+
+    def observe(self, metric: Metric, labels: Dict[str, str], value: float) -> None:
+        """Add ``value`` to the histogram: per-bucket counts, then sum and
+        count."""
+        key = _labels(labels)
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._series(metric)
+            series = values.get(key)
+            if series is None:
+                series = values[key] = [0] * (len(self.buckets) + 3)
+            series[bucket] += 1
+            series[-2] += value
+            series[-1] += 1
+        self._dirty.set()
+
+    def snapshot(self) -> Dict[str, Dict[Labels, Any]]:
+        with self._lock:
+            return {
+                name: {
+                    key: list(value) if isinstance(value, list) else value
+                    for key, value in values.items()
+                }
+                for name, values in self._values.items()
+            }
+
+    def configure(self, directory: str | Path | None, interval: float = 1.0) -> None:
+        """Share metrics with the other processes writing to ``directory``:
+        this process's snapshot is written at most every ``interval``
+        seconds while it changes, and once more at exit."""
+        if directory is None or self._directory is not None:
+            return
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        def flush_periodically():
+            while True:
+                self._dirty.wait()
+                time.sleep(interval)
+                self.flush()
+
+        threading.Thread(target=flush_periodically, daemon=True).start()
+        atexit.register(self.flush)
+
+    def flush(self) -> None:
+        if self._directory is None:
+            return
+
+        self._dirty.clear()
+        path = self._directory / f"{os.getpid()}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(
+            json.dumps(
+                {
+                    name: [[list(key), value] for key, value in values.items()]
+                    for name, values in self.snapshot().items()
+                }
+            )
+        )
+        os.replace(temporary, path)
+
+    def render(self) -> str:
+        """Every metric in Prometheus text format, summed over the processes
+        sharing the metrics directory. Gauges of processes that are no
+        longer running are left out."""
+        totals = self.snapshot()
+
+        for pid, snapshot in self._other_processes():
+            alive = _is_running(pid)
+            for name, entries in snapshot.items():
+                if name not in self.metrics:
+                    continue
+                if self.metrics[name].type == "gauge" and not alive:
+                    continue
+                values = totals.setdefault(name, {})
+                for key, value in entries:
+                    key = tuple(tuple(pair) for pair in key)
+                    values[key] = _add(values.get(key), value)
+
+        lines: List[str] = []
+        for name, values in sorted(totals.items()):
+            metric = self.metrics[name]
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for key, value in sorted(values.items()):
+                if metric.type == "histogram":
+                    lines.extend(self._histogram_lines(name, key, value))
+                else:
+                    lines.append(f"{name}{_format_labels(key)} {_number(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def _series(self, metric: Metric) -> Dict[Labels, Any]:
+        if metric.name not in self._values:
+            self.metrics[metric.name] = metric
+            self._values[metric.name] = {}
+        return self._values[metric.name]
+
+    def _histogram_lines(
+        self, name: str, key: Labels, series: List[float]
+    ) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(self.buckets, series):
+            cumulative += count
+            labels = _format_labels((*key, ("le", _number(bound))))
+            yield f"{name}_bucket{labels} {cumulative}"
+        labels = _format_labels((*key, ("le", "+Inf")))
+        yield f"{name}_bucket{labels} {_number(series[-1])}"
+        yield f"{name}_sum{_format_labels(key)} {_number(series[-2])}"
+        yield f"{name}_count{_format_labels(key)} {_number(series[-1])}"
+
+    def _other_processes(self) -> Iterable[Tuple[int, Dict[str, list]]]:
+        if self._directory is None:
+            return
+
+        for path in self._directory.glob("*.json"):
+            pid = int(path.stem)
+            if pid == os.getpid():
+                continue
+            try:
+                yield pid, json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+
+    def register(self, *metrics: Metric) -> None:
+        """Make ``metrics`` known before anything is recorded, so snapshots
+        read from other processes can be rendered."""
+        with self._lock:
+            for metric in metrics:
+                self._series(metric)
+
+
+registry = MetricsRegistry()
+registry.register(
+    USE_CASE_SECONDS,
+    USE_CASE_ERRORS,
+    USE_CASE_IN_PROGRESS,
+    REPOSITORY_SECONDS,
+    STORAGE_SECONDS,
+)
+
+
+def instrument_use_case(execute: Callable) -> Callable:
+    """Time ``execute``, labelled with the class of the use case it runs on."""
+    if getattr(execute, "__instrumented__", False):
+        return execute
+
+    @functools.wraps(execute)
+    def timed_execute(self, *args, **kwargs):
+        labels = {"use_case": type(self).__name__}
+        registry.inc(USE_CASE_IN_PROGRESS, labels)
+        started = time.perf_counter()
+        try:
+            return execute(self, *args, **kwargs)
+        except Exception as error:
+            registry.inc(USE_CASE_ERRORS, {**labels, "error": type(error).__name__})
+            raise
+        finally:
+            registry.observe(USE_CASE_SECONDS, labels, time.perf_counter() - started)
+            registry.inc(USE_CASE_IN_PROGRESS, labels, -1)
+
+    timed_execute.__instrumented__ = True
+    return timed_execute
+
+
+def instrument_methods(cls: type, metric: Metric, label: str) -> None:
+    """Time every public method ``cls`` itself defines (generator methods,
+    whose work happens after they return, are left alone). Methods wrapped
+    already are skipped: ``@dataclass(slots=True)`` builds a second class
+    from the first, which runs ``__init_subclass__`` again."""
+    for attribute, method in list(vars(cls).items()):
+        if (
+            attribute.startswith("_")
+            or not inspect.isfunction(method)
+            or inspect.isgeneratorfunction(method)
+            or getattr(method, "__isabstractmethod__", False)
+            or getattr(method, "__instrumented__", False)
+        ):
+            continue
+        setattr(cls, attribute, _timed(method, metric, label))
+
+
+def _timed(method: Callable, metric: Metric, label: str) -> Callable:
+    """Labelled with the class of the instance, so inherited methods are
+    reported under the concrete repository or storage."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def timed(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            registry.observe(
+                metric,
+                {label: type(self).__name__, "method": name},
+                time.perf_counter() - started,
+            )
+
+    timed.__instrumented__ = True
+    return timed
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: Labels) -> str:
+    if not key:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in key
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _add(total: Any, value: Any) -> Any:
+    if total is None:
+        return value
+    if isinstance(total, list):
+        return [a + b for a, b in zip(total, value)]
+    return total + value
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
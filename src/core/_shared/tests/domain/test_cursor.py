@@ -0,0 +1,37 @@
+import datetime
+
+import pytest
+
+from src.core._shared.domain.exceptions import InvalidArgumentException
+from src.core._shared.domain.repositories.cursor import Cursor
+
+
+class TestCursor:
+
+    def test_encode_and_decode(self):
+        cursor = Cursor(sort="name", value="Movie", id="1b6a2c3e")
+
+        token = cursor.encode()
+
+        assert "=" not in token
+        assert Cursor.decode(token) == cursor
+
+    def test_datetime_values_are_encoded_as_isoformat(self):
+        created_at = datetime.datetime(2024, 9, 14, 16, 23, tzinfo=datetime.UTC)
+        cursor = Cursor(sort="created_at", value=created_at, id="1b6a2c3e")
+
+        decoded = Cursor.decode(cursor.encode())
+
+        assert decoded.value == created_at.isoformat()
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            pytest.param("not a cursor", id="garbage"),
+            pytest.param("W10", id="empty list"),
+            pytest.param("WzEsMiwzXQ", id="wrong types"),
+        ],
+    )
+    def test_decode_invalid_token(self, token: str):
+        with pytest.raises(InvalidArgumentException, match="Invalid cursor"):
+            Cursor.decode(token)
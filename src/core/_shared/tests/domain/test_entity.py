@@ -0,0 +1,54 @@
+from src.core._shared.domain.events.domain_event_mediator import DomainEventMediator
+from src.core._shared.domain.validators.notification import Notification
+from src.core.category.domain.category import Category
+
+
+class TestEntity:
+
+    def test_collaborators_are_not_built_on_hydration(self):
+        category = Category(name="Movie")
+
+        assert category._notification is None
+        assert category._local_mediator is None
+
+    def test_notification_is_built_once_on_first_use(self):
+        category = Category(name="Movie")
+
+        notification = category.notification
+
+        assert isinstance(notification, Notification)
+        assert category.notification is notification
+
+    def test_local_mediator_is_built_once_on_first_use(self):
+        category = Category(name="Movie")
+
+        mediator = category.local_mediator
+
+        assert isinstance(mediator, DomainEventMediator)
+        assert category.local_mediator is mediator
+
+    def test_local_mediator_can_be_injected(self):
+        category = Category(name="Movie")
+        mediator = DomainEventMediator()
+
+        category.local_mediator = mediator
+
+        assert category.local_mediator is mediator
+
+    def test_validation_fills_the_lazy_notification(self):
+        category = Category(name="Movie")
+        category.name = 1  # type: ignore
+
+        category.validate()
+
+        assert category.notification.has_errors()
+
+    def test_equality_ignores_collaborators(self):
+        category = Category(name="Movie")
+        other = Category(
+            id=category.id, name="Movie", created_at=category.created_at
+        )
+
+        category.notification
+
+        assert category == other
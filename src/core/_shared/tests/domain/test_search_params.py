@@ -1,3 +1,4 @@
+from src.core._shared.domain.repositories.search_params import CountMode
 from src.core._shared.domain.repositories.search_result import SearchResult
 
 
@@ -48,3 +49,15 @@ class TestSearchResult:
             items=items, total=total, current_page=current_page, per_page=per_page
         )
         assert search_result.last_page == 0
+
+    def test_last_page_is_none_when_total_is_skipped(self):
+        search_result = SearchResult[int](
+            items=[1, 2, 3],
+            total=None,
+            current_page=1,
+            per_page=3,
+            count=CountMode.NONE,
+        )
+        assert search_result.total is None
+        assert search_result.last_page is None
+        assert search_result.count == CountMode.NONE
@@ -2,6 +2,8 @@ from dataclasses import InitVar
 
 import pytest
 from src.core._shared.domain.repositories.search_params import (
+    CountMode,
+    CountModeValues,
     Filter,
     SearchParams,
     SortDirection,
@@ -25,17 +27,23 @@ class TestSearchParams:
             "sort",
             "sort_dir",
             "filter",
+            "cursor",
+            "count",
             "init_page",
             "init_per_page",
             "init_sort",
             "init_sort_dir",
             "init_filter",
+            "init_cursor",
+            "init_count",
         }
         assert annotations["page"] == int
         assert annotations["per_page"] == int
         assert annotations["sort"] == Optional[str]
         assert annotations["sort_dir"] == Optional[SortDirection]
         assert annotations["filter"] == Optional[Filter]  # type: ignore
+        assert annotations["cursor"] == Optional[str]
+        assert annotations["count"] == CountMode
 
         # must convert to string because a bug in pytest
         assert str(annotations["init_page"]) == str(InitVar[int | None])
@@ -48,6 +56,11 @@ class TestSearchParams:
         assert str(annotations["init_filter"]) == str(
             InitVar[Filter | None]
         )  # type: ignore
+        assert str(annotations["init_cursor"]) == str(InitVar[str | None])
+        assert (
+            str(annotations["init_count"])
+            == InitVar[CountModeValues | CountMode | None].__repr__()
+        )
 
     def test_default_values(self):
         params = StubSearchParams()  # type: ignore
@@ -56,6 +69,9 @@ class TestSearchParams:
         assert params.sort is None
         assert params.sort_dir is None
         assert params.filter is None  # type: ignore
+        assert params.cursor is None
+        assert params.is_cursor_mode is False
+        assert params.count == CountMode.EXACT
 
     @pytest.mark.parametrize(
         "page, expected",
@@ -160,3 +176,34 @@ class TestSearchParams:
     def test_filter_prop(self, _filter: Any, expected: str | None):
         params = StubSearchParams(init_filter=_filter)  # type: ignore
         assert params.filter == expected
+
+    @pytest.mark.parametrize(
+        "cursor, expected, is_cursor_mode",
+        [
+            pytest.param(None, None, False, id="None"),
+            pytest.param("", "", True, id="empty string"),
+            pytest.param("abc", "abc", True, id="token"),
+            pytest.param(0, None, False, id="zero"),
+            pytest.param({}, None, False, id="dict"),
+        ],
+    )
+    def test_cursor_prop(self, cursor: Any, expected: str | None, is_cursor_mode: bool):
+        params = StubSearchParams(init_cursor=cursor)  # type: ignore
+        assert params.cursor == expected
+        assert params.is_cursor_mode is is_cursor_mode
+
+    @pytest.mark.parametrize(
+        "count, expected",
+        [
+            pytest.param(None, CountMode.EXACT, id="None"),
+            pytest.param("", CountMode.EXACT, id="empty string"),
+            pytest.param("fake", CountMode.EXACT, id="fake string"),
+            pytest.param("exact", CountMode.EXACT, id="exact"),
+            pytest.param("ESTIMATED", CountMode.ESTIMATED, id="ESTIMATED"),
+            pytest.param("none", CountMode.NONE, id="none"),
+            pytest.param(CountMode.NONE, CountMode.NONE, id="CountMode.NONE"),
+        ],
+    )
+    def test_count_prop(self, count: Any, expected: CountMode):
+        params = StubSearchParams(init_count=count)  # type: ignore
+        assert params.count == expected
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+
+from pydantic import TypeAdapter
+
+from src.core._shared.domain.validators.type_adapter_registry import (
+    TypeAdapterRegistry,
+)
+from src.core.category.domain.category import Category
+
+
+@dataclass
+class StubDataclass:
+    name: str
+
+
+class TestTypeAdapterRegistry:
+
+    def setup_method(self):
+        TypeAdapterRegistry.clear()
+
+    def test_get_returns_a_type_adapter(self):
+        adapter = TypeAdapterRegistry.get(StubDataclass)
+
+        assert isinstance(adapter, TypeAdapter)
+        assert adapter.dump_python(StubDataclass(name="stub")) == {"name": "stub"}
+
+    def test_get_compiles_one_adapter_per_class(self):
+        assert TypeAdapterRegistry.get(StubDataclass) is TypeAdapterRegistry.get(
+            StubDataclass
+        )
+        assert TypeAdapterRegistry.get(StubDataclass) is not TypeAdapterRegistry.get(
+            Category
+        )
+
+    def test_get_compiles_one_adapter_under_concurrency(self):
+        barrier = threading.Barrier(8)
+
+        def get(_):
+            barrier.wait()
+            return TypeAdapterRegistry.get(StubDataclass)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            adapters = set(map(id, executor.map(get, range(8))))
+
+        assert len(adapters) == 1
+
+    def test_entity_validation_uses_the_registry(self):
+        Category(name="Movie").validate()
+
+        adapter = TypeAdapterRegistry.get(Category)
+        Category(name="Series").validate()
+
+        assert TypeAdapterRegistry.get(Category) is adapter
@@ -97,6 +97,67 @@ class TestInMemoryRepository:
     def test_should_raise_not_found_exception_when_deleting_non_existent_entity(self):
         self.test_update_should_raise_not_found_exception_for_non_existent_entity()
 
+    def test_should_be_able_to_stream_all(self):
+        entities = [
+            StubEntity(id=Uuid(), name="some entity", price=100),
+            StubEntity(id=Uuid(), name="other entity", price=200),
+        ]
+        self.repository.bulk_insert(entities)
+
+        assert list(self.repository.stream_all(chunk_size=1)) == entities
+
+    def test_update_and_delete_keep_insertion_order(self):
+        entities = [
+            StubEntity(id=Uuid(), name=f"entity {i}", price=i) for i in range(4)
+        ]
+        self.repository.bulk_insert(entities)
+
+        updated = StubEntity(id=entities[1].id, name="updated", price=10)
+        self.repository.update(updated)
+        self.repository.delete(entities[2].id)
+
+        assert self.repository.find_all() == [entities[0], updated, entities[3]]
+
+    def test_should_find_by_value_object_or_raw_id(self):
+        stub_entity = StubEntity(id=Uuid(), name="some entity", price=100)
+        self.repository.insert(stub_entity)
+
+        assert self.repository.find_by_id(stub_entity.id.value) == stub_entity
+        assert self.repository.find_by_ids({stub_entity.id, Uuid()}) == [stub_entity]
+
+    def test_exists_by_id_splits_known_and_unknown_ids(self):
+        stub_entity = StubEntity(id=Uuid(), name="some entity", price=100)
+        self.repository.insert(stub_entity)
+        unknown = Uuid()
+
+        assert self.repository.exists_by_id([stub_entity.id, unknown]) == {
+            "exists": [stub_entity.id],
+            "not_exists": [unknown],
+        }
+
+    def test_inserting_an_id_twice_keeps_both_entities(self):
+        first = StubEntity(id=Uuid(), name="first", price=1)
+        second = StubEntity(id=first.id, name="second", price=2)
+        self.repository.bulk_insert([first, second])
+
+        assert self.repository.find_all() == [first, second]
+        assert self.repository.find_by_id(first.id) == first
+
+        self.repository.delete(first.id)
+
+        assert self.repository.find_all() == [second]
+        assert self.repository.find_by_id(first.id) == second
+
+    def test_items_cannot_be_written_directly(self):
+        stub_entity = StubEntity(id=Uuid(), name="some entity", price=100)
+
+        with pytest.raises(AttributeError):
+            self.repository.items.append(stub_entity)
+        with pytest.raises(AttributeError):
+            self.repository.items = [stub_entity]
+
+        assert self.repository.find_all() == []
+
     def test_get_entity(self):
         entity = self.repository.get_entity()
         assert entity == StubEntity
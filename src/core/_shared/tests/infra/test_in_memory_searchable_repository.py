@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+import itertools
+from operator import attrgetter
+import random
 from typing import Any, List, Optional
 
 from src.core._shared.domain.value_objects import Uuid
@@ -72,10 +75,13 @@ class TestInMemorySearchableRepository:
             StubEntity(id=Uuid(), name="a", price=0),
             StubEntity(id=Uuid(), name="c", price=2),
         ]
+        self.repository.bulk_insert(items)
 
-        result = self.repository._apply_sort(items, "name", SortDirection.ASC)
+        result = self.repository.search(
+            StubSearchParams(init_sort="name", init_sort_dir=SortDirection.ASC)
+        )
 
-        assert result == [items[1], items[0], items[2]]
+        assert result.items == [items[1], items[0], items[2]]
 
     def test_must_be_able_to_apply_paginate(self):
         items = [
@@ -85,18 +91,17 @@ class TestInMemorySearchableRepository:
             StubEntity(id=Uuid(), name="d", price=1),
             StubEntity(id=Uuid(), name="e", price=1),
         ]
+        self.repository.bulk_insert(items)
 
-        result = self.repository._apply_paginate(items, 1, 2)
-        assert result == [items[0], items[1]]
-
-        result = self.repository._apply_paginate(items, 2, 2)
-        assert result == [items[2], items[3]]
-
-        result = self.repository._apply_paginate(items, 3, 2)
-        assert result == [items[4]]
+        def page(number: int) -> List[StubEntity]:
+            return self.repository.search(
+                StubSearchParams(init_page=number, init_per_page=2)
+            ).items
 
-        result = self.repository._apply_paginate(items, 4, 2)
-        assert result == []
+        assert page(1) == [items[0], items[1]]
+        assert page(2) == [items[2], items[3]]
+        assert page(3) == [items[4]]
+        assert page(4) == []
 
     def test_search_when_params_is_empty(self):
         entity = StubEntity(id=Uuid(), name="a", price=1)
@@ -184,3 +189,42 @@ class TestInMemorySearchableRepository:
             current_page=2,
             per_page=2,
         )
+
+    def test_indexed_search_matches_filter_sort_and_slice(self):
+        rng = random.Random(7)
+        entities = [
+            StubEntity(Uuid(), rng.choice(["a", "b", "test", "TeSt"]), i)
+            for i in range(30)
+        ]
+        self.repository.bulk_insert(entities[:20])
+        for entity in entities[20:]:
+            self.repository.insert(entity)
+        for entity in rng.sample(entities, 8):
+            self.repository.update(StubEntity(entity.id, rng.choice("abz"), -1))
+        for entity in rng.sample(entities, 5):
+            self.repository.delete(entity.id)
+
+        for sort, sort_dir, _filter, page in itertools.product(
+            [None, "name", "price"], ["asc", "desc"], [None, "test"], [1, 2, 4]
+        ):
+            params = StubSearchParams(
+                init_page=page,
+                init_per_page=7,
+                init_sort=sort,
+                init_sort_dir=sort_dir,
+                init_filter=_filter,
+            )
+            items = self.repository._apply_filter(self.repository.find_all(), _filter)
+            if params.sort in self.repository.sortable_fields:
+                items = sorted(
+                    items,
+                    key=attrgetter(params.sort),
+                    reverse=params.sort_dir == SortDirection.DESC,
+                )
+
+            assert self.repository.search(params) == SearchResult(
+                items=items[(page - 1) * 7 : page * 7],
+                total=len(items),
+                current_page=page,
+                per_page=7,
+            )
@@ -0,0 +1,198 @@
+import io
+import os
+from pathlib import Path
+import threading
+import time
+import uuid
+
+import boto3
+from django.core.files.uploadedfile import TemporaryUploadedFile
+import pytest
+
+from src.core._shared.infra.storage.local_storage import LocalStorage
+from src.core._shared.infra.storage.s3_storage import S3Storage
+
+PART_SIZE = 1024
+
+
+class FakeS3Client:
+    """The slice of the S3 API that ``S3Storage`` uses, kept in memory, with
+    a short delay per part so concurrent uploads overlap."""
+
+    def __init__(self, fail_on_part: int | None = None):
+        self.objects = {}
+        self.uploads = {}
+        self.aborted = []
+        self.fail_on_part = fail_on_part
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[Key] = (bytes(Body), ContentType)
+
+    def create_multipart_upload(self, Bucket, Key, ContentType):
+        upload_id = str(uuid.uuid4())
+        self.uploads[upload_id] = (ContentType, {})
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(0.01)
+            if PartNumber == self.fail_on_part:
+                raise ConnectionError("connection reset")
+            self.uploads[UploadId][1][PartNumber] = bytes(Body)
+            return {"ETag": f'"{PartNumber}"'}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        content_type, parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        self.objects[Key] = (b"".join(parts[n] for n in numbers), content_type)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[Key][0])}
+
+
+class TestS3StorageStoreStream:
+    def storage(self, client: FakeS3Client) -> S3Storage:
+        return S3Storage(
+            s3_client=client, bucket_name="test", part_size=PART_SIZE, max_concurrency=3
+        )
+
+    def test_uploads_parts_concurrently_in_order(self):
+        client = FakeS3Client()
+        content = os.urandom(PART_SIZE * 10 + 100)
+
+        self.storage(client).store_stream(Path("videos/a.mp4"), io.BytesIO(content))
+
+        assert client.objects["videos/a.mp4"] == (content, "video/mp4")
+        assert 1 < client.peak_in_flight <= 3
+        assert client.uploads == {}
+
+    def test_small_streams_are_sent_in_one_request(self):
+        client = FakeS3Client()
+
+        self.storage(client).store_stream(
+            Path("a.bin"), io.BytesIO(b"abc"), "application/x-test"
+        )
+
+        assert client.objects["a.bin"] == (b"abc", "application/x-test")
+        assert client.peak_in_flight == 0
+
+    def test_aborts_the_upload_when_a_part_fails(self):
+        client = FakeS3Client(fail_on_part=4)
+        content = os.urandom(PART_SIZE * 10)
+
+        with pytest.raises(ConnectionError):
+            self.storage(client).store_stream(Path("a.bin"), io.BytesIO(content))
+
+        assert len(client.aborted) == 1
+        assert client.objects == {}
+        assert client.uploads == {}
+
+
+class TestLocalStorage:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: Path):
+        self.storage = LocalStorage(str(tmp_path / "bucket"))
+        self.content = os.urandom(LocalStorage.CHUNK_SIZE * 2 + 1)
+        self.source = tmp_path / "upload.tmp"
+        self.source.write_bytes(self.content)
+
+    def test_copies_streams_without_a_descriptor(self):
+        location = self.storage.store_stream(
+            Path("videos/a.mp4"), io.BytesIO(self.content)
+        )
+
+        assert location == (self.storage.bucket / "videos/a.mp4").as_uri()
+        assert self.storage.get(Path("videos/a.mp4")) == self.content
+
+    @pytest.mark.parametrize(
+        "without", [(), ("copy_file_range",), ("copy_file_range", "sendfile")]
+    )
+    def test_copies_files_from_their_current_position(self, monkeypatch, without):
+        for name in without:
+            monkeypatch.delattr(os, name, raising=False)
+
+        with open(self.source, "rb") as file:
+            file.seek(100)
+            self.storage.store_stream(Path("a.bin"), file)
+            assert file.tell() == len(self.content)
+
+        assert self.storage.get(Path("a.bin")) == self.content[100:]
+
+    def test_store_file_moves_the_source_into_place(self):
+        self.storage.store_file(Path("a.bin"), self.source, move=True)
+
+        assert not self.source.exists()
+        assert self.storage.get(Path("a.bin")) == self.content
+
+    def test_store_file_copies_the_source(self):
+        self.storage.store_file(Path("a.bin"), str(self.source))
+
+        assert self.source.exists()
+        assert self.storage.get(Path("a.bin")) == self.content
+
+    def test_store_file_accepts_temporary_uploaded_files(self, settings, tmp_path):
+        settings.FILE_UPLOAD_TEMP_DIR = str(tmp_path)
+        upload = TemporaryUploadedFile("a.mp4", "video/mp4", len(self.content), None)
+        upload.write(self.content)
+        upload.flush()
+
+        self.storage.store_file(Path("a.mp4"), upload.temporary_file_path(), move=True)
+        upload.close()
+
+        assert self.storage.get(Path("a.mp4")) == self.content
+
+    def test_get_returns_a_read_only_memory_mapped_view(self):
+        self.storage.store(Path("a.bin"), self.content)
+
+        view = self.storage.get(Path("a.bin"))
+
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view[10:20] == self.content[10:20]
+
+    def test_get_reads_empty_files(self):
+        self.storage.store(Path("empty.bin"), b"")
+
+        assert self.storage.get(Path("empty.bin")) == b""
+
+
+@pytest.mark.skipif(
+    "S3_TEST_ENDPOINT_URL" not in os.environ,
+    reason="set S3_TEST_ENDPOINT_URL (and S3_TEST_BUCKET, S3_TEST_ACCESS_KEY_ID, "
+    "S3_TEST_SECRET_ACCESS_KEY) to run against an S3-compatible server",
+)
+def test_store_stream_against_an_s3_compatible_server():
+    """E.g. ``docker run -p 9000:9000 minio/minio server /data`` and a bucket
+    created beforehand."""
+    client = boto3.client(
+        "s3",
+        endpoint_url=os.environ["S3_TEST_ENDPOINT_URL"],
+        aws_access_key_id=os.environ.get("S3_TEST_ACCESS_KEY_ID", "minioadmin"),
+        aws_secret_access_key=os.environ.get("S3_TEST_SECRET_ACCESS_KEY", "minioadmin"),
+        region_name="us-east-1",
+    )
+    storage = S3Storage(
+        s3_client=client,
+        bucket_name=os.environ.get("S3_TEST_BUCKET", "test"),
+        part_size=5 * 1024 * 1024,
+        max_concurrency=4,
+    )
+    content = os.urandom(5 * 1024 * 1024 * 3 + 1)
+    file_path = Path("tests") / f"{uuid.uuid4()}.bin"
+
+    storage.store_stream(file_path, io.BytesIO(content))
+
+    assert storage.get(file_path) == content
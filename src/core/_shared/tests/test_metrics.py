@@ -0,0 +1,165 @@
+import json
+import os
+from pathlib import Path
+import threading
+
+import pytest
+
+from src.core._shared import metrics
+from src.core._shared.application.storage_interface import IStorage
+from src.core._shared.application.use_cases import UseCase
+from src.core._shared.metrics import Metric, MetricsRegistry
+from src.core.category.domain.category import Category
+from src.core.category.infra.category_in_memory_repository import (
+    CategoryInMemoryRepository,
+)
+
+LATENCY = Metric("test_duration_seconds", "histogram", "Test latency.")
+CALLS = Metric("test_calls_total", "counter", "Test calls.")
+RUNNING = Metric("test_running", "gauge", "Test calls running.")
+
+
+def samples(text: str) -> dict[str, float]:
+    return {
+        line.rsplit(" ", 1)[0]: float(line.rsplit(" ", 1)[1])
+        for line in text.splitlines()
+        if line and not line.startswith("#")
+    }
+
+
+class TestMetricsRegistry:
+    def test_renders_histograms_in_prometheus_text_format(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.observe(LATENCY, {"name": "a"}, 0.05)
+        registry.observe(LATENCY, {"name": "a"}, 0.1)
+        registry.observe(LATENCY, {"name": "a"}, 5.0)
+
+        text = registry.render()
+
+        assert "# TYPE test_duration_seconds histogram" in text
+        assert samples(text) == {
+            'test_duration_seconds_bucket{name="a",le="0.1"}': 2,
+            'test_duration_seconds_bucket{name="a",le="1.0"}': 2,
+            'test_duration_seconds_bucket{name="a",le="+Inf"}': 3,
+            'test_duration_seconds_sum{name="a"}': 5.15,
+            'test_duration_seconds_count{name="a"}': 3,
+        }
+
+    def test_escapes_label_values(self):
+        registry = MetricsRegistry()
+        registry.inc(CALLS, {"name": 'say "hi"\\'})
+
+        assert 'test_calls_total{name="say \\"hi\\"\\\\"} 1' in registry.render()
+
+    def test_counts_from_many_threads(self):
+        registry = MetricsRegistry()
+
+        def work():
+            for _ in range(1000):
+                registry.inc(CALLS, {"name": "a"})
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert samples(registry.render())['test_calls_total{name="a"}'] == 8000
+
+    def test_sums_the_snapshots_of_other_processes(self, tmp_path: Path):
+        registry = MetricsRegistry()
+        registry.register(CALLS, RUNNING)
+        registry.configure(tmp_path)
+        registry.inc(CALLS, {"name": "a"})
+        registry.inc(RUNNING, {"name": "a"})
+
+        other = {
+            "test_calls_total": [[[["name", "a"]], 2]],
+            "test_running": [[[["name", "a"]], 1]],
+        }
+        (tmp_path / f"{os.getppid()}.json").write_text(json.dumps(other))
+        # A worker that has exited: its counts stay, its gauges do not.
+        (tmp_path / "999999999.json").write_text(json.dumps(other))
+
+        assert samples(registry.render()) == {
+            'test_calls_total{name="a"}': 5,
+            'test_running{name="a"}': 2,
+        }
+
+    def test_flush_writes_the_snapshot_of_this_process(self, tmp_path: Path):
+        registry = MetricsRegistry()
+        registry.configure(tmp_path)
+        registry.inc(CALLS, {"name": "a"})
+
+        registry.flush()
+
+        snapshot = json.loads((tmp_path / f"{os.getpid()}.json").read_text())
+        assert snapshot == {"test_calls_total": [[[["name", "a"]], 1]]}
+
+
+class FailingUseCase(UseCase):
+    def execute(self, input: bool) -> str:
+        if input:
+            raise ValueError("boom")
+        return "ok"
+
+
+class FakeStorage(IStorage):
+    def store(self, file_path, content, content_type=""):
+        return str(file_path)
+
+    def store_stream(self, file_path, fileobj, content_type=""):
+        return str(file_path)
+
+    def get(self, file_path):
+        return b""
+
+
+class TestInstrumentation:
+    def value(self, metric: Metric, **labels) -> int:
+        key = tuple(sorted(labels.items()))
+        value = metrics.registry.snapshot().get(metric.name, {}).get(key, 0)
+        return value[-1] if isinstance(value, list) else value
+
+    def test_use_cases_record_latency_and_errors(self):
+        labels = {"use_case": "FailingUseCase"}
+        calls = self.value(metrics.USE_CASE_SECONDS, **labels)
+        errors = self.value(metrics.USE_CASE_ERRORS, **labels, error="ValueError")
+
+        assert FailingUseCase().execute(False) == "ok"
+        with pytest.raises(ValueError):
+            FailingUseCase().execute(True)
+
+        assert self.value(metrics.USE_CASE_SECONDS, **labels) == calls + 2
+        assert (
+            self.value(metrics.USE_CASE_ERRORS, **labels, error="ValueError")
+            == errors + 1
+        )
+        assert self.value(metrics.USE_CASE_IN_PROGRESS, **labels) == 0
+
+    def test_storage_calls_are_timed(self):
+        labels = {"storage": "FakeStorage", "method": "store"}
+        calls = self.value(metrics.STORAGE_SECONDS, **labels)
+
+        FakeStorage().store(Path("a.txt"), b"")
+
+        assert self.value(metrics.STORAGE_SECONDS, **labels) == calls + 1
+
+    def test_slots_dataclass_repositories_are_timed_once_under_their_own_name(self):
+        labels = {"repository": "CategoryInMemoryRepository", "method": "insert"}
+        calls = self.value(metrics.REPOSITORY_SECONDS, **labels)
+        inherited = self.value(
+            metrics.REPOSITORY_SECONDS, repository="InMemoryRepository", method="insert"
+        )
+
+        CategoryInMemoryRepository().insert(Category(name="Movie"))
+
+        assert self.value(metrics.REPOSITORY_SECONDS, **labels) == calls + 1
+        assert (
+            self.value(
+                metrics.REPOSITORY_SECONDS,
+                repository="InMemoryRepository",
+                method="insert",
+            )
+            == inherited
+        )
@@ -0,0 +1,16 @@
+from src.core._shared.application.bulk_create import BulkCreateUseCase
+from src.core.cast_member.application.use_cases.create_cast_member import (
+    CreateCastMemberInput,
+    CreateCastMemberOutput,
+)
+from src.core.cast_member.domain.cast_member import CastMember
+
+
+class BulkCreateCastMembersUseCase(
+    BulkCreateUseCase[CreateCastMemberInput, CastMember, CreateCastMemberOutput]
+):
+    def _create(self, item: CreateCastMemberInput) -> CastMember:
+        return CastMember.create(item)
+
+    def _to_output(self, cast_member: CastMember) -> CreateCastMemberOutput:
+        return CreateCastMemberOutput.from_entity(cast_member)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from src.core._shared.application.use_cases import UseCase
 from src.core.cast_member.domain.cast_member_type import CastMemberType
 from src.core.cast_member.application.use_cases.common.cast_member_output import (
     CastMemberOutput,
@@ -20,7 +21,7 @@ class CreateCastMemberOutput(CastMemberOutput):
     pass
 
 
-class CreateCastMemberUseCase:
+class CreateCastMemberUseCase(UseCase):
     def __init__(self, cast_member_repository: ICastMemberRepository):
         self.cast_member_repository = cast_member_repository
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.core._shared.application.use_cases import UseCase
 from src.core._shared.domain.exceptions import NotFoundException
 from src.core.cast_member.domain.cast_member import CastMember
 from src.core.cast_member.domain.cast_member_repository import ICastMemberRepository
@@ -11,7 +12,7 @@ class DeleteCastMemberInput:
     id: UUID
 
 
-class DeleteCastMemberUseCase:
+class DeleteCastMemberUseCase(UseCase):
     def __init__(self, cast_member_repository: ICastMemberRepository):
         self.cast_member_repository = cast_member_repository
 
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.cast_member.application.use_cases.common.cast_member_output import CastMemberOutput
+from src.core.cast_member.domain.cast_member_repository import ICastMemberRepository
+
+
+@dataclass(slots=True)
+class ExportCastMembersInput:
+    chunk_size: int = 500
+
+
+class ExportCastMembersUseCase(UseCase):
+    def __init__(self, cast_member_repository: ICastMemberRepository):
+        self.cast_member_repository = cast_member_repository
+
+    def execute(self, input: ExportCastMembersInput) -> Iterator[CastMemberOutput]:
+        cast_members = self.cast_member_repository.stream_all(input.chunk_size)
+
+        return map(CastMemberOutput.from_entity, cast_members)
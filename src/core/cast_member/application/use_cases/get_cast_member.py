@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.core._shared.application.use_cases import UseCase
 from src.core._shared.domain.exceptions import NotFoundException
 from src.core.cast_member.application.use_cases.common.cast_member_output import (
     CastMemberOutput,
@@ -20,7 +21,7 @@ class GetCastMemberOutput(CastMemberOutput):
     pass
 
 
-class GetCastMemberUseCase:
+class GetCastMemberUseCase(UseCase):
     def __init__(self, cast_member_repository: ICastMemberRepository):
         self.cast_member_repository = cast_member_repository
 
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from src.core._shared.application.use_cases import UseCase
 from src.core.cast_member.application.use_cases.common.cast_member_output import (
     CastMemberOutput,
 )
@@ -26,7 +27,7 @@ class ListCastMembersOutput(PaginationOutput[CastMemberOutput]):
     pass
 
 
-class ListCastMembersUseCase:
+class ListCastMembersUseCase(UseCase):
     def __init__(self, cast_member_repository: ICastMemberRepository):
         self.cast_member_repository = cast_member_repository
 
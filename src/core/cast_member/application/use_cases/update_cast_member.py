@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.core._shared.application.use_cases import UseCase
 from src.core._shared.domain.exceptions import (
     EntityValidationException,
     NotFoundException,
@@ -25,7 +26,7 @@ class UpdateCastMemberOutput(CastMemberOutput):
     pass
 
 
-class UpdateCastMemberUseCase:
+class UpdateCastMemberUseCase(UseCase):
     def __init__(self, cast_member_repository: ICastMemberRepository):
         self.cast_member_repository = cast_member_repository
 
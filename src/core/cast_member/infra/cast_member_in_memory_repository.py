@@ -1,4 +1,4 @@
-from typing import List, Type
+from typing import Iterable, List, Type
 from src.core._shared.domain.repositories.search_params import SortDirection
 from src.core._shared.infra.db.in_memory.in_memory_searchable_repository import (
     InMemorySearchableRepository,
@@ -16,9 +16,10 @@ class CastMemberInMemoryRepository(
     InMemorySearchableRepository[CastMember, CastMemberId, CastMemberFilter],
 ):
     sortable_fields: List[str] = ["name", "created_at"]
+    default_sort = ("created_at", SortDirection.DESC)
 
     def _apply_filter(
-        self, items: List[CastMember], filter_param: CastMemberFilter | None = None
+        self, items: Iterable[CastMember], filter_param: CastMemberFilter | None = None
     ) -> List[CastMember]:
         if filter_param:
             filter_obj = filter(
@@ -26,7 +27,7 @@ class CastMemberInMemoryRepository(
             )
             return list(filter_obj)
 
-        return items
+        return list(items)
 
     def _filter_logic(self, item: CastMember, filter_param: CastMemberFilter) -> bool:
         if filter_param.name and filter_param.type:
@@ -46,17 +47,5 @@ class CastMemberInMemoryRepository(
     def _clause_type(self, item: CastMember, _type: CastMemberType) -> bool:
         return _type == item.type
 
-    def _apply_sort(
-        self,
-        items: List[CastMember],
-        sort: str | None = None,
-        sort_dir: SortDirection | None = None,
-    ) -> List[CastMember]:
-        return (
-            super()._apply_sort(items, sort, sort_dir)
-            if sort
-            else super()._apply_sort(items, "created_at", SortDirection.DESC)
-        )
-
     def get_entity(self) -> Type[CastMember]:
         return CastMember
@@ -0,0 +1,16 @@
+from src.core._shared.application.bulk_create import BulkCreateUseCase
+from src.core.category.application.use_cases.create_category import (
+    CreateCategoryInput,
+    CreateCategoryOutput,
+)
+from src.core.category.domain.category import Category
+
+
+class BulkCreateCategoriesUseCase(
+    BulkCreateUseCase[CreateCategoryInput, Category, CreateCategoryOutput]
+):
+    def _create(self, item: CreateCategoryInput) -> Category:
+        return Category.create(item)
+
+    def _to_output(self, category: Category) -> CreateCategoryOutput:
+        return CreateCategoryOutput.from_entity(category)
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.category.application.use_cases.common.category_output import CategoryOutput
+from src.core.category.domain.category_repository import ICategoryRepository
+
+
+@dataclass(slots=True)
+class ExportCategoriesInput:
+    chunk_size: int = 500
+
+
+class ExportCategoriesUseCase(UseCase):
+    def __init__(self, category_repository: ICategoryRepository):
+        self.category_repository = category_repository
+
+    def execute(self, input: ExportCategoriesInput) -> Iterator[CategoryOutput]:
+        categories = self.category_repository.stream_all(input.chunk_size)
+
+        return map(CategoryOutput.from_entity, categories)
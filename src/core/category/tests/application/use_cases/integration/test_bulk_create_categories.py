@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from src.core._shared.application.bulk_create import BulkCreateInput
+from src.core._shared.application.use_cases import UseCase
+from src.core.category.application.use_cases.bulk_create_categories import (
+    BulkCreateCategoriesUseCase,
+)
+from src.core.category.application.use_cases.create_category import (
+    CreateCategoryInput,
+    CreateCategoryOutput,
+)
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.shared_app.unit_of_work import UnitOfWork
+
+
+@pytest.mark.django_db
+class TestBulkCreateCategoriesUseCaseInt:
+    category_repo: CategoryDjangoRepository
+    use_case: BulkCreateCategoriesUseCase
+
+    def setup_method(self) -> None:
+        self.category_repo = CategoryDjangoRepository()
+        self.use_case = BulkCreateCategoriesUseCase(self.category_repo, UnitOfWork())
+
+    def test_if_instance_a_use_case(self):
+        assert isinstance(self.use_case, UseCase)
+
+    def test_should_write_items_in_batches(self):
+        input = BulkCreateInput(
+            items=[CreateCategoryInput(name=f"Category {i}") for i in range(5)],
+            batch_size=2,
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            output = self.use_case.execute(input)
+
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 3
+
+        assert not output.has_errors
+        assert [item.index for item in output.items] == [0, 1, 2, 3, 4]
+
+        categories = {c.id.value: c for c in self.category_repo.find_all()}
+        assert len(categories) == 5
+
+        for item in output.items:
+            category = categories[item.output.id]
+            assert item.output == CreateCategoryOutput.from_entity(category)
+
+    def test_should_not_persist_anything_when_a_batch_fails(self):
+        input = BulkCreateInput(
+            items=[CreateCategoryInput(name=f"Category {i}") for i in range(4)],
+            batch_size=2,
+        )
+        bulk_insert = self.category_repo.bulk_insert
+        calls = []
+
+        def fail_on_second_batch(entities):
+            calls.append(entities)
+            if len(calls) == 2:
+                raise RuntimeError("connection lost")
+            bulk_insert(entities)
+
+        with patch.object(
+            self.category_repo, "bulk_insert", side_effect=fail_on_second_batch
+        ):
+            with pytest.raises(RuntimeError):
+                self.use_case.execute(input)
+
+        assert len(calls) == 2
+        assert self.category_repo.find_all() == []
@@ -0,0 +1,41 @@
+from src.core._shared.application.use_cases import UseCase
+from src.core.category.application.use_cases.common.category_output import (
+    CategoryOutput,
+)
+from src.core.category.application.use_cases.export_categories import (
+    ExportCategoriesInput,
+    ExportCategoriesUseCase,
+)
+from src.core.category.domain.category import Category
+from src.core.category.infra.category_in_memory_repository import (
+    CategoryInMemoryRepository,
+)
+
+
+class TestExportCategoriesUseCase:
+    category_repo: CategoryInMemoryRepository
+    use_case: ExportCategoriesUseCase
+
+    def setup_method(self) -> None:
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = ExportCategoriesUseCase(self.category_repo)
+
+    def test_if_instance_a_use_case(self):
+        assert isinstance(self.use_case, UseCase)
+
+    def test_should_be_able_to_export_every_category(self):
+        categories = [Category(name="Movie"), Category(name="Series")]
+        self.category_repo.bulk_insert(categories)
+
+        output = self.use_case.execute(ExportCategoriesInput())
+
+        assert list(output) == [
+            CategoryOutput.from_entity(category) for category in categories
+        ]
+
+    def test_should_be_lazy(self):
+        output = self.use_case.execute(ExportCategoriesInput())
+
+        self.category_repo.insert(Category(name="Movie"))
+
+        assert len(list(output)) == 1
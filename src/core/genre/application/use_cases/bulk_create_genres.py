@@ -0,0 +1,52 @@
+from typing import List, Sequence
+
+from src.core._shared.application.bulk_create import BulkCreateUseCase
+from src.core._shared.domain.exceptions import RelatedNotFoundException
+from src.core._shared.domain.repositories.unit_of_work_interface import IUnitOfWork
+from src.core.category.domain.category_repository import ICategoryRepository
+from src.core.genre.application.use_cases.create_genre import (
+    CreateGenreInput,
+    CreateGenreOutput,
+)
+from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import IGenreRepository
+
+
+class BulkCreateGenresUseCase(
+    BulkCreateUseCase[CreateGenreInput, Genre, CreateGenreOutput]
+):
+    def __init__(
+        self,
+        genre_repo: IGenreRepository,
+        category_repo: ICategoryRepository,
+        uow: IUnitOfWork,
+    ):
+        super().__init__(genre_repo, uow)
+        self.category_repo = category_repo
+
+    def _check_relations(
+        self, items: Sequence[CreateGenreInput]
+    ) -> List[Exception | None]:
+        requested = set().union(*(item.categories_id for item in items))
+        existing = (
+            {category.id.value for category in self.category_repo.find_by_ids(requested)}
+            if requested
+            else set()
+        )
+
+        return [
+            (
+                RelatedNotFoundException(
+                    f"Categories with provided IDs not found: {missing}"
+                )
+                if (missing := set(item.categories_id) - existing)
+                else None
+            )
+            for item in items
+        ]
+
+    def _create(self, item: CreateGenreInput) -> Genre:
+        return Genre.create(item)
+
+    def _to_output(self, genre: Genre) -> CreateGenreOutput:
+        return CreateGenreOutput.from_entity(genre)
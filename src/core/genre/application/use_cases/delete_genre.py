@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from uuid import UUID
+from src.core._shared.application.use_cases import UseCase
 from src.core._shared.domain.exceptions import NotFoundException
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import IGenreRepository
@@ -10,7 +11,7 @@ class DeleteGenreInput:
     id: UUID
 
 
-class DeleteGenreUseCase:
+class DeleteGenreUseCase(UseCase):
 
     def __init__(self, genre_repository: IGenreRepository):
         self.genre_repository = genre_repository
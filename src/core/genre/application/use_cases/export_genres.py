@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.genre.application.use_cases.common.genre_output import GenreOutput
+from src.core.genre.domain.genre_repository import IGenreRepository
+
+
+@dataclass(slots=True)
+class ExportGenresInput:
+    chunk_size: int = 500
+
+
+class ExportGenresUseCase(UseCase):
+    def __init__(self, genre_repository: IGenreRepository):
+        self.genre_repository = genre_repository
+
+    def execute(self, input: ExportGenresInput) -> Iterator[GenreOutput]:
+        genres = self.genre_repository.stream_all(input.chunk_size)
+
+        return map(GenreOutput.from_entity, genres)
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+import datetime
+from typing import BinaryIO, ContextManager
+from uuid import UUID
+
+
+class IUploadSpool(ABC):
+    """Where the chunks of an upload session are kept until it is finalized."""
+
+    @abstractmethod
+    def create(self, session_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    def lock(self, session_id: UUID) -> ContextManager[None]:
+        """Held while a chunk is checked against the session offset and
+        written, so one chunk of a session is written at a time."""
+        pass
+
+    @abstractmethod
+    def write(
+        self, session_id: UUID, offset: int, stream: BinaryIO | None, size: int
+    ) -> int:
+        """Copy up to ``size`` bytes of ``stream`` to ``offset``; returns how
+        many were written, fewer when the client went away early."""
+        pass
+
+    @abstractmethod
+    def open(self, session_id: UUID) -> BinaryIO:
+        pass
+
+    @abstractmethod
+    def discard(self, session_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    def discard_untouched_since(self, moment: datetime.datetime) -> int:
+        """Discard every spool file last written before ``moment``, whether
+        or not its session still exists; returns how many were removed."""
+        pass
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+import datetime
+from typing import BinaryIO
+from uuid import UUID
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.video.application.upload_spool_interface import IUploadSpool
+from src.core.video.application.use_cases.common.upload_session_output import (
+    UploadSessionOutput,
+    find_live_session,
+)
+from src.core.video.domain.upload_session import (
+    UploadSessionConflictException,
+    UploadTooLargeException,
+)
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+
+
+@dataclass
+class AppendUploadChunkInput:
+    video_id: UUID
+    id: UUID
+    offset: int
+    content: BinaryIO | None
+    size: int
+
+
+@dataclass
+class AppendUploadChunkOutput(UploadSessionOutput):
+    pass
+
+
+class AppendUploadChunkUseCase(UseCase):
+    def __init__(
+        self,
+        session_repo: IUploadSessionRepository,
+        spool: IUploadSpool,
+        timeout: datetime.timedelta,
+    ):
+        self.session_repo = session_repo
+        self.spool = spool
+        self.timeout = timeout
+
+    def execute(self, input: AppendUploadChunkInput) -> AppendUploadChunkOutput:
+        find_live_session(self.session_repo, input.video_id, input.id, self.timeout)
+
+        # Chunks for the same offset take turns: the one that comes second
+        # sees the offset already moved and writes nothing.
+        with self.spool.lock(input.id):
+            session = find_live_session(
+                self.session_repo, input.video_id, input.id, self.timeout
+            )
+
+            if input.offset != session.offset:
+                raise UploadSessionConflictException(session)
+            if input.offset + input.size > session.length:
+                raise UploadTooLargeException(session)
+
+            written = self.spool.write(
+                session.id, input.offset, input.content, input.size
+            )
+
+            if not self.session_repo.advance(session, input.offset + written):
+                raise UploadSessionConflictException(
+                    find_live_session(
+                        self.session_repo, input.video_id, input.id, self.timeout
+                    )
+                )
+
+        session.offset = input.offset + written
+
+        return AppendUploadChunkOutput.from_entity(session)
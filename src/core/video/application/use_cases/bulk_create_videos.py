@@ -0,0 +1,75 @@
+from typing import List, Sequence
+
+from src.core._shared.application.bulk_create import BulkCreateUseCase
+from src.core._shared.domain.exceptions import (
+    InvalidArgumentException,
+    NotFoundException,
+)
+from src.core._shared.domain.repositories.unit_of_work_interface import IUnitOfWork
+from src.core.video.application.use_cases.create_video import (
+    CreateVideoInput,
+    CreateVideoOutput,
+)
+from src.core.video.application.validations.video_relations_exists_in_database_validator import (
+    RELATIONS,
+    VideoRelationsExistsInDatabaseValidator,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import IVideoRepository
+
+
+class BulkCreateVideosUseCase(
+    BulkCreateUseCase[CreateVideoInput, Video, CreateVideoOutput]
+):
+    def __init__(
+        self,
+        video_repo: IVideoRepository,
+        relations_validator: VideoRelationsExistsInDatabaseValidator,
+        uow: IUnitOfWork,
+    ):
+        super().__init__(video_repo, uow)
+        self.relations_validator = relations_validator
+
+    def _check_relations(
+        self, items: Sequence[CreateVideoInput]
+    ) -> List[Exception | None]:
+        # Checked in the same order as CreateVideoUseCase, so an item reports
+        # the same error it would get from a single create.
+        not_found = self.relations_validator.find_missing(
+            categories_id=set().union(*(item.categories_id for item in items)),
+            genres_id=set().union(*(item.genres_id for item in items)),
+            cast_members_id=set().union(*(item.cast_members_id for item in items)),
+        )
+        relations = [
+            (attribute, entity, not_found[attribute])
+            for attribute, entity in RELATIONS
+        ]
+
+        errors: List[Exception | None] = []
+
+        for item in items:
+            error = None
+
+            for attribute, entity, not_found in relations:
+                if not getattr(item, attribute):
+                    error = InvalidArgumentException(
+                        "ids must be an array with at least one element"
+                    )
+                    break
+
+                missing = [id for id in getattr(item, attribute) if id in not_found]
+                if missing:
+                    error = NotFoundException(
+                        ", ".join(str(id) for id in missing), entity
+                    )
+                    break
+
+            errors.append(error)
+
+        return errors
+
+    def _create(self, item: CreateVideoInput) -> Video:
+        return Video.create(item)
+
+    def _to_output(self, video: Video) -> CreateVideoOutput:
+        return CreateVideoOutput.from_entity(video)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+import datetime
+from uuid import UUID
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.video.application.upload_spool_interface import IUploadSpool
+from src.core.video.application.use_cases.common.upload_session_output import (
+    find_live_session,
+)
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+
+
+@dataclass
+class CancelUploadSessionInput:
+    video_id: UUID
+    id: UUID
+
+
+class CancelUploadSessionUseCase(UseCase):
+    def __init__(
+        self,
+        session_repo: IUploadSessionRepository,
+        spool: IUploadSpool,
+        timeout: datetime.timedelta,
+    ):
+        self.session_repo = session_repo
+        self.spool = spool
+        self.timeout = timeout
+
+    def execute(self, input: CancelUploadSessionInput) -> None:
+        session = find_live_session(
+            self.session_repo, input.video_id, input.id, self.timeout
+        )
+
+        self.spool.discard(session.id)
+        self.session_repo.delete(session.id)
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+import datetime
+from uuid import UUID
+
+from src.core._shared.domain.exceptions import NotFoundException
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+
+
+@dataclass(slots=True)
+class UploadSessionOutput:
+    id: UUID
+    video_id: UUID
+    field: str
+    file_name: str
+    content_type: str
+    length: int
+    offset: int
+    created_at: datetime.datetime
+
+    @classmethod
+    def from_entity(cls, session: UploadSession) -> "UploadSessionOutput":
+        return cls(
+            id=session.id,
+            video_id=session.video_id,
+            field=session.field,
+            file_name=session.file_name,
+            content_type=session.content_type,
+            length=session.length,
+            offset=session.offset,
+            created_at=session.created_at,
+        )
+
+
+def find_live_session(
+    session_repo: IUploadSessionRepository,
+    video_id: UUID,
+    session_id: UUID,
+    timeout: datetime.timedelta,
+) -> UploadSession:
+    """The session, unless it is missing or has expired."""
+    session = session_repo.find_by_id(video_id, session_id)
+
+    if session is None or session.is_expired(timeout):
+        raise NotFoundException(session_id, UploadSession)
+
+    return session
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Literal
+from uuid import UUID
+
+from src.core._shared.application.use_cases import UseCase
+from src.core._shared.domain.exceptions import NotFoundException
+from src.core.video.application.upload_spool_interface import IUploadSpool
+from src.core.video.application.use_cases.common.upload_session_output import (
+    UploadSessionOutput,
+)
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import IVideoRepository
+
+
+@dataclass
+class CreateUploadSessionInput:
+    video_id: UUID
+    field: Literal["video", "trailer"]
+    file_name: str
+    length: int
+    content_type: str = ""
+
+
+@dataclass
+class CreateUploadSessionOutput(UploadSessionOutput):
+    pass
+
+
+class CreateUploadSessionUseCase(UseCase):
+    def __init__(
+        self,
+        video_repo: IVideoRepository,
+        session_repo: IUploadSessionRepository,
+        spool: IUploadSpool,
+    ):
+        self.video_repo = video_repo
+        self.session_repo = session_repo
+        self.spool = spool
+
+    def execute(self, input: CreateUploadSessionInput) -> CreateUploadSessionOutput:
+        if self.video_repo.find_by_id(input.video_id) is None:
+            raise NotFoundException(input.video_id, Video)
+
+        session = UploadSession(
+            video_id=input.video_id,
+            field=input.field,
+            file_name=input.file_name,
+            content_type=input.content_type,
+            length=input.length,
+        )
+        self.session_repo.insert(session)
+        self.spool.create(session.id)
+
+        return CreateUploadSessionOutput.from_entity(session)
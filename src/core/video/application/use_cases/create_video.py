@@ -1,14 +1,8 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-from src.core.cast_member.application.validations.cast_members_ids_exists_in_database_validator import (
-    CastMembersIdExistsInDatabaseValidator,
-)
-from src.core.category.application.validations.categories_ids_exists_in_database_validator import (
-    CategoriesIdExistsInDatabaseValidator,
-)
-from src.core.genre.application.validations.genres_ids_exists_in_database_validator import (
-    GenresIdExistsInDatabaseValidator,
+from src.core.video.application.validations.video_relations_exists_in_database_validator import (
+    VideoRelationsExistsInDatabaseValidator,
 )
 from src.core.video.domain.video import Video
 from src.core._shared.application.use_cases import UseCase
@@ -43,19 +37,15 @@ class CreateVideoUseCase(UseCase):
     def __init__(
         self,
         video_repo: IVideoRepository,
-        categories_id_validator: CategoriesIdExistsInDatabaseValidator,
-        genres_id_validator: GenresIdExistsInDatabaseValidator,
-        cast_members_id_validator: CastMembersIdExistsInDatabaseValidator,
+        relations_validator: VideoRelationsExistsInDatabaseValidator,
     ):
         self.video_repo = video_repo
-        self.categories_id_validator = categories_id_validator
-        self.genres_id_validator = genres_id_validator
-        self.cast_members_id_validator = cast_members_id_validator
+        self.relations_validator = relations_validator
 
     def execute(self, input: CreateVideoInput) -> CreateVideoOutput:
-        self.categories_id_validator.validate(input.categories_id)
-        self.genres_id_validator.validate(input.genres_id)
-        self.cast_members_id_validator.validate(input.cast_members_id)
+        self.relations_validator.validate(
+            input.categories_id, input.genres_id, input.cast_members_id
+        )
 
         video = Video.create(input)
 
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.video.application.use_cases.common.video_output import VideoOutput
+from src.core.video.domain.video_repository import IVideoRepository
+
+
+@dataclass(slots=True)
+class ExportVideosInput:
+    chunk_size: int = 500
+
+
+class ExportVideosUseCase(UseCase):
+    def __init__(self, video_repository: IVideoRepository):
+        self.video_repository = video_repository
+
+    def execute(self, input: ExportVideosInput) -> Iterator[VideoOutput]:
+        videos = self.video_repository.stream_all(input.chunk_size)
+
+        return map(VideoOutput.from_entity, videos)
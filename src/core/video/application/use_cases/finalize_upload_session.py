@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+import datetime
+from uuid import UUID
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.video.application.upload_spool_interface import IUploadSpool
+from src.core.video.application.use_cases.common.upload_session_output import (
+    find_live_session,
+)
+from src.core.video.application.use_cases.upload_audio_video_media import (
+    UploadAudioVideoMediaInput,
+    UploadAudioVideoMediaOutput,
+    UploadAudioVideoMediaUseCase,
+)
+from src.core.video.domain.upload_session import UploadSessionConflictException
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+
+
+@dataclass
+class FinalizeUploadSessionInput:
+    video_id: UUID
+    id: UUID
+
+
+class FinalizeUploadSessionUseCase(UseCase):
+    """Stores the spooled file on the video, as a single upload would, and
+    closes the session."""
+
+    def __init__(
+        self,
+        session_repo: IUploadSessionRepository,
+        spool: IUploadSpool,
+        upload_media: UploadAudioVideoMediaUseCase,
+        timeout: datetime.timedelta,
+    ):
+        self.session_repo = session_repo
+        self.spool = spool
+        self.upload_media = upload_media
+        self.timeout = timeout
+
+    def execute(
+        self, input: FinalizeUploadSessionInput
+    ) -> UploadAudioVideoMediaOutput:
+        session = find_live_session(
+            self.session_repo, input.video_id, input.id, self.timeout
+        )
+
+        if not session.is_complete:
+            raise UploadSessionConflictException(session)
+
+        with self.spool.open(session.id) as file:
+            output = self.upload_media.execute(
+                UploadAudioVideoMediaInput(
+                    id=session.video_id,
+                    field=session.field,
+                    file_name=session.file_name,
+                    content=file,
+                    content_type=session.content_type,
+                )
+            )
+
+        self.spool.discard(session.id)
+        self.session_repo.delete(session.id)
+
+        return output
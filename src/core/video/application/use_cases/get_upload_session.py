@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+import datetime
+from uuid import UUID
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.video.application.use_cases.common.upload_session_output import (
+    UploadSessionOutput,
+    find_live_session,
+)
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+
+
+@dataclass
+class GetUploadSessionInput:
+    video_id: UUID
+    id: UUID
+
+
+@dataclass
+class GetUploadSessionOutput(UploadSessionOutput):
+    pass
+
+
+class GetUploadSessionUseCase(UseCase):
+    def __init__(
+        self, session_repo: IUploadSessionRepository, timeout: datetime.timedelta
+    ):
+        self.session_repo = session_repo
+        self.timeout = timeout
+
+    def execute(self, input: GetUploadSessionInput) -> GetUploadSessionOutput:
+        session = find_live_session(
+            self.session_repo, input.video_id, input.id, self.timeout
+        )
+
+        return GetUploadSessionOutput.from_entity(session)
@@ -5,6 +5,7 @@ from src.core._shared.application.search_input import SearchInput
 from src.core._shared.application.use_cases import UseCase
 from src.core.video.application.use_cases.common.video_output import VideoOutput
 from src.core.video.domain.video_repository import (
+    IVideoListingRepository,
     IVideoRepository,
     VideoFilter,
     VideoSearchParams,
@@ -23,12 +24,24 @@ class ListVideosOutput(PaginationOutput[VideoOutput]):
 
 
 class ListVideosUseCase(UseCase):
-    def __init__(self, video_repo: IVideoRepository):
+    """Lists videos from the aggregate repository, or, when a listing read
+    model is given, from its pre-encoded documents."""
+
+    def __init__(
+        self,
+        video_repo: IVideoRepository,
+        listing_repo: IVideoListingRepository | None = None,
+    ):
         self.video_repo = video_repo
+        self.listing_repo = listing_repo
 
     def execute(self, input: ListVideosInput) -> ListVideosOutput:
         params = VideoSearchParams(**input.to_input())
 
+        if self.listing_repo is not None:
+            listing = self.listing_repo.search(params)
+            return ListVideosOutput.from_search_result(listing.items, listing)
+
         result = self.video_repo.search(params)
 
         return self.__to_output(result)
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+import datetime
+
+from src.core._shared.application.use_cases import UseCase
+from src.core.video.application.upload_spool_interface import IUploadSpool
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+
+
+@dataclass
+class PurgeExpiredUploadSessionsInput:
+    now: datetime.datetime | None = None
+
+
+@dataclass
+class PurgeExpiredUploadSessionsOutput:
+    sessions: int
+    orphaned_files: int
+
+
+class PurgeExpiredUploadSessionsUseCase(UseCase):
+    """Deletes sessions older than ``timeout`` with their spool files, and
+    spool files left without a session (e.g. the video was deleted) that
+    nothing wrote to for as long."""
+
+    def __init__(
+        self,
+        session_repo: IUploadSessionRepository,
+        spool: IUploadSpool,
+        timeout: datetime.timedelta,
+    ):
+        self.session_repo = session_repo
+        self.spool = spool
+        self.timeout = timeout
+
+    def execute(
+        self, input: PurgeExpiredUploadSessionsInput
+    ) -> PurgeExpiredUploadSessionsOutput:
+        cutoff = (input.now or datetime.datetime.now(datetime.UTC)) - self.timeout
+
+        expired_ids = self.session_repo.delete_created_before(cutoff)
+        for session_id in expired_ids:
+            self.spool.discard(session_id)
+
+        # Live sessions were created after the cutoff, so their files were
+        # written since.
+        orphaned_files = self.spool.discard_untouched_since(cutoff)
+
+        return PurgeExpiredUploadSessionsOutput(
+            sessions=len(expired_ids), orphaned_files=orphaned_files
+        )
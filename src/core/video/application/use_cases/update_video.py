@@ -7,19 +7,13 @@ from src.core._shared.domain.exceptions import (
     EntityValidationException,
     NotFoundException,
 )
-from src.core.cast_member.application.validations.cast_members_ids_exists_in_database_validator import (
-    CastMembersIdExistsInDatabaseValidator,
-)
 from src.core.cast_member.domain.cast_member import CastMemberId
-from src.core.category.application.validations.categories_ids_exists_in_database_validator import (
-    CategoriesIdExistsInDatabaseValidator,
-)
 from src.core.category.domain.category import CategoryId
-from src.core.genre.application.validations.genres_ids_exists_in_database_validator import (
-    GenresIdExistsInDatabaseValidator,
-)
 from src.core.genre.domain.genre import GenreId
 from src.core.video.application.use_cases.common.video_output import VideoOutput
+from src.core.video.application.validations.video_relations_exists_in_database_validator import (
+    VideoRelationsExistsInDatabaseValidator,
+)
 from src.core.video.domain.audio_video_media import Rating
 from src.core.video.domain.video import Video
 from src.core.video.domain.video_repository import IVideoRepository
@@ -48,14 +42,10 @@ class UpdateVideoUseCase(UseCase):
     def __init__(
         self,
         video_repo: IVideoRepository,
-        categories_id_validator: CategoriesIdExistsInDatabaseValidator,
-        genres_id_validator: GenresIdExistsInDatabaseValidator,
-        cast_members_id_validator: CastMembersIdExistsInDatabaseValidator,
+        relations_validator: VideoRelationsExistsInDatabaseValidator,
     ):
         self.video_repo = video_repo
-        self.categories_id_validator = categories_id_validator
-        self.genres_id_validator = genres_id_validator
-        self.cast_members_id_validator = cast_members_id_validator
+        self.relations_validator = relations_validator
 
     def execute(self, input: UpdateVideoInput) -> UpdateVideoOutput:
         video = self.video_repo.find_by_id(input.id)
@@ -63,9 +53,9 @@ class UpdateVideoUseCase(UseCase):
         if video is None:
             raise NotFoundException(input.id, Video)
 
-        self.categories_id_validator.validate(input.categories_id)
-        self.genres_id_validator.validate(input.genres_id)
-        self.cast_members_id_validator.validate(input.cast_members_id)
+        self.relations_validator.validate(
+            input.categories_id, input.genres_id, input.cast_members_id
+        )
 
         if input.title is not None:
             video.change_title(input.title)
@@ -1,10 +1,13 @@
 from dataclasses import dataclass
-from typing import Literal
+from typing import BinaryIO, Literal
 from uuid import UUID
 from pathlib import Path
 
 from src.core._shared.application.application_service import ApplicationService
-from src.core._shared.application.storage_interface import IStorage
+from src.core._shared.application.storage_interface import (
+    IStorage,
+    check_file_name,
+)
 from src.core._shared.application.use_cases import UseCase
 from src.core._shared.domain.exceptions import (
     EntityValidationException,
@@ -25,7 +28,7 @@ class UploadAudioVideoMediaInput:
     id: UUID
     field: Literal["video", "trailer"]
     file_name: str
-    content: bytes
+    content: BinaryIO
     content_type: str
 
 
@@ -53,7 +56,8 @@ class UploadAudioVideoMediaUseCase(UseCase):
         if video is None:
             raise NotFoundException(input.id, Video)
 
-        file_path = Path("videos") / str(input.id) / input.file_name
+        file_name = check_file_name(input.file_name)
+        file_path = Path("videos") / str(input.id) / file_name
 
         media_type_mapping = {
             "video": (MediaType.VIDEO, video.replace_video),
@@ -75,7 +79,7 @@ class UploadAudioVideoMediaUseCase(UseCase):
 
         replace_function(media)
 
-        self.storage.store(
+        self.storage.store_stream(
             file_path,
             input.content,
             input.content_type,
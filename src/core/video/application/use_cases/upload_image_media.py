@@ -4,7 +4,10 @@ from uuid import UUID
 from pathlib import Path
 
 from src.core.video.domain.audio_video_media import ImageMedia
-from src.core._shared.application.storage_interface import IStorage
+from src.core._shared.application.storage_interface import (
+    IStorage,
+    check_file_name,
+)
 from src.core._shared.domain.exceptions import (
     EntityValidationException,
     NotFoundException,
@@ -55,7 +58,8 @@ class UploadImageMediaUseCase(UseCase):
         if replace_method is None:
             raise EntityValidationException(f"Invalid field value: {input.field}")
 
-        file_path = Path("images") / str(input.id) / input.file_name
+        file_name = check_file_name(input.file_name)
+        file_path = Path("images") / str(input.id) / file_name
 
         image_media = ImageMedia(
             name=input.file_name,
@@ -0,0 +1,71 @@
+from typing import Any, Dict, Set
+
+from src.core._shared.domain.exceptions import (
+    InvalidArgumentException,
+    NotFoundException,
+)
+from src.core._shared.domain.repositories.relations_lookup_interface import (
+    IRelationsLookup,
+)
+from src.core.cast_member.domain.cast_member import CastMember, CastMemberId
+from src.core.category.domain.category import Category, CategoryId
+from src.core.genre.domain.genre import Genre, GenreId
+
+# Checked, and reported, in this order.
+RELATIONS = [
+    ("categories_id", Category),
+    ("genres_id", Genre),
+    ("cast_members_id", CastMember),
+]
+
+
+class VideoRelationsExistsInDatabaseValidator:
+    """Checks the categories, genres and cast members of a video with one
+    lookup, instead of one ``exists_by_id`` per relation."""
+
+    def __init__(self, relations_lookup: IRelationsLookup):
+        self.relations_lookup = relations_lookup
+
+    def validate(
+        self,
+        categories_id: Set[CategoryId],
+        genres_id: Set[GenreId],
+        cast_members_id: Set[CastMemberId],
+    ) -> None:
+        requested = {
+            "categories_id": categories_id,
+            "genres_id": genres_id,
+            "cast_members_id": cast_members_id,
+        }
+        missing = self.find_missing(**requested)
+
+        for attribute, entity in RELATIONS:
+            if not requested[attribute]:
+                raise InvalidArgumentException(
+                    "ids must be an array with at least one element"
+                )
+
+            not_found = [
+                _id for _id in requested[attribute] if _id in missing[attribute]
+            ]
+            if not_found:
+                raise NotFoundException(
+                    ", ".join(str(_id) for _id in not_found), entity
+                )
+
+    def find_missing(
+        self,
+        categories_id: Set[CategoryId],
+        genres_id: Set[GenreId],
+        cast_members_id: Set[CastMemberId],
+    ) -> Dict[str, Set[Any]]:
+        requested = {
+            "categories_id": categories_id,
+            "genres_id": genres_id,
+            "cast_members_id": cast_members_id,
+        }
+        missing = self.relations_lookup.find_missing(
+            {entity: set(requested[attribute] or ()) for attribute, entity in RELATIONS}
+        )
+
+        return {attribute: missing[entity] for attribute, entity in RELATIONS}
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+import datetime
+from typing import Literal
+from uuid import UUID, uuid4
+
+
+@dataclass(slots=True, kw_only=True)
+class UploadSession:
+    """A resumable upload of a video or trailer file: ``offset`` of its
+    ``length`` bytes have been spooled so far."""
+
+    id: UUID = field(default_factory=uuid4)
+    video_id: UUID
+    field: Literal["video", "trailer"]
+    file_name: str
+    content_type: str = ""
+    length: int
+    offset: int = 0
+    created_at: datetime.datetime = field(
+        default_factory=lambda: datetime.datetime.now(datetime.UTC)
+    )
+
+    @property
+    def is_complete(self) -> bool:
+        return self.offset == self.length
+
+    def is_expired(
+        self, timeout: datetime.timedelta, now: datetime.datetime | None = None
+    ) -> bool:
+        now = now or datetime.datetime.now(datetime.UTC)
+        return self.created_at + timeout <= now
+
+
+class UploadSessionConflictException(Exception):
+    """The session is not at the offset the request was made for, or is
+    finalized before every byte arrived."""
+
+    def __init__(self, session: UploadSession):
+        self.session = session
+        super().__init__(
+            f"Upload session {session.id} is at offset {session.offset} "
+            f"of {session.length}"
+        )
+
+
+class UploadTooLargeException(Exception):
+    def __init__(self, session: UploadSession):
+        self.session = session
+        super().__init__(f"Chunk goes past the upload length of {session.length}")
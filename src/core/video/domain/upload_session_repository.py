@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+import datetime
+from typing import List
+from uuid import UUID
+
+from src.core.video.domain.upload_session import UploadSession
+
+
+class IUploadSessionRepository(ABC):
+    @abstractmethod
+    def insert(self, session: UploadSession) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_by_id(self, video_id: UUID, session_id: UUID) -> UploadSession | None:
+        """The session, if it exists and belongs to ``video_id``."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def advance(self, session: UploadSession, offset: int) -> bool:
+        """Move ``session`` to ``offset``, unless another request moved it
+        since it was read; returns whether it did."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete(self, session_id: UUID) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def delete_created_before(self, moment: datetime.datetime) -> List[UUID]:
+        """Delete the sessions created before ``moment``; returns their ids."""
+        raise NotImplementedError()
@@ -1,6 +1,6 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Any, Dict, Set
 
 from src.core._shared.domain.repositories.repository_interface import ISearchableRepository
 from src.core._shared.domain.repositories.search_params import SearchParams
@@ -29,3 +29,16 @@ class VideoSearchResult(SearchResult[Video]):
 
 class IVideoRepository(ISearchableRepository[Video, VideoId], ABC):
     pass
+
+
+class VideoListingSearchResult(SearchResult[Dict[str, Any]]):
+    pass
+
+
+class IVideoListingRepository(ABC):
+    """Read model holding the list representation of every video, already
+    encoded, so a page is served without loading aggregates."""
+
+    @abstractmethod
+    def search(self, props: VideoSearchParams) -> VideoListingSearchResult:
+        raise NotImplementedError()
@@ -0,0 +1,52 @@
+from dataclasses import dataclass, field, replace
+import datetime
+import threading
+from typing import Dict, List
+from uuid import UUID
+
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+
+
+@dataclass(slots=True)
+class UploadSessionInMemoryRepository(IUploadSessionRepository):
+    """Sessions in a dict keyed by id. Callers get copies, as they would
+    rows read from a database, and ``advance`` compares and sets under a
+    lock."""
+
+    _sessions: Dict[UUID, UploadSession] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def insert(self, session: UploadSession) -> None:
+        self._sessions[session.id] = replace(session)
+
+    def find_by_id(self, video_id: UUID, session_id: UUID) -> UploadSession | None:
+        session = self._sessions.get(session_id)
+        if session is None or session.video_id != video_id:
+            return None
+        return replace(session)
+
+    def advance(self, session: UploadSession, offset: int) -> bool:
+        with self._lock:
+            stored = self._sessions.get(session.id)
+            if stored is None or stored.offset != session.offset:
+                return False
+            stored.offset = offset
+            return True
+
+    def delete(self, session_id: UUID) -> None:
+        self._sessions.pop(session_id, None)
+
+    def delete_created_before(self, moment: datetime.datetime) -> List[UUID]:
+        expired_ids = [
+            session.id
+            for session in self._sessions.values()
+            if session.created_at < moment
+        ]
+        for session_id in expired_ids:
+            del self._sessions[session_id]
+        return expired_ids
@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+import pytest
+
+from src.core._shared.application.bulk_create import BulkCreateInput
+from src.core._shared.domain.exceptions import InvalidArgumentException
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.core.video.application.use_cases.bulk_create_videos import (
+    BulkCreateVideosUseCase,
+)
+from src.core.video.application.use_cases.create_video import CreateVideoInput
+from src.core.video.application.validations.video_relations_exists_in_database_validator import (
+    VideoRelationsExistsInDatabaseValidator,
+)
+from src.core.video.domain.audio_video_media import Rating
+from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.container import container
+from src.django_project.genre_app.repository import GenreDjangoRepository
+from src.django_project.shared_app.unit_of_work import UnitOfWork
+from src.django_project.video_app.repository import VideoDjangoRepository
+
+
+@pytest.mark.django_db
+class TestBulkCreateVideosUseCaseInt:
+    def setup_method(self) -> None:
+        self.category = Category(name="Movie")
+        CategoryDjangoRepository().insert(self.category)
+
+        self.genre = Genre(name="Drama", categories_id={self.category.id})
+        GenreDjangoRepository().insert(self.genre)
+
+        self.cast_member = CastMember(name="John Doe", type=CastMemberType.ACTOR)
+        CastMemberDjangoRepository().insert(self.cast_member)
+
+        self.video_repo = VideoDjangoRepository()
+        self.validator = container.resolve(VideoRelationsExistsInDatabaseValidator)
+        self.use_case = BulkCreateVideosUseCase(
+            self.video_repo, self.validator, UnitOfWork()
+        )
+
+    def make_input(self, **relations) -> CreateVideoInput:
+        return CreateVideoInput(
+            title="Video",
+            description="Some description",
+            launch_year=2024,
+            duration=Decimal("90.00"),
+            opened=False,
+            rating=Rating.L,
+            **{
+                "categories_id": {self.category.id},
+                "genres_id": {self.genre.id},
+                "cast_members_id": {self.cast_member.id},
+                **relations,
+            },
+        )
+
+    @pytest.mark.parametrize(
+        "relations",
+        [
+            {"categories_id": set()},
+            {"genres_id": set()},
+            {"cast_members_id": set()},
+            {"categories_id": set(), "genres_id": set(), "cast_members_id": set()},
+        ],
+    )
+    def test_items_without_relations_fail_as_a_single_create_would(self, relations):
+        item = self.make_input(**relations)
+
+        output = self.use_case.execute(
+            BulkCreateInput(items=[self.make_input(), item])
+        )
+
+        with pytest.raises(InvalidArgumentException) as single:
+            self.validator.validate(
+                categories_id=item.categories_id,
+                genres_id=item.genres_id,
+                cast_members_id=item.cast_members_id,
+            )
+
+        assert output.items[0].error is None
+        assert isinstance(output.items[1].error, InvalidArgumentException)
+        assert str(output.items[1].error) == str(single.value)
+        assert len(self.video_repo.find_all()) == 1
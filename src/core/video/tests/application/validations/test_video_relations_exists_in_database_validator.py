@@ -0,0 +1,88 @@
+import uuid
+
+import pytest
+
+from src.core._shared.domain.exceptions import (
+    InvalidArgumentException,
+    NotFoundException,
+)
+from src.core._shared.infra.db.in_memory.in_memory_relations_lookup import (
+    InMemoryRelationsLookup,
+)
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.cast_member.infra.cast_member_in_memory_repository import (
+    CastMemberInMemoryRepository,
+)
+from src.core.category.domain.category import Category
+from src.core.category.infra.category_in_memory_repository import (
+    CategoryInMemoryRepository,
+)
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.genre_in_memory_repository import GenreInMemoryRepository
+from src.core.video.application.validations.video_relations_exists_in_database_validator import (
+    VideoRelationsExistsInDatabaseValidator,
+)
+
+
+class TestVideoRelationsExistsInDatabaseValidator:
+    def setup_method(self):
+        self.category = Category(name="Movie")
+        self.genre = Genre(name="Drama", categories_id={self.category.id})
+        self.cast_member = CastMember(name="John", type=CastMemberType.ACTOR)
+
+        category_repo = CategoryInMemoryRepository()
+        category_repo.insert(self.category)
+        genre_repo = GenreInMemoryRepository()
+        genre_repo.insert(self.genre)
+        cast_member_repo = CastMemberInMemoryRepository()
+        cast_member_repo.insert(self.cast_member)
+
+        self.validator = VideoRelationsExistsInDatabaseValidator(
+            InMemoryRelationsLookup(
+                {
+                    Category: category_repo,
+                    Genre: genre_repo,
+                    CastMember: cast_member_repo,
+                }
+            )
+        )
+
+    def test_accepts_existing_ids(self):
+        self.validator.validate(
+            {self.category.id.value},
+            {self.genre.id.value},
+            {self.cast_member.id.value},
+        )
+
+    def test_reports_the_first_relation_with_missing_ids(self):
+        missing_genre = uuid.uuid4()
+        missing_cast_member = uuid.uuid4()
+
+        with pytest.raises(NotFoundException) as error:
+            self.validator.validate(
+                {self.category.id.value},
+                {self.genre.id.value, missing_genre},
+                {missing_cast_member},
+            )
+
+        assert str(error.value) == f"Genre with id {missing_genre} not found"
+
+    def test_rejects_an_empty_relation(self):
+        with pytest.raises(InvalidArgumentException):
+            self.validator.validate(
+                {self.category.id.value}, set(), {self.cast_member.id.value}
+            )
+
+    def test_find_missing_returns_unknown_ids_per_relation(self):
+        missing_category = uuid.uuid4()
+
+        assert self.validator.find_missing(
+            categories_id={self.category.id.value, missing_category},
+            genres_id=set(),
+            cast_members_id={self.cast_member.id.value},
+        ) == {
+            "categories_id": {missing_category},
+            "genres_id": set(),
+            "cast_members_id": set(),
+        }
@@ -0,0 +1,29 @@
+# Generated by Django 5.1 on 2026-10-18 17:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cast_member_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='castmembermodel',
+            index=models.Index(fields=['created_at', 'id'], name='cast_member_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='castmembermodel',
+            index=models.Index(fields=['name', 'id'], name='cast_member_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='castmembermodel',
+            index=models.Index(fields=['type', 'created_at', 'id'], name='cast_member_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='castmembermodel',
+            index=models.Index(fields=['type', 'name', 'id'], name='cast_member_type_name_idx'),
+        ),
+    ]
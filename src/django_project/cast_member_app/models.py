@@ -16,6 +16,14 @@ class CastMemberModel(models.Model):
 
     class Meta:
         db_table = "cast_member"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="cast_member_created_idx"),
+            models.Index(fields=["name", "id"], name="cast_member_name_idx"),
+            models.Index(
+                fields=["type", "created_at", "id"], name="cast_member_type_created_idx"
+            ),
+            models.Index(fields=["type", "name", "id"], name="cast_member_type_name_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -44,18 +44,8 @@ class CastMemberPresenter(ResourcePresenter):
 class CastMemberCollectionPresenter(CollectionPresenter):
     output: ListCastMembersOutput
 
+    item_presenter = CastMemberPresenter
+
     def __post_init__(self):
-        self.data = [
-            CastMemberPresenter(
-                id=item.id,
-                name=item.name,
-                type=(
-                    CastMemberType(item.type)
-                    if isinstance(item.type, str)
-                    else item.type
-                ),
-                created_at=item.created_at,
-            )
-            for item in self.output.items
-        ]
+        self.data = self.output.items
         self.pagination = self.output
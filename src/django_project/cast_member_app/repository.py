@@ -1,5 +1,6 @@
-from typing import Dict, List, Set
-from django.core.paginator import Paginator
+from typing import Dict, Iterator, List, Set
+
+from django.db.models import Q
 
 from src.core._shared.domain.repositories.search_params import SortDirection
 from src.core._shared.domain.exceptions import (
@@ -7,6 +8,7 @@ from src.core._shared.domain.exceptions import (
     NotFoundException,
 )
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberId
+from src.core.cast_member.domain.cast_member_type import CastMemberType
 from src.core.cast_member.domain.cast_member_repository import (
     ICastMemberRepository,
     CastMemberSearchParams,
@@ -14,10 +16,21 @@ from src.core.cast_member.domain.cast_member_repository import (
 )
 from src.django_project.cast_member_app.mappers import CastMemberModelMapper
 from src.django_project.cast_member_app.models import CastMemberModel
+from src.django_project.shared_app.count_cache import CountCache
+from src.django_project.shared_app.known_ids import KnownIds
+from src.django_project.shared_app.pagination import (
+    ordering_for,
+    paginate_by_cursor,
+    paginate_by_page,
+)
 
 
 class CastMemberDjangoRepository(ICastMemberRepository):
     sortable_fields: List[str] = ["name", "created_at"]
+    count_cache = CountCache(
+        "cast_members", dependents=("videos", "video_listing")
+    )
+    known_ids = KnownIds(CastMemberModel)
 
     def __init__(self, cast_member_model: CastMemberModel = CastMemberModel):
         self.cast_member_model = cast_member_model
@@ -26,11 +39,16 @@ class CastMemberDjangoRepository(ICastMemberRepository):
         model = CastMemberModelMapper.to_model(entity)
         model.save()
 
+        self.count_cache.invalidate()
+
     def bulk_insert(self, entities: List[CastMember]) -> None:
         self.cast_member_model.objects.bulk_create(
             list(map(CastMemberModelMapper.to_model, entities))
         )
 
+        self.known_ids.added()
+        self.count_cache.invalidate()
+
     def find_by_id(self, entity_id: CastMemberId) -> CastMember | None:
         model = self.cast_member_model.objects.filter(id=entity_id).first()
         return CastMemberModelMapper.to_entity(model) if model else None
@@ -49,18 +67,24 @@ class CastMemberDjangoRepository(ICastMemberRepository):
                 "ids must be an array with at least one element"
             )
 
-        exists_cast_member_models = CastMemberModel.objects.filter(
-            id__in=entity_ids
-        ).values_list("id", flat=True)
+        known_ids, lookup_ids = self.known_ids.resolve(entity_ids)
 
-        exists_castmember_ids = list(exists_cast_member_models)
+        exists_castmember_ids = set(known_ids)
+        if lookup_ids:
+            found_ids = set(
+                CastMemberModel.objects.filter(id__in=lookup_ids).values_list(
+                    "id", flat=True
+                )
+            )
+            self.known_ids.remember(found_ids)
+            exists_castmember_ids |= found_ids
 
         not_exists_cast_member_ids = [
             id for id in entity_ids if id not in exists_castmember_ids
         ]
 
         return {
-            "exists": exists_castmember_ids,
+            "exists": list(exists_castmember_ids),
             "not_exists": not_exists_cast_member_ids,
         }
 
@@ -68,6 +92,12 @@ class CastMemberDjangoRepository(ICastMemberRepository):
         models = self.cast_member_model.objects.all()
         return [CastMemberModelMapper.to_entity(model) for model in models]
 
+    def stream_all(self, chunk_size: int = 500) -> Iterator[CastMember]:
+        query = self.cast_member_model.objects.order_by("created_at", "id")
+
+        for model in query.iterator(chunk_size=chunk_size):
+            yield CastMemberModelMapper.to_entity(model)
+
     def update(self, entity: CastMember) -> None:
         model = CastMemberModelMapper.to_model(entity)
 
@@ -81,9 +111,13 @@ class CastMemberDjangoRepository(ICastMemberRepository):
         if affected_rows == -1:
             raise NotFoundException(entity.id.value, self.get_entity())
 
+        self.count_cache.invalidate()
+
     def delete(self, entity_id: CastMemberId) -> None:
         self.cast_member_model.objects.filter(id=entity_id).delete()
 
+        self.count_cache.invalidate()
+
     def search(self, props: CastMemberSearchParams) -> CastMemberSearchResult:
         query = self.cast_member_model.objects.all()
 
@@ -92,31 +126,47 @@ class CastMemberDjangoRepository(ICastMemberRepository):
                 query = query.filter(name__icontains=props.filter.name)
 
             if props.filter.type:
-                query = query.filter(type__icontains=props.filter.type)
+                query = query.filter(self._type_condition(props.filter.type))
 
         if props.sort and props.sort in self.sortable_fields:
-            if props.sort_dir == SortDirection.DESC:
-                props.sort = f"-{props.sort}"
-            query = query.order_by(props.sort)
+            sort, sort_dir = props.sort, props.sort_dir
         else:
-            query = query.order_by("-created_at")
+            sort, sort_dir = "created_at", SortDirection.DESC
 
-        paginator = Paginator(query, props.per_page)
+        if props.is_cursor_mode:
+            page, next_cursor = paginate_by_cursor(
+                query, sort, sort_dir, props.cursor, props.per_page
+            )
 
-        if props.page <= paginator.num_pages:
-            page_obj = paginator.page(props.page)
-        else:
-            page_obj = paginator.page(paginator.num_pages)
-            page_obj.object_list = []
+            return CastMemberSearchResult(
+                items=[CastMemberModelMapper.to_entity(model) for model in page],
+                total=self.count_cache.count(query, props),
+                current_page=props.page,
+                per_page=props.per_page,
+                cursor=props.cursor,
+                next_cursor=next_cursor,
+                count=props.count,
+            )
+
+        query = query.order_by(*ordering_for(sort, sort_dir))
+
+        page = paginate_by_page(query, props.page, props.per_page)
 
         return CastMemberSearchResult(
-            items=[
-                CastMemberModelMapper.to_entity(model) for model in page_obj.object_list
-            ],
-            total=paginator.count,
+            items=[CastMemberModelMapper.to_entity(model) for model in page],
+            total=self.count_cache.count(query, props),
             current_page=props.page,
             per_page=props.per_page,
+            count=props.count,
         )
 
+    def _type_condition(self, value: str) -> Q:
+        """Exact match on a known type, so the (type, ...) indexes apply;
+        anything else keeps the old substring match."""
+        try:
+            return Q(type=CastMemberType(str(value).upper()).name)
+        except ValueError:
+            return Q(type__icontains=value)
+
     def get_entity(self) -> CastMember:
         return CastMember
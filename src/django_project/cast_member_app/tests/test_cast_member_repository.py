@@ -1,6 +1,10 @@
 import pytest
 
 from src.core.cast_member.domain.cast_member import CastMember, CastMemberType
+from src.core.cast_member.domain.cast_member_repository import (
+    CastMemberFilter,
+    CastMemberSearchParams,
+)
 from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
 
 
@@ -81,3 +85,18 @@ class TestCastMemberRepositoryInt:
         self.cast_member_repository.delete(cast_member.id.value)
 
         assert self.cast_member_repository.find_by_id(cast_member.id.value) is None
+
+    def test_should_be_able_filter_cast_members_by_type(self):
+        actor = CastMember(name="John Doe", type=CastMemberType.ACTOR)
+        director = CastMember(name="Jane Doe", type=CastMemberType.DIRECTOR)
+        self.cast_member_repository.bulk_insert([actor, director])
+
+        def search(type: str) -> list[str]:
+            result = self.cast_member_repository.search(
+                CastMemberSearchParams(init_filter=CastMemberFilter(type=type))
+            )
+            return [item.name for item in result.items]
+
+        assert search(CastMemberType.ACTOR) == ["John Doe"]
+        assert search("director") == ["Jane Doe"]
+        assert search("dir") == ["Jane Doe"]
@@ -1,7 +1,10 @@
 from typing import Dict
 from uuid import UUID
 from django.shortcuts import render
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -19,6 +22,10 @@ from src.django_project.cast_member_app.presenters import (
 )
 from src.core.cast_member.domain.cast_member_repository import CastMemberFilter
 
+from src.core.cast_member.application.use_cases.export_cast_members import (
+    ExportCastMembersInput,
+    ExportCastMembersUseCase,
+)
 from src.core.cast_member.application.use_cases.delete_cast_member import (
     DeleteCastMemberInput,
     DeleteCastMemberUseCase,
@@ -36,11 +43,16 @@ from src.core.cast_member.application.use_cases.list_cast_members import (
     ListCastMembersUseCase,
 )
 
+from src.core.cast_member.application.use_cases.bulk_create_cast_members import (
+    BulkCreateCastMembersUseCase,
+)
 from src.core.cast_member.application.use_cases.create_cast_member import (
     CreateCastMemberInput,
     CreateCastMemberUseCase,
 )
-from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
+from src.django_project.container import container
+from src.django_project.shared_app.bulk import bulk_create_response
+from src.django_project.shared_app.streaming import ndjson_response
 from src.django_project.cast_member_app.serializers import (
     CreateCastMemberInputSerializer,
     DeleteCastMemberInputSerializer,
@@ -52,13 +64,13 @@ from src.django_project.shared_app.filter_extractor import FilterExtractor
 
 class CastMemberViewSet(viewsets.ViewSet, FilterExtractor):
     def __init__(self, **kwargs):
-        repository = CastMemberDjangoRepository()
-
-        self.create_use_case = CreateCastMemberUseCase(repository)
-        self.list_use_case = ListCastMembersUseCase(repository)
-        self.get_use_case = GetCastMemberUseCase(repository)
-        self.update_use_case = UpdateCastMemberUseCase(repository)
-        self.delete_use_case = DeleteCastMemberUseCase(repository)
+        self.create_use_case = container.resolve(CreateCastMemberUseCase)
+        self.list_use_case = container.resolve(ListCastMembersUseCase)
+        self.get_use_case = container.resolve(GetCastMemberUseCase)
+        self.update_use_case = container.resolve(UpdateCastMemberUseCase)
+        self.delete_use_case = container.resolve(DeleteCastMemberUseCase)
+        self.export_use_case = container.resolve(ExportCastMembersUseCase)
+        self.bulk_create_use_case = container.resolve(BulkCreateCastMembersUseCase)
 
     def create(self, request: Request) -> Response:
         serializer = CreateCastMemberInputSerializer(data=request.data)
@@ -124,6 +136,24 @@ class CastMemberViewSet(viewsets.ViewSet, FilterExtractor):
             data=CastMemberViewSet.serialize(output),
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        return bulk_create_response(
+            self,
+            request,
+            serializer_class=CreateCastMemberInputSerializer,
+            input_class=CreateCastMemberInput,
+            use_case=self.bulk_create_use_case,
+            serialize=CastMemberViewSet.serialize,
+        )
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request: Request) -> StreamingHttpResponse:
+        input = ExportCastMembersInput(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        output = self.export_use_case.execute(input)
+
+        return ndjson_response(output, CastMemberPresenter)
+
     def destroy(self, request: Request, pk: UUID = None):
         serializer = DeleteCastMemberInputSerializer(data={"id": pk})
         serializer.is_valid(raise_exception=True)
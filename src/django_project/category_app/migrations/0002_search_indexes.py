@@ -0,0 +1,21 @@
+# Generated by Django 5.1 on 2026-10-18 17:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='categorymodel',
+            index=models.Index(fields=['created_at', 'id'], name='categories_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categorymodel',
+            index=models.Index(fields=['name', 'id'], name='categories_name_idx'),
+        ),
+    ]
@@ -13,6 +13,10 @@ class CategoryModel(models.Model):
     class Meta:
         db_table = "categories"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="categories_created_idx"),
+            models.Index(fields=["name", "id"], name="categories_name_idx"),
+        ]
 
     def __str__(self):
         return self.name
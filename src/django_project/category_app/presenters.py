@@ -38,15 +38,8 @@ class CategoryPresenter(ResourcePresenter):
 class CategoryCollectionPresenter(CollectionPresenter):
     output: ListCategoriesOutput
 
+    item_presenter = CategoryPresenter
+
     def __post_init__(self):
-        self.data = [
-            CategoryPresenter(
-                id=item.id,
-                name=item.name,
-                description=item.description,
-                is_active=item.is_active,
-                created_at=item.created_at,
-            )
-            for item in self.output.items
-        ]
+        self.data = self.output.items
         self.pagination = self.output
@@ -1,5 +1,4 @@
-from typing import Dict, List, Set
-from django.core.paginator import Paginator
+from typing import Dict, Iterator, List, Set
 
 from src.core._shared.domain.repositories.search_params import SortDirection
 from src.core._shared.domain.exceptions import (
@@ -14,20 +13,36 @@ from src.core.category.domain.category_repository import (
     ICategoryRepository,
 )
 from src.django_project.category_app.models import CategoryModel
+from src.django_project.shared_app.count_cache import CountCache
+from src.django_project.shared_app.known_ids import KnownIds
+from src.django_project.shared_app.pagination import (
+    ordering_for,
+    paginate_by_cursor,
+    paginate_by_page,
+)
 
 
 class CategoryDjangoRepository(ICategoryRepository):
     sortable_fields: List[str] = ["name", "created_at"]
+    count_cache = CountCache(
+        "categories", dependents=("genres", "videos", "video_listing")
+    )
+    known_ids = KnownIds(CategoryModel)
 
     def insert(self, category: Category) -> None:
         model = CategoryModelMapper.to_model(category)
         model.save()
 
+        self.count_cache.invalidate()
+
     def bulk_insert(self, entities: List[Category]) -> None:
         CategoryModel.objects.bulk_create(
             list(map(CategoryModelMapper.to_model, entities))
         )
 
+        self.known_ids.added()
+        self.count_cache.invalidate()
+
     def find_by_id(self, entity_id: CategoryId) -> Category | None:
         model = CategoryModel.objects.filter(id=entity_id).first()
         return CategoryModelMapper.to_entity(model) if model else None
@@ -42,24 +57,36 @@ class CategoryDjangoRepository(ICategoryRepository):
         models = CategoryModel.objects.all()
         return [CategoryModelMapper.to_entity(model) for model in models]
 
+    def stream_all(self, chunk_size: int = 500) -> Iterator[Category]:
+        query = CategoryModel.objects.order_by("created_at", "id")
+
+        for model in query.iterator(chunk_size=chunk_size):
+            yield CategoryModelMapper.to_entity(model)
+
     def exists_by_id(self, entity_ids: List[CategoryId]) -> Dict[str, List[CategoryId]]:
         if not entity_ids:
             raise InvalidArgumentException(
                 "ids must be an array with at least one element"
             )
 
-        exists_category_models = CategoryModel.objects.filter(
-            id__in=entity_ids
-        ).values_list("id", flat=True)
+        known_ids, lookup_ids = self.known_ids.resolve(entity_ids)
 
-        exists_category_ids = list(exists_category_models)
+        exists_category_ids = set(known_ids)
+        if lookup_ids:
+            found_ids = set(
+                CategoryModel.objects.filter(id__in=lookup_ids).values_list(
+                    "id", flat=True
+                )
+            )
+            self.known_ids.remember(found_ids)
+            exists_category_ids |= found_ids
 
         not_exists_category_ids = [
             id for id in entity_ids if id not in exists_category_ids
         ]
 
         return {
-            "exists": exists_category_ids,
+            "exists": list(exists_category_ids),
             "not_exists": not_exists_category_ids,
         }
 
@@ -74,9 +101,13 @@ class CategoryDjangoRepository(ICategoryRepository):
         if not model:
             raise NotFoundException(entity.id.value, self.get_entity())
 
+        self.count_cache.invalidate()
+
     def delete(self, entity_id: CategoryId) -> None:
         CategoryModel.objects.filter(id=entity_id).delete()
 
+        self.count_cache.invalidate()
+
     def search(self, props: CategorySearchParams) -> CategorySearchResult:
         query = CategoryModel.objects.all()
 
@@ -84,27 +115,35 @@ class CategoryDjangoRepository(ICategoryRepository):
             query = query.filter(name__icontains=props.filter)
 
         if props.sort and props.sort in self.sortable_fields:
-            if props.sort_dir == SortDirection.DESC:
-                props.sort = f"-{props.sort}"
-            query = query.order_by(props.sort)
+            sort, sort_dir = props.sort, props.sort_dir
         else:
-            query = query.order_by("-created_at")
+            sort, sort_dir = "created_at", SortDirection.DESC
 
-        paginator = Paginator(query, props.per_page)
+        if props.is_cursor_mode:
+            page, next_cursor = paginate_by_cursor(
+                query, sort, sort_dir, props.cursor, props.per_page
+            )
 
-        if props.page <= paginator.num_pages:
-            page_obj = paginator.page(props.page)
-        else:
-            page_obj = paginator.page(paginator.num_pages)
-            page_obj.object_list = []
+            return CategorySearchResult(
+                items=[CategoryModelMapper.to_entity(model) for model in page],
+                total=self.count_cache.count(query, props),
+                current_page=props.page,
+                per_page=props.per_page,
+                cursor=props.cursor,
+                next_cursor=next_cursor,
+                count=props.count,
+            )
+
+        query = query.order_by(*ordering_for(sort, sort_dir))
+
+        page = paginate_by_page(query, props.page, props.per_page)
 
         return CategorySearchResult(
-            items=[
-                CategoryModelMapper.to_entity(model) for model in page_obj.object_list
-            ],
-            total=paginator.count,
+            items=[CategoryModelMapper.to_entity(model) for model in page],
+            total=self.count_cache.count(query, props),
             current_page=props.page,
             per_page=props.per_page,
+            count=props.count,
         )
 
     def get_entity(self) -> Category:
@@ -1,7 +1,15 @@
 import datetime
 import pytest
-from src.core._shared.domain.exceptions import NotFoundException
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.core._shared.domain.exceptions import (
+    InvalidArgumentException,
+    NotFoundException,
+)
+from src.core._shared.domain.repositories.search_params import CountMode
 from src.core.category.domain.category import Category, CategoryId
+from src.core.category.domain.category_repository import CategorySearchParams
 from src.django_project.category_app.models import CategoryModel
 from src.django_project.category_app.repository import CategoryDjangoRepository
 
@@ -138,3 +146,121 @@ class TestCategoryDjangoRepository:
         self.repo.delete(category.id.value)
 
         assert CategoryModel.objects.filter(pk=category.id.value).count() == 0
+
+    def test_search_with_cursor_walks_every_page_once(self):
+        now = datetime.datetime.now(datetime.UTC)
+        categories = [
+            Category(name=f"Category {i}", created_at=now - datetime.timedelta(i))
+            for i in range(5)
+        ]
+        self.repo.bulk_insert(categories)
+
+        first = self.repo.search(CategorySearchParams(init_per_page=2, init_cursor=""))
+        second = self.repo.search(
+            CategorySearchParams(init_per_page=2, init_cursor=first.next_cursor)
+        )
+        third = self.repo.search(
+            CategorySearchParams(init_per_page=2, init_cursor=second.next_cursor)
+        )
+
+        assert [c.id for c in first.items] == [c.id for c in categories[0:2]]
+        assert [c.id for c in second.items] == [c.id for c in categories[2:4]]
+        assert [c.id for c in third.items] == [categories[4].id]
+        assert third.next_cursor is None
+        assert first.total == 5
+
+    def test_search_with_cursor_ties_are_broken_by_id(self):
+        created_at = datetime.datetime.now(datetime.UTC)
+        categories = [Category(name="Same", created_at=created_at) for _ in range(3)]
+        self.repo.bulk_insert(categories)
+
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            result = self.repo.search(
+                CategorySearchParams(
+                    init_per_page=1,
+                    init_sort="name",
+                    init_sort_dir="asc",
+                    init_cursor=cursor,
+                )
+            )
+            seen.extend(category.id.value for category in result.items)
+            cursor = result.next_cursor
+
+        assert seen == sorted(category.id.value for category in categories)
+
+    def test_search_with_cursor_issued_for_another_sort(self):
+        self.repo.bulk_insert([Category(name="A"), Category(name="B")])
+        result = self.repo.search(CategorySearchParams(init_per_page=1, init_cursor=""))
+
+        with pytest.raises(InvalidArgumentException):
+            self.repo.search(
+                CategorySearchParams(
+                    init_per_page=1, init_sort="name", init_cursor=result.next_cursor
+                )
+            )
+
+    @pytest.mark.usefixtures("shared_cache")
+    def test_search_reuses_cached_total_until_next_write(self):
+        self.repo.bulk_insert([Category(name="Movie"), Category(name="Series")])
+        params = CategorySearchParams(init_filter="movie")
+
+        assert self.repo.search(params).total == 1
+
+        with CaptureQueriesContext(connection) as queries:
+            result = self.repo.search(params)
+
+        assert result.total == 1
+        assert len(queries) == 1
+
+        self.repo.insert(Category(name="Movie 2"))
+
+        assert self.repo.search(params).total == 2
+
+    def test_search_counts_every_time_on_a_process_local_cache(self):
+        self.repo.bulk_insert([Category(name="Movie"), Category(name="Series")])
+        params = CategorySearchParams(init_filter="movie")
+        self.repo.search(params)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert self.repo.search(params).total == 1
+
+        assert len(queries) == 2
+
+    def test_search_without_count(self):
+        self.repo.bulk_insert([Category(name="Movie"), Category(name="Series")])
+
+        with CaptureQueriesContext(connection) as queries:
+            result = self.repo.search(
+                CategorySearchParams(init_per_page=1, init_count="none")
+            )
+
+        assert len(result.items) == 1
+        assert result.total is None
+        assert result.last_page is None
+        assert result.count == CountMode.NONE
+        assert not any("COUNT(" in query["sql"] for query in queries)
+
+    def test_search_with_estimated_count(self):
+        self.repo.bulk_insert([Category(name="Movie"), Category(name="Series")])
+
+        result = self.repo.search(CategorySearchParams(init_count="estimated"))
+
+        assert result.total == 2
+        assert result.last_page == 1
+        assert result.count == CountMode.ESTIMATED
+
+    def test_stream_all_in_chunks(self):
+        now = datetime.datetime.now(datetime.UTC)
+        categories = [
+            Category(name=f"Category {i}", created_at=now + datetime.timedelta(i))
+            for i in range(5)
+        ]
+        self.repo.bulk_insert(categories)
+
+        with CaptureQueriesContext(connection) as queries:
+            streamed = list(self.repo.stream_all(chunk_size=2))
+
+        assert [c.id for c in streamed] == [c.id for c in categories]
+        assert len(queries) == 1
@@ -1,9 +1,11 @@
+import json
 import uuid
 from uuid import uuid4
 
 from django.test import TestCase
 import pytest
 from rest_framework import status
+from src.core._shared.domain.repositories.cursor import Cursor
 from src.django_project.category_app.repository import CategoryDjangoRepository
 from src.core.category.domain.category import Category
 
@@ -115,6 +117,77 @@ class TestLisCategoriestAPI(TestCase):
         assert response.status_code == status.HTTP_200_OK
         assert response.data == expected_data
 
+    def test_list_categories_with_cursor(self) -> None:
+        other = Category(name="Series", description="Series description")
+        CategoryDjangoRepository().insert(other)
+
+        response = self.client.get("/api/categories/?per_page=1&cursor=")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["data"]] == [other.id.value]
+        assert response.data["meta"]["next_cursor"] is not None
+
+        next_cursor = response.data["meta"]["next_cursor"]
+        response = self.client.get(f"/api/categories/?per_page=1&cursor={next_cursor}")
+
+        assert [item["id"] for item in response.data["data"]] == [
+            self.category.id.value
+        ]
+        assert response.data["meta"]["next_cursor"] is None
+
+    def test_list_categories_without_count(self) -> None:
+        response = self.client.get("/api/categories/?count=none")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["meta"] == {
+            "current_page": 1,
+            "per_page": 15,
+            "count": "none",
+        }
+
+    def test_export_categories_as_ndjson(self) -> None:
+        other = Category(name="Series", description=None, is_active=False)
+        CategoryDjangoRepository().insert(other)
+
+        response = self.client.get("/api/categories/export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        assert [json.loads(line) for line in lines] == [
+            {
+                "id": str(category.id.value),
+                "name": category.name,
+                "description": category.description,
+                "is_active": category.is_active,
+                "created_at": category.created_at.isoformat(),
+            }
+            for category in (self.category, other)
+        ]
+
+    def test_list_categories_with_invalid_cursor(self) -> None:
+        response = self.client.get("/api/categories/?cursor=invalid")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_categories_with_tampered_cursor(self) -> None:
+        for sort, cursor in [
+            ("name", Cursor(sort="name", value="a", id="x")),
+            ("created_at", Cursor(sort="created_at", value="foo", id=str(uuid4()))),
+            ("created_at", Cursor(sort="created_at", value=1, id=str(uuid4()))),
+        ]:
+            response = self.client.get(
+                f"/api/categories/?sort={sort}&cursor={cursor.encode()}"
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.json() == {
+                "message": f"Invalid cursor: {cursor.encode()}"
+            }
+
 
 @pytest.mark.django_db
 class TestUpdateCategoryAPI(TestCase):
@@ -226,3 +299,64 @@ class TestDeleteCategoryAPI(TestCase):
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not response.data
         assert self.category_repo.find_by_id(self.category.id.value) is None
+
+
+@pytest.mark.django_db
+class TestBulkCreateCategoryAPI(TestCase):
+    url = "/api/categories/bulk/"
+
+    def test_when_every_item_is_valid_then_return_201(self) -> None:
+        data = [
+            {"name": "Movie", "description": "Movie description"},
+            {"name": "Documentary", "is_active": False},
+        ]
+
+        response = self.client.post(self.url, data, content_type="application/json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [item["index"] for item in response.data["data"]] == [0, 1]
+        assert all(
+            item["status"] == status.HTTP_201_CREATED for item in response.data["data"]
+        )
+
+        categories = {
+            category.id.value: category
+            for category in CategoryDjangoRepository().find_all()
+        }
+        assert len(categories) == 2
+
+        first = response.data["data"][0]["data"]
+        assert first["name"] == "Movie"
+        assert first["description"] == "Movie description"
+        assert categories[first["id"]].name == "Movie"
+
+    def test_when_some_items_are_invalid_then_return_207(self) -> None:
+        data = [
+            {"name": "Movie"},
+            {"name": ""},
+            {"name": "Documentary"},
+        ]
+
+        response = self.client.post(self.url, data, content_type="application/json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        assert [item["status"] for item in response.data["data"]] == [201, 400, 201]
+        assert response.data["data"][1] == {
+            "index": 1,
+            "status": status.HTTP_400_BAD_REQUEST,
+            "errors": {"name": ["This field may not be blank."]},
+        }
+        assert len(CategoryDjangoRepository().find_all()) == 2
+
+    def test_when_payload_is_not_a_list_then_return_400(self) -> None:
+        response = self.client.post(
+            self.url, {"name": "Movie"}, content_type="application/json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert CategoryDjangoRepository().find_all() == []
+
+    def test_when_payload_is_empty_then_return_400(self) -> None:
+        response = self.client.post(self.url, [], content_type="application/json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
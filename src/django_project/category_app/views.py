@@ -1,6 +1,9 @@
 from uuid import UUID
 from django.shortcuts import render
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -11,6 +14,10 @@ from rest_framework.status import (
 
 
 from src.core.category.application.use_cases.common.category_output import CategoryOutput
+from src.core.category.application.use_cases.export_categories import (
+    ExportCategoriesInput,
+    ExportCategoriesUseCase,
+)
 from src.core.category.application.use_cases.delete_category import (
     DeleteCategoryInput,
     DeleteCategoryUseCase,
@@ -19,6 +26,9 @@ from src.core.category.application.use_cases.update_category import (
     UpdateCategoryInput,
     UpdateCategoryUseCase,
 )
+from src.core.category.application.use_cases.bulk_create_categories import (
+    BulkCreateCategoriesUseCase,
+)
 from src.core.category.application.use_cases.create_category import (
     CreateCategoryInput,
     CreateCategoryUseCase,
@@ -38,7 +48,9 @@ from src.core.category.application.use_cases.list_categories import (
     ListCategoriesUseCase,
 )
 
-from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.container import container
+from src.django_project.shared_app.bulk import bulk_create_response
+from src.django_project.shared_app.streaming import ndjson_response
 from src.django_project.category_app.presenters import (
     CategoryCollectionPresenter,
     CategoryPresenter,
@@ -47,13 +59,13 @@ from src.django_project.category_app.presenters import (
 
 class CategoryViewSet(viewsets.ViewSet):
     def __init__(self, **kwargs):
-        repository = CategoryDjangoRepository()
-
-        self.create_use_case = CreateCategoryUseCase(repository)
-        self.list_use_case = ListCategoriesUseCase(repository)
-        self.get_use_case = GetCategoryUseCase(repository)
-        self.update_use_case = UpdateCategoryUseCase(repository)
-        self.delete_use_case = DeleteCategoryUseCase(repository)
+        self.create_use_case = container.resolve(CreateCategoryUseCase)
+        self.list_use_case = container.resolve(ListCategoriesUseCase)
+        self.get_use_case = container.resolve(GetCategoryUseCase)
+        self.update_use_case = container.resolve(UpdateCategoryUseCase)
+        self.delete_use_case = container.resolve(DeleteCategoryUseCase)
+        self.export_use_case = container.resolve(ExportCategoriesUseCase)
+        self.bulk_create_use_case = container.resolve(BulkCreateCategoriesUseCase)
 
     def create(self, request: Request) -> Response:
         serializer = CreateCategoryInputSerializer(data=request.data)
@@ -125,6 +137,24 @@ class CategoryViewSet(viewsets.ViewSet):
             data=CategoryViewSet.serialize(output),
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        return bulk_create_response(
+            self,
+            request,
+            serializer_class=CreateCategoryInputSerializer,
+            input_class=CreateCategoryInput,
+            use_case=self.bulk_create_use_case,
+            serialize=CategoryViewSet.serialize,
+        )
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request: Request) -> StreamingHttpResponse:
+        input = ExportCategoriesInput(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        output = self.export_use_case.execute(input)
+
+        return ndjson_response(output, CategoryPresenter)
+
     def destroy(self, request: Request, pk: UUID = None):
         serializer = DeleteCategoryInputSerializer(data={"id": pk})
         serializer.is_valid(raise_exception=True)
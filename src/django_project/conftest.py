@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.fixture
+def shared_cache(settings, tmp_path):
+    """A default cache every process could share, which the count and
+    known-id caches require; a fresh one per test."""
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path / "cache"),
+        }
+    }
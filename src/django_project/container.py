@@ -0,0 +1,370 @@
+import datetime
+
+from django.conf import settings
+
+from src.core._shared.application.application_service import ApplicationService
+from src.core._shared.application.storage_interface import IStorage
+from src.core._shared.domain.events.domain_event_mediator import DomainEventMediator
+from src.core._shared.domain.repositories.relations_lookup_interface import (
+    IRelationsLookup,
+)
+from src.core._shared.domain.repositories.unit_of_work_interface import IUnitOfWork
+from src.core._shared.infra.storage.local_storage import LocalStorage
+from src.core._shared.infra.storage.s3_storage import S3Storage
+from src.core.cast_member.application.use_cases.bulk_create_cast_members import (
+    BulkCreateCastMembersUseCase,
+)
+from src.core.cast_member.application.use_cases.create_cast_member import (
+    CreateCastMemberUseCase,
+)
+from src.core.cast_member.application.use_cases.delete_cast_member import (
+    DeleteCastMemberUseCase,
+)
+from src.core.cast_member.application.use_cases.export_cast_members import (
+    ExportCastMembersUseCase,
+)
+from src.core.cast_member.application.use_cases.get_cast_member import (
+    GetCastMemberUseCase,
+)
+from src.core.cast_member.application.use_cases.list_cast_members import (
+    ListCastMembersUseCase,
+)
+from src.core.cast_member.application.use_cases.update_cast_member import (
+    UpdateCastMemberUseCase,
+)
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.cast_member_repository import ICastMemberRepository
+from src.core.category.application.use_cases.bulk_create_categories import (
+    BulkCreateCategoriesUseCase,
+)
+from src.core.category.application.use_cases.create_category import (
+    CreateCategoryUseCase,
+)
+from src.core.category.application.use_cases.delete_category import (
+    DeleteCategoryUseCase,
+)
+from src.core.category.application.use_cases.export_categories import (
+    ExportCategoriesUseCase,
+)
+from src.core.category.application.use_cases.get_category import GetCategoryUseCase
+from src.core.category.application.use_cases.list_categories import (
+    ListCategoriesUseCase,
+)
+from src.core.category.application.use_cases.update_category import (
+    UpdateCategoryUseCase,
+)
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import ICategoryRepository
+from src.core.genre.application.use_cases.bulk_create_genres import (
+    BulkCreateGenresUseCase,
+)
+from src.core.genre.application.use_cases.create_genre import CreateGenreUseCase
+from src.core.genre.application.use_cases.delete_genre import DeleteGenreUseCase
+from src.core.genre.application.use_cases.export_genres import ExportGenresUseCase
+from src.core.genre.application.use_cases.list_genres import ListGenresUseCase
+from src.core.genre.application.use_cases.update_genre import UpdateGenreUseCase
+from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import IGenreRepository
+from src.core.video.application.upload_spool_interface import IUploadSpool
+from src.core.video.application.use_cases.append_upload_chunk import (
+    AppendUploadChunkUseCase,
+)
+from src.core.video.application.use_cases.bulk_create_videos import (
+    BulkCreateVideosUseCase,
+)
+from src.core.video.application.use_cases.cancel_upload_session import (
+    CancelUploadSessionUseCase,
+)
+from src.core.video.application.use_cases.create_upload_session import (
+    CreateUploadSessionUseCase,
+)
+from src.core.video.application.use_cases.create_video import CreateVideoUseCase
+from src.core.video.application.use_cases.delete_video import DeleteVideoUseCase
+from src.core.video.application.use_cases.export_videos import ExportVideosUseCase
+from src.core.video.application.use_cases.finalize_upload_session import (
+    FinalizeUploadSessionUseCase,
+)
+from src.core.video.application.use_cases.get_upload_session import (
+    GetUploadSessionUseCase,
+)
+from src.core.video.application.use_cases.get_video import GetVideoUseCase
+from src.core.video.application.use_cases.list_videos import ListVideosUseCase
+from src.core.video.application.use_cases.purge_expired_upload_sessions import (
+    PurgeExpiredUploadSessionsUseCase,
+)
+from src.core.video.application.use_cases.update_video import UpdateVideoUseCase
+from src.core.video.application.use_cases.upload_audio_video_media import (
+    UploadAudioVideoMediaUseCase,
+)
+from src.core.video.application.use_cases.upload_image_media import (
+    UploadImageMediaUseCase,
+)
+from src.core.video.application.validations.video_relations_exists_in_database_validator import (
+    VideoRelationsExistsInDatabaseValidator,
+)
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+from src.core.video.domain.video_repository import (
+    IVideoListingRepository,
+    IVideoRepository,
+)
+from src.django_project.cast_member_app.models import CastMemberModel
+from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
+from src.django_project.category_app.models import CategoryModel
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.genre_app.models import GenreModel
+from src.django_project.genre_app.repository import GenreDjangoRepository
+from src.django_project.shared_app.container import Container
+from src.django_project.shared_app.relations import DjangoRelationsLookup
+from src.django_project.shared_app.unit_of_work import UnitOfWork
+from src.django_project.video_app.listing import VideoListingDjangoRepository
+from src.django_project.video_app.repository import VideoDjangoRepository
+from src.django_project.video_app.uploads import (
+    UploadSessionDjangoRepository,
+    UploadSpool,
+)
+
+container = Container()
+
+# Stateless collaborators: built once per process.
+container.singleton(ICategoryRepository, lambda c: CategoryDjangoRepository())
+container.singleton(IGenreRepository, lambda c: GenreDjangoRepository())
+container.singleton(ICastMemberRepository, lambda c: CastMemberDjangoRepository())
+container.singleton(IVideoRepository, lambda c: VideoDjangoRepository())
+container.singleton(IVideoListingRepository, lambda c: VideoListingDjangoRepository())
+container.singleton(IStorage, lambda c: S3Storage())
+container.singleton(LocalStorage, lambda c: LocalStorage())
+container.singleton(IUploadSessionRepository, lambda c: UploadSessionDjangoRepository())
+
+container.singleton(
+    IRelationsLookup,
+    lambda c: DjangoRelationsLookup(
+        {
+            Category: CategoryModel,
+            Genre: GenreModel,
+            CastMember: CastMemberModel,
+        },
+        known_ids={
+            Category: CategoryDjangoRepository.known_ids,
+            Genre: GenreDjangoRepository.known_ids,
+            CastMember: CastMemberDjangoRepository.known_ids,
+        },
+    ),
+)
+container.singleton(
+    VideoRelationsExistsInDatabaseValidator,
+    lambda c: VideoRelationsExistsInDatabaseValidator(c.resolve(IRelationsLookup)),
+)
+
+container.singleton(
+    CreateCategoryUseCase, lambda c: CreateCategoryUseCase(c.resolve(ICategoryRepository))
+)
+container.singleton(
+    ListCategoriesUseCase, lambda c: ListCategoriesUseCase(c.resolve(ICategoryRepository))
+)
+container.singleton(
+    GetCategoryUseCase, lambda c: GetCategoryUseCase(c.resolve(ICategoryRepository))
+)
+container.singleton(
+    UpdateCategoryUseCase, lambda c: UpdateCategoryUseCase(c.resolve(ICategoryRepository))
+)
+container.singleton(
+    DeleteCategoryUseCase, lambda c: DeleteCategoryUseCase(c.resolve(ICategoryRepository))
+)
+container.singleton(
+    ExportCategoriesUseCase,
+    lambda c: ExportCategoriesUseCase(c.resolve(ICategoryRepository)),
+)
+
+container.singleton(
+    CreateGenreUseCase,
+    lambda c: CreateGenreUseCase(
+        c.resolve(IGenreRepository), c.resolve(ICategoryRepository)
+    ),
+)
+container.singleton(
+    ListGenresUseCase, lambda c: ListGenresUseCase(c.resolve(IGenreRepository))
+)
+container.singleton(
+    UpdateGenreUseCase,
+    lambda c: UpdateGenreUseCase(
+        c.resolve(IGenreRepository), c.resolve(ICategoryRepository)
+    ),
+)
+container.singleton(
+    DeleteGenreUseCase, lambda c: DeleteGenreUseCase(c.resolve(IGenreRepository))
+)
+container.singleton(
+    ExportGenresUseCase, lambda c: ExportGenresUseCase(c.resolve(IGenreRepository))
+)
+
+container.singleton(
+    CreateCastMemberUseCase,
+    lambda c: CreateCastMemberUseCase(c.resolve(ICastMemberRepository)),
+)
+container.singleton(
+    ListCastMembersUseCase,
+    lambda c: ListCastMembersUseCase(c.resolve(ICastMemberRepository)),
+)
+container.singleton(
+    GetCastMemberUseCase,
+    lambda c: GetCastMemberUseCase(c.resolve(ICastMemberRepository)),
+)
+container.singleton(
+    UpdateCastMemberUseCase,
+    lambda c: UpdateCastMemberUseCase(c.resolve(ICastMemberRepository)),
+)
+container.singleton(
+    DeleteCastMemberUseCase,
+    lambda c: DeleteCastMemberUseCase(c.resolve(ICastMemberRepository)),
+)
+container.singleton(
+    ExportCastMembersUseCase,
+    lambda c: ExportCastMembersUseCase(c.resolve(ICastMemberRepository)),
+)
+
+container.singleton(
+    CreateVideoUseCase,
+    lambda c: CreateVideoUseCase(
+        c.resolve(IVideoRepository),
+        c.resolve(VideoRelationsExistsInDatabaseValidator),
+    ),
+)
+container.singleton(
+    GetVideoUseCase, lambda c: GetVideoUseCase(c.resolve(IVideoRepository))
+)
+container.singleton(
+    ListVideosUseCase,
+    lambda c: ListVideosUseCase(
+        c.resolve(IVideoRepository),
+        (
+            c.resolve(IVideoListingRepository)
+            if settings.VIDEO_LISTING_READ_MODEL
+            else None
+        ),
+    ),
+)
+container.singleton(
+    DeleteVideoUseCase, lambda c: DeleteVideoUseCase(c.resolve(IVideoRepository))
+)
+container.singleton(
+    ExportVideosUseCase, lambda c: ExportVideosUseCase(c.resolve(IVideoRepository))
+)
+container.singleton(
+    UpdateVideoUseCase,
+    lambda c: UpdateVideoUseCase(
+        c.resolve(IVideoRepository),
+        c.resolve(VideoRelationsExistsInDatabaseValidator),
+    ),
+)
+container.singleton(
+    UploadImageMediaUseCase,
+    lambda c: UploadImageMediaUseCase(c.resolve(IVideoRepository), c.resolve(IStorage)),
+)
+
+
+# The RabbitMQ handler keeps a pika BlockingConnection, which must not be
+# shared between threads.
+container.thread(DomainEventMediator, lambda c: DomainEventMediator())
+
+# Transaction state lives on the unit of work, so everything holding one is
+# built per request.
+container.factory(IUnitOfWork, lambda c: UnitOfWork())
+container.factory(
+    ApplicationService,
+    lambda c: ApplicationService(
+        uow=c.resolve(IUnitOfWork),
+        domain_event_mediator=c.resolve(DomainEventMediator),
+    ),
+)
+container.factory(
+    UploadAudioVideoMediaUseCase,
+    lambda c: UploadAudioVideoMediaUseCase(
+        video_repo=c.resolve(IVideoRepository),
+        storage=c.resolve(IStorage),
+        app_service=c.resolve(ApplicationService),
+    ),
+)
+
+
+# Upload sessions read the UPLOAD_* settings each time they are built.
+def upload_session_timeout() -> datetime.timedelta:
+    return datetime.timedelta(seconds=settings.UPLOAD_SESSION_TIMEOUT)
+
+
+container.factory(IUploadSpool, lambda c: UploadSpool())
+container.factory(
+    CreateUploadSessionUseCase,
+    lambda c: CreateUploadSessionUseCase(
+        c.resolve(IVideoRepository),
+        c.resolve(IUploadSessionRepository),
+        c.resolve(IUploadSpool),
+    ),
+)
+container.factory(
+    GetUploadSessionUseCase,
+    lambda c: GetUploadSessionUseCase(
+        c.resolve(IUploadSessionRepository), upload_session_timeout()
+    ),
+)
+container.factory(
+    AppendUploadChunkUseCase,
+    lambda c: AppendUploadChunkUseCase(
+        c.resolve(IUploadSessionRepository),
+        c.resolve(IUploadSpool),
+        upload_session_timeout(),
+    ),
+)
+container.factory(
+    CancelUploadSessionUseCase,
+    lambda c: CancelUploadSessionUseCase(
+        c.resolve(IUploadSessionRepository),
+        c.resolve(IUploadSpool),
+        upload_session_timeout(),
+    ),
+)
+container.factory(
+    PurgeExpiredUploadSessionsUseCase,
+    lambda c: PurgeExpiredUploadSessionsUseCase(
+        c.resolve(IUploadSessionRepository),
+        c.resolve(IUploadSpool),
+        upload_session_timeout(),
+    ),
+)
+container.factory(
+    FinalizeUploadSessionUseCase,
+    lambda c: FinalizeUploadSessionUseCase(
+        c.resolve(IUploadSessionRepository),
+        c.resolve(IUploadSpool),
+        c.resolve(UploadAudioVideoMediaUseCase),
+        upload_session_timeout(),
+    ),
+)
+
+container.factory(
+    BulkCreateCategoriesUseCase,
+    lambda c: BulkCreateCategoriesUseCase(
+        c.resolve(ICategoryRepository), c.resolve(IUnitOfWork)
+    ),
+)
+container.factory(
+    BulkCreateCastMembersUseCase,
+    lambda c: BulkCreateCastMembersUseCase(
+        c.resolve(ICastMemberRepository), c.resolve(IUnitOfWork)
+    ),
+)
+container.factory(
+    BulkCreateGenresUseCase,
+    lambda c: BulkCreateGenresUseCase(
+        c.resolve(IGenreRepository),
+        c.resolve(ICategoryRepository),
+        c.resolve(IUnitOfWork),
+    ),
+)
+container.factory(
+    BulkCreateVideosUseCase,
+    lambda c: BulkCreateVideosUseCase(
+        c.resolve(IVideoRepository),
+        c.resolve(VideoRelationsExistsInDatabaseValidator),
+        c.resolve(IUnitOfWork),
+    ),
+)
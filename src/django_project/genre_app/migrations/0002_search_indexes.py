@@ -0,0 +1,29 @@
+# Generated by Django 5.1 on 2026-10-18 17:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='genremodel',
+            index=models.Index(fields=['created_at', 'id'], name='genres_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='genremodel',
+            index=models.Index(fields=['name', 'id'], name='genres_name_idx'),
+        ),
+        # Genres of a category (the categories_id filter); the auto-created
+        # FK index only covers categorymodel_id, so every match would read
+        # the through row again for genremodel_id.
+        migrations.RunSQL(
+            'CREATE INDEX genres_categories_reverse_idx '
+            'ON genres_categories (categorymodel_id, genremodel_id)',
+            'DROP INDEX genres_categories_reverse_idx',
+        ),
+    ]
@@ -18,3 +18,7 @@ class GenreModel(models.Model):
     class Meta:
         db_table = "genres"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="genres_created_idx"),
+            models.Index(fields=["name", "id"], name="genres_name_idx"),
+        ]
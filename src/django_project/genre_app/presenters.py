@@ -36,7 +36,8 @@ class GenrePresenter(ResourcePresenter):
 class GenreCollectionPresenter(CollectionPresenter):
     output: ListGenresOutput
 
-    def __post_init__(self):
-        self.data = [GenrePresenter.from_output(item) for item in self.output.items]
+    item_presenter = GenrePresenter
 
+    def __post_init__(self):
+        self.data = self.output.items
         self.pagination = self.output
@@ -1,6 +1,5 @@
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Set
 import uuid
-from django.core.paginator import Paginator
 from django.db import models, transaction
 
 from src.core._shared.domain.value_objects import InvalidUuidException
@@ -19,24 +18,49 @@ from src.core.genre.domain.genre_repository import (
 from src.django_project.category_app.models import CategoryModel
 from src.django_project.genre_app.mappers import GenreModelMapper
 from src.django_project.genre_app.models import GenreModel
+from src.django_project.shared_app.count_cache import CountCache
+from src.django_project.shared_app.known_ids import KnownIds
+from src.django_project.shared_app.relations import bulk_link, linked_to
+from src.django_project.shared_app.pagination import (
+    ordering_for,
+    paginate_by_cursor,
+    paginate_by_page,
+)
 
 
 class GenreDjangoRepository(IGenreRepository):
     sortable_fields: List[str] = ["name", "created_at"]
+    count_cache = CountCache("genres", dependents=("videos", "video_listing"))
+    known_ids = KnownIds(GenreModel)
 
+    @transaction.atomic
     def insert(self, entity: Genre) -> None:
         model, relations = GenreModelMapper.to_model(entity)
         model.save()
 
-        model.categories.set(relations.categories_ids)
+        bulk_link(
+            GenreModel.categories,
+            ((model.id, category_id) for category_id in relations.categories_ids),
+        )
+
+        self.count_cache.invalidate()
 
+    @transaction.atomic
     def bulk_insert(self, entities: List[Genre]) -> None:
-        entities_and_relations = list(map(GenreModelMapper.to_model, entities))
-        models = GenreModel.objects.bulk_create(
-            [entity for entity, _ in entities_and_relations]
+        models_and_relations = list(map(GenreModelMapper.to_model, entities))
+        GenreModel.objects.bulk_create([model for model, _ in models_and_relations])
+
+        bulk_link(
+            GenreModel.categories,
+            (
+                (model.id, category_id)
+                for model, relations in models_and_relations
+                for category_id in relations.categories_ids
+            ),
         )
-        for index, model in enumerate(models):
-            model.categories.set(entities_and_relations[index][1].categories_ids)
+
+        self.known_ids.added()
+        self.count_cache.invalidate()
 
     def find_by_id(self, entity_id: GenreId) -> Genre | None:
         model = GenreModel.objects.filter(id=entity_id).first()
@@ -56,22 +80,37 @@ class GenreDjangoRepository(IGenreRepository):
             ).all()
         ]
 
+    def stream_all(self, chunk_size: int = 500) -> Iterator[Genre]:
+        query = (
+            GenreModel.objects.order_by("created_at", "id")
+            .prefetch_related(self._prefetch_categories())
+        )
+
+        for model in query.iterator(chunk_size=chunk_size):
+            yield GenreModelMapper.to_entity(model)
+
     def exists_by_id(self, entity_ids: List[GenreId]) -> Dict[str, List[GenreId]]:
         if not entity_ids:
             raise InvalidArgumentException(
                 "ids must be an array with at least one element"
             )
 
-        exists_genre_models = GenreModel.objects.filter(id__in=entity_ids).values_list(
-            "id", flat=True
-        )
+        known_ids, lookup_ids = self.known_ids.resolve(entity_ids)
 
-        exists_genre_ids = list(exists_genre_models)
+        exists_genre_ids = set(known_ids)
+        if lookup_ids:
+            found_ids = set(
+                GenreModel.objects.filter(id__in=lookup_ids).values_list(
+                    "id", flat=True
+                )
+            )
+            self.known_ids.remember(found_ids)
+            exists_genre_ids |= found_ids
 
         not_exists_genre_ids = [id for id in entity_ids if id not in exists_genre_ids]
 
         return {
-            "exists": exists_genre_ids,
+            "exists": list(exists_genre_ids),
             "not_exists": not_exists_genre_ids,
         }
 
@@ -91,46 +130,57 @@ class GenreDjangoRepository(IGenreRepository):
             *[category_id.value for category_id in entity.categories_id],
         )
 
+        self.count_cache.invalidate()
+
     def delete(self, entity_id: GenreId) -> None:
         GenreModel.objects.filter(id=entity_id).delete()
 
+        self.count_cache.invalidate()
+
     def search(self, props: GenreSearchParams) -> GenreSearchResult:
-        query = (
-            GenreModel.objects.all()
-            .distinct()
-            .prefetch_related(self._prefetch_categories())
-        )
+        query = GenreModel.objects.prefetch_related(self._prefetch_categories())
 
         if props.filter:
             if props.filter.name:
                 query = query.filter(name__icontains=props.filter.name)
             if props.filter.categories_id:
                 query = query.filter(
-                    categories__id__in=self._filter_valid_uuids(
-                        props.filter.categories_id
+                    linked_to(
+                        GenreModel.categories,
+                        self._filter_valid_uuids(props.filter.categories_id),
                     )
                 )
 
         if props.sort and props.sort in self.sortable_fields:
-            if props.sort_dir == SortDirection.DESC:
-                props.sort = f"-{props.sort}"
-            query = query.order_by(props.sort)
+            sort, sort_dir = props.sort, props.sort_dir
         else:
-            query = query.order_by("-created_at")
+            sort, sort_dir = "created_at", SortDirection.DESC
 
-        paginator = Paginator(query, props.per_page)
+        if props.is_cursor_mode:
+            page, next_cursor = paginate_by_cursor(
+                query, sort, sort_dir, props.cursor, props.per_page
+            )
 
-        if props.page <= paginator.num_pages:
-            page_obj = paginator.page(props.page)
-        else:
-            page_obj = paginator.page(paginator.num_pages)
-            page_obj.object_list = []
+            return GenreSearchResult(
+                items=[GenreModelMapper.to_entity(model) for model in page],
+                total=self.count_cache.count(query, props),
+                current_page=props.page,
+                per_page=props.per_page,
+                cursor=props.cursor,
+                next_cursor=next_cursor,
+                count=props.count,
+            )
+
+        query = query.order_by(*ordering_for(sort, sort_dir))
+
+        page = paginate_by_page(query, props.page, props.per_page)
 
         return GenreSearchResult(
-            items=[GenreModelMapper.to_entity(model) for model in page_obj.object_list],
-            total=paginator.count,
+            items=[GenreModelMapper.to_entity(model) for model in page],
+            total=self.count_cache.count(query, props),
             current_page=props.page,
             per_page=props.per_page,
+            count=props.count,
         )
 
     def get_entity(self) -> Genre:
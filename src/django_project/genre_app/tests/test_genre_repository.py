@@ -0,0 +1,103 @@
+from collections import Counter
+from math import ceil
+from unittest.mock import patch
+
+import pytest
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.genre_app.models import GenreModel
+from src.django_project.genre_app.repository import GenreDjangoRepository
+
+
+@pytest.mark.django_db
+class TestGenreDjangoRepository:
+    repo: GenreDjangoRepository
+
+    def setup_method(self):
+        self.repo = GenreDjangoRepository()
+        self.categories = [Category(name=f"Category {i}") for i in range(3)]
+        CategoryDjangoRepository().bulk_insert(self.categories)
+
+    def test_insert_links_categories(self):
+        genre = Genre(
+            name="Drama",
+            categories_id={category.id for category in self.categories},
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            self.repo.insert(genre)
+
+        assert not [q for q in queries if q["sql"].startswith("SELECT")]
+        assert self.repo.find_by_id(genre.id.value) == genre
+
+    def test_bulk_insert_links_categories(self):
+        genres = [
+            Genre(name="Drama", categories_id={self.categories[0].id}),
+            Genre(name="Comedy", categories_id=set()),
+            Genre(
+                name="Action",
+                categories_id={category.id for category in self.categories},
+            ),
+        ]
+
+        self.repo.bulk_insert(genres)
+
+        assert sorted(self.repo.find_all(), key=lambda g: g.name) == sorted(
+            genres, key=lambda g: g.name
+        )
+
+    def test_bulk_insert_batches_rows_and_links(self):
+        genres = [
+            Genre(
+                name=f"Genre {i}",
+                categories_id={category.id for category in self.categories},
+            )
+            for i in range(1000)
+        ]
+        links = GenreModel.categories.through
+        link_fields = [
+            field for field in links._meta.concrete_fields if not field.primary_key
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            self.repo.bulk_insert(genres)
+
+        inserts = Counter(
+            query["sql"].split('"')[1]
+            for query in queries
+            if query["sql"].startswith("INSERT")
+        )
+        # One INSERT per batch Django's backend allows, never one per row.
+        assert inserts == {
+            GenreModel._meta.db_table: ceil(
+                1000
+                / connection.ops.bulk_batch_size(
+                    GenreModel._meta.concrete_fields, genres
+                )
+            ),
+            links._meta.db_table: ceil(
+                3000 / connection.ops.bulk_batch_size(link_fields, range(3000))
+            ),
+        }
+        assert GenreModel.objects.count() == 1000
+        assert links.objects.count() == 3000
+
+    @pytest.mark.parametrize("method", ["insert", "bulk_insert"])
+    def test_inserts_nothing_when_linking_categories_fails(self, method):
+        genre = Genre(name="Drama", categories_id={self.categories[0].id})
+
+        with patch(
+            "src.django_project.genre_app.repository.bulk_link",
+            side_effect=DatabaseError("disk full"),
+        ):
+            with pytest.raises(DatabaseError):
+                if method == "insert":
+                    self.repo.insert(genre)
+                else:
+                    self.repo.bulk_insert([genre])
+
+        assert not GenreModel.objects.exists()
@@ -1,5 +1,8 @@
 from uuid import UUID
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
@@ -11,10 +14,17 @@ from rest_framework.status import (
 
 from src.core.genre.domain.genre_repository import GenreFilter
 from src.core.genre.application.use_cases.common.genre_output import GenreOutput
+from src.core.genre.application.use_cases.bulk_create_genres import (
+    BulkCreateGenresUseCase,
+)
 from src.core.genre.application.use_cases.create_genre import (
     CreateGenreInput,
     CreateGenreUseCase,
 )
+from src.core.genre.application.use_cases.export_genres import (
+    ExportGenresInput,
+    ExportGenresUseCase,
+)
 from src.core.genre.application.use_cases.delete_genre import (
     DeleteGenreInput,
     DeleteGenreUseCase,
@@ -32,8 +42,9 @@ from src.django_project.genre_app.serializers import (
     DeleteGenreInputSerializer,
     UpdateGenreInputSerializer,
 )
-from src.django_project.category_app.repository import CategoryDjangoRepository
-from src.django_project.genre_app.repository import GenreDjangoRepository
+from src.django_project.container import container
+from src.django_project.shared_app.bulk import bulk_create_response
+from src.django_project.shared_app.streaming import ndjson_response
 from src.django_project.genre_app.presenters import (
     GenreCollectionPresenter,
     GenrePresenter,
@@ -43,13 +54,12 @@ from src.django_project.shared_app.filter_extractor import FilterExtractor
 
 class GenreViewSet(viewsets.ViewSet, FilterExtractor):
     def __init__(self, **kwargs):
-        genre_repo = GenreDjangoRepository()
-        category_repo = CategoryDjangoRepository()
-
-        self.create_use_case = CreateGenreUseCase(genre_repo, category_repo)
-        self.list_use_case = ListGenresUseCase(genre_repo)
-        self.update_use_case = UpdateGenreUseCase(genre_repo, category_repo)
-        self.delete_use_case = DeleteGenreUseCase(genre_repo)
+        self.create_use_case = container.resolve(CreateGenreUseCase)
+        self.list_use_case = container.resolve(ListGenresUseCase)
+        self.update_use_case = container.resolve(UpdateGenreUseCase)
+        self.delete_use_case = container.resolve(DeleteGenreUseCase)
+        self.export_use_case = container.resolve(ExportGenresUseCase)
+        self.bulk_create_use_case = container.resolve(BulkCreateGenresUseCase)
 
     def create(self, request: Request) -> Response:
         serializer = CreateGenreInputSerializer(data=request.data)
@@ -100,6 +110,24 @@ class GenreViewSet(viewsets.ViewSet, FilterExtractor):
             data=GenreViewSet.serialize(output),
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        return bulk_create_response(
+            self,
+            request,
+            serializer_class=CreateGenreInputSerializer,
+            input_class=CreateGenreInput,
+            use_case=self.bulk_create_use_case,
+            serialize=GenreViewSet.serialize,
+        )
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request: Request) -> StreamingHttpResponse:
+        input = ExportGenresInput(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        output = self.export_use_case.execute(input)
+
+        return ndjson_response(output, GenrePresenter)
+
     def destroy(self, request: Request, pk: UUID = None):
         serializer = DeleteGenreInputSerializer(data={"id": pk})
         serializer.is_valid(raise_exception=True)
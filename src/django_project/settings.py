@@ -47,6 +47,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "src.django_project.shared_app.profiling.ProfilerMiddleware",
+    "src.django_project.shared_app.middleware.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -123,6 +125,13 @@ R2_ACCESS_KEY_ID = "073441926d82a494bbcf893342abdb54"
 R2_SECRET_ACCESS_KEY = "1afe99a9a9b39f8be4aa8779df6ace033f4c842a6320dd00aec5be0464385b48"
 R2_BUCKET_NAME = "millenium-catalog-admin"
 R2_ACCOUNT_ID = "d586beb1abf0a9c7624500361c1a4ba7"  # O ID da conta no Cloudflare
+# Any S3-compatible endpoint works, e.g. a local MinIO for development.
+R2_ENDPOINT_URL = f"https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com"
+
+# Multipart uploads of S3Storage.store_stream: bytes per part (S3 needs at
+# least 5 MiB for every part but the last) and parts uploaded at once.
+S3_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+S3_MULTIPART_CONCURRENCY = 4
 
 
 # Static files (CSS, JavaScript, Images)
@@ -141,3 +150,71 @@ REST_FRAMEWORK = {
 }
 
 APPEND_SLASH = True
+
+# List totals (COUNT_CACHE_*) and known relation ids (KNOWN_IDS_*) are only
+# cached when the default backend is shared by every worker, e.g. Redis or
+# Memcached; with the per-process local memory backend below both are off.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# List totals are cached per filter and invalidated on repository writes.
+COUNT_CACHE_TIMEOUT = 300
+
+# Ids confirmed to exist by the category, genre and cast member lookups,
+# kept per process, and the largest table the Bloom filter is built for.
+KNOWN_IDS_CACHE_SIZE = 10_000
+KNOWN_IDS_CACHE_TIMEOUT = 300
+KNOWN_IDS_BLOOM_MAX_ROWS = 100_000
+
+# Resumable video/trailer uploads: where chunks are spooled until the upload
+# is finalized, how much of a request body is read at a time, and how many
+# seconds a session stays open (``manage.py purgeuploadsessions`` removes
+# the expired ones and their spool files).
+UPLOAD_SPOOL_DIR = "/tmp/millenium-uploads"
+UPLOAD_READ_SIZE = 1024 * 1024
+UPLOAD_SESSION_TIMEOUT = 24 * 60 * 60
+
+# Rows loaded per round trip by the streaming /export endpoints.
+EXPORT_CHUNK_SIZE = 500
+
+# Bulk create endpoints: items accepted per request and rows per INSERT.
+BULK_CREATE_MAX_ITEMS = 1000
+BULK_CREATE_BATCH_SIZE = 500
+
+# Serve GET /api/videos from the video_listing read model. Migrations create
+# it empty: on a database that already has videos, run
+# `manage.py rebuildvideolisting` after migrating.
+VIDEO_LISTING_READ_MODEL = True
+
+# Match filter[title] against the video_search FTS5 index (SQLite only).
+VIDEO_FULL_TEXT_SEARCH = True
+
+# Queries a request may run before QueryBudgetMiddleware logs a warning, per
+# "<router basename>.<action>"; everything else gets QUERY_BUDGET_DEFAULT
+# (None disables the warning). Counts are always sent in X-DB-Queries.
+QUERY_BUDGET_DEFAULT = 20
+QUERY_BUDGETS = {
+    "category.list": 2,
+    "category.retrieve": 1,
+    "genre.list": 3,
+    "cast_member.list": 2,
+    "cast_member.retrieve": 1,
+    "videos.list": 2,
+    "videos.retrieve": 4,
+}
+
+# On-demand request profiling (shared_app.profiling.ProfilerMiddleware): a
+# request sending "X-Profile: <PROFILER_TOKEN>", or drawn with probability
+# PROFILER_SAMPLE_RATE, has its cProfile stats and collapsed stacks written to
+# PROFILER_DIR. Nothing is profiled while PROFILER_DIR is None.
+PROFILER_DIR = None
+PROFILER_TOKEN = None
+PROFILER_SAMPLE_RATE = 0.0
+
+# Prometheus metrics served at /metrics. Point METRICS_DIR at a directory
+# shared by all worker processes (and emptied on deploy) to aggregate them;
+# with None each process only reports its own.
+METRICS_DIR = None
@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class SharedAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.django_project.shared_app"
+
+    def ready(self):
+        from src.core._shared.metrics import registry
+
+        registry.configure(settings.METRICS_DIR)
@@ -0,0 +1,96 @@
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import Serializer
+from rest_framework.status import HTTP_201_CREATED, HTTP_207_MULTI_STATUS
+
+from src.core._shared.application.bulk_create import (
+    BulkCreateInput,
+    BulkCreateUseCase,
+)
+from src.django_project.shared_app.exception_handler import custom_exception_handler
+
+
+def bulk_create_response(
+    view: Any,
+    request: Request,
+    serializer_class: Type[Serializer],
+    input_class: type,
+    use_case: BulkCreateUseCase,
+    serialize: Callable[[Any], Dict[str, Any]],
+) -> Response:
+    """Run a bulk create and report every item on its own.
+
+    Each entry of the response carries the item ``index`` and the ``status``
+    a single create would have answered with, plus either its ``data`` or the
+    ``errors`` body built by ``custom_exception_handler``. The response is
+    201 when every item was created and 207 otherwise."""
+    valid, errors = _validate_items(serializer_class, request.data)
+
+    output = use_case.execute(
+        BulkCreateInput(
+            items=[input_class(**data) for _, data in valid],
+            batch_size=settings.BULK_CREATE_BATCH_SIZE,
+        )
+    )
+
+    outputs: Dict[int, Any] = {}
+    for (index, _), result in zip(valid, output.items):
+        if result.error is not None:
+            errors[index] = result.error
+        else:
+            outputs[index] = result.output
+
+    context = {"view": view, "request": request}
+    items = []
+
+    for index in range(len(request.data)):
+        if index in errors:
+            response = custom_exception_handler(errors[index], context)
+            items.append(
+                {"index": index, "status": response.status_code, "errors": response.data}
+            )
+        else:
+            items.append(
+                {
+                    "index": index,
+                    "status": HTTP_201_CREATED,
+                    "data": serialize(outputs[index])["data"],
+                }
+            )
+
+    return Response(
+        status=HTTP_207_MULTI_STATUS if errors else HTTP_201_CREATED,
+        data={"data": items},
+    )
+
+
+def _validate_items(
+    serializer_class: Type[Serializer], data: Any
+) -> Tuple[List[Tuple[int, Dict[str, Any]]], Dict[int, Exception]]:
+    serializer = serializer_class(
+        data=data,
+        many=True,
+        allow_empty=False,
+        max_length=settings.BULK_CREATE_MAX_ITEMS,
+    )
+
+    if serializer.is_valid():
+        return list(enumerate(serializer.validated_data)), {}
+
+    # Anything but a per-item error list means the payload itself is wrong.
+    if not isinstance(serializer.errors, list):
+        raise ValidationError(serializer.errors)
+
+    valid, errors = [], {}
+
+    for index, (item, item_errors) in enumerate(zip(data, serializer.errors)):
+        if item_errors:
+            errors[index] = ValidationError(item_errors)
+        else:
+            valid.append((index, serializer.child.run_validation(item)))
+
+    return valid, errors
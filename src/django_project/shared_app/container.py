@@ -0,0 +1,69 @@
+from enum import Enum
+import threading
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+Provider = Callable[["Container"], Any]
+
+
+class Scope(Enum):
+    SINGLETON = "singleton"
+    THREAD = "thread"
+    FACTORY = "factory"
+
+
+class Container:
+    """Process-wide registry of collaborators keyed by the type callers ask
+    for. Singletons are built once on first use, thread-scoped providers once
+    per worker thread and factories on every ``resolve``."""
+
+    def __init__(self):
+        self._providers: Dict[type, Tuple[Scope, Provider]] = {}
+        self._singletons: Dict[type, Any] = {}
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+    def singleton(self, key: Type[T], provider: Callable[["Container"], T]) -> None:
+        self._register(key, Scope.SINGLETON, provider)
+
+    def thread(self, key: Type[T], provider: Callable[["Container"], T]) -> None:
+        self._register(key, Scope.THREAD, provider)
+
+    def factory(self, key: Type[T], provider: Callable[["Container"], T]) -> None:
+        self._register(key, Scope.FACTORY, provider)
+
+    def resolve(self, key: Type[T]) -> T:
+        try:
+            scope, provider = self._providers[key]
+        except KeyError:
+            raise LookupError(f"{key.__name__} is not registered in the container")
+
+        if scope == Scope.FACTORY:
+            return provider(self)
+
+        if scope == Scope.THREAD:
+            instances = self._local.__dict__.setdefault("instances", {})
+            if key not in instances:
+                instances[key] = provider(self)
+            return instances[key]
+
+        instance = self._singletons.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._singletons.get(key)
+                if instance is None:
+                    instance = self._singletons[key] = provider(self)
+
+        return instance
+
+    def reset(self) -> None:
+        """Drop every built instance; registrations are kept."""
+        with self._lock:
+            self._singletons.clear()
+            self._local = threading.local()
+
+    def _register(self, key: type, scope: Scope, provider: Provider) -> None:
+        with self._lock:
+            self._providers[key] = (scope, provider)
+            self._singletons.pop(key, None)
@@ -0,0 +1,144 @@
+from dataclasses import asdict, is_dataclass
+import hashlib
+import json
+import time
+from typing import Any, Tuple
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections, models, transaction
+
+from src.core._shared.domain.repositories.search_params import CountMode, SearchParams
+
+# Backends whose entries live in the worker process: a generation bumped
+# by one worker is never seen by the others, which would keep serving
+# what they cached before the write.
+PROCESS_LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+
+class CountCache:
+    """Caches list totals per repository, keyed by a normalized filter
+    signature. Every write bumps the generation of the repository namespace
+    (and of the namespaces whose filters join on it), so stale totals are
+    never read back after a write.
+
+    Nothing is cached unless the default cache is shared by every worker
+    (see ``is_shared_cache``)."""
+
+    def __init__(self, namespace: str, dependents: Tuple[str, ...] = ()):
+        self.namespace = namespace
+        self.dependents = dependents
+
+    def count(self, query: models.QuerySet, props: SearchParams) -> int | None:
+        if props.count == CountMode.NONE:
+            return None
+
+        shared = is_shared_cache()
+        if shared:
+            key = self._key(props.filter)
+            total = cache.get(key)
+
+            if total is not None:
+                return total
+
+        if props.count == CountMode.ESTIMATED and not _normalize(props.filter):
+            estimate = self._estimate(query)
+            if estimate is not None:
+                return estimate
+
+        total = query.count()
+        if shared:
+            cache.set(key, total, getattr(settings, "COUNT_CACHE_TIMEOUT", 300))
+
+        return total
+
+    def invalidate(self) -> None:
+        if not is_shared_cache():
+            return
+
+        namespaces = (self.namespace, *self.dependents)
+
+        for namespace in namespaces:
+            bump_generation(namespace)
+
+        # A reader may cache the pre-commit total in between, so bump again
+        # once the write is visible to everyone.
+        transaction.on_commit(
+            lambda: [bump_generation(namespace) for namespace in namespaces]
+        )
+
+    def _key(self, _filter: Any) -> str:
+        signature = json.dumps(_normalize(_filter), sort_keys=True, default=str)
+        digest = hashlib.sha1(signature.encode()).hexdigest()
+        return f"count:{self.namespace}:{generation(self.namespace)}:{digest}"
+
+    def _estimate(self, query: models.QuerySet) -> int | None:
+        connection = connections[query.db]
+        table = connection.ops.quote_name(query.model._meta.db_table)
+
+        if connection.vendor == "sqlite":
+            sql, params = f"SELECT MAX(_ROWID_) FROM {table}", []
+        elif connection.vendor == "postgresql":
+            sql = "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass"
+            params = [query.model._meta.db_table]
+        else:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+
+        return int(row[0])
+
+
+def _normalize(value: Any) -> Any:
+    if is_dataclass(value):
+        value = asdict(value)
+
+    if isinstance(value, dict):
+        return {
+            key: _normalize(item)
+            for key, item in value.items()
+            if item not in (None, "", [], (), set())
+        }
+
+    if isinstance(value, (list, tuple, set)):
+        return sorted({str(item) for item in value})
+
+    return value
+
+
+def is_shared_cache() -> bool:
+    """Whether the default cache is one every worker reads and writes."""
+    return not isinstance(caches["default"], PROCESS_LOCAL_BACKENDS)
+
+
+def _generation_key(namespace: str) -> str:
+    return f"count:{namespace}:generation"
+
+
+def generation(namespace: str) -> int:
+    key = _generation_key(namespace)
+    value = cache.get(key)
+
+    if value is None:
+        # Seeded from the clock so an evicted generation never restarts at a
+        # value that older entries were stored under.
+        cache.add(key, time.time_ns(), timeout=None)
+        value = cache.get(key)
+
+    return value
+
+
+def bump_generation(namespace: str) -> None:
+    key = _generation_key(namespace)
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=None)
@@ -0,0 +1,104 @@
+import dataclasses
+from enum import Enum
+import threading
+import types
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Set,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from pydantic import PlainSerializer
+
+Encoder = Callable[[Any], Dict[str, Any]]
+
+
+class EncoderRegistry:
+    """Generated ``item -> dict`` functions, one per presenter class.
+
+    The encoder reads the presenter's fields straight off any object that has
+    them (the use case output or the presenter itself) and returns exactly
+    what ``TypeAdapter(presenter).dump_python`` would, without building the
+    presenter or walking a pydantic schema. Enum fields are coerced the way
+    the presenters' ``from_output`` constructors do."""
+
+    _encoders: Dict[type, Encoder] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, presenter: type) -> Encoder:
+        encoder = cls._encoders.get(presenter)
+
+        if encoder is None:
+            with cls._lock:
+                encoder = cls._encoders.get(presenter)
+                if encoder is None:
+                    encoder = cls._encoders[presenter] = compile_encoder(presenter)
+
+        return encoder
+
+
+def compile_encoder(_type: type, coerce_enums: bool = True) -> Encoder:
+    hints = get_type_hints(_type, include_extras=True)
+    namespace: Dict[str, Any] = {}
+    lines = []
+
+    for _field in dataclasses.fields(_type):
+        expression = _expression(
+            f"item.{_field.name}", hints[_field.name], namespace, coerce_enums
+        )
+        lines.append(f"        {_field.name!r}: {expression},")
+
+    source = "def encode(item):\n    return {\n" + "\n".join(lines) + "\n    }\n"
+    exec(compile(source, f"<encoder {_type.__qualname__}>", "exec"), namespace)
+
+    return namespace["encode"]
+
+
+def _expression(
+    access: str, annotation: Any, namespace: Dict[str, Any], coerce_enums: bool
+) -> str:
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        annotation, *metadata = get_args(annotation)
+        serializer = next(
+            (item for item in metadata if isinstance(item, PlainSerializer)), None
+        )
+        if serializer is not None:
+            return f"{_bind(namespace, serializer.func)}({access})"
+        return _expression(access, annotation, namespace, coerce_enums)
+
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            expression = _expression(access, args[0], namespace, coerce_enums)
+            if expression != access:
+                return f"None if {access} is None else {expression}"
+        return access
+
+    if origin in (set, Set):
+        # Built item by item, as pydantic does, so iteration order matches.
+        return f"{{value for value in {access}}}"
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return f"{_bind(namespace, annotation)}({access})" if coerce_enums else access
+
+    if isinstance(annotation, type) and dataclasses.is_dataclass(annotation):
+        # Nested values are dumped as they are, like pydantic does.
+        encoder = compile_encoder(annotation, coerce_enums=False)
+        return f"None if {access} is None else {_bind(namespace, encoder)}({access})"
+
+    return access
+
+
+def _bind(namespace: Dict[str, Any], value: Any) -> str:
+    name = f"_{len(namespace)}"
+    namespace[name] = value
+    return name
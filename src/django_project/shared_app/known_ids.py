@@ -0,0 +1,190 @@
+from collections import OrderedDict
+import math
+import threading
+import time
+from typing import Any, Iterable, Set, Tuple, Type
+from uuid import UUID
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+from src.django_project.shared_app.count_cache import (
+    bump_generation,
+    generation,
+    is_shared_cache,
+)
+
+MIN_BLOOM_CAPACITY = 1024
+
+
+class BloomFilter:
+    """Set membership with false positives only, sized for ``capacity``
+    UUIDs at ``error_rate``. UUID4s are random already, so their two
+    halves serve as the base hashes for double hashing."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: UUID) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: UUID) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def _positions(self, key: UUID) -> Iterable[int]:
+        value = key.int
+        first, second = value & 0xFFFFFFFFFFFFFFFF, (value >> 64) | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+
+class KnownIds:
+    """Read-through cache for ``exists_by_id`` on small reference tables.
+
+    Ids confirmed to exist are kept in a per-process LRU of
+    ``KNOWN_IDS_CACHE_SIZE`` entries for ``KNOWN_IDS_CACHE_TIMEOUT``
+    seconds. A Bloom filter over every id of the table answers "definitely
+    absent" without a query; it is rebuilt when rows are added and skipped
+    for tables over ``KNOWN_IDS_BLOOM_MAX_ROWS``.
+
+    Other processes learn about writes through generations in the Django
+    cache (as ``CountCache`` does), bumped by ``post_save``/``post_delete``
+    and by ``added()`` for ``bulk_create``, which sends no signals; rows
+    written any other way (raw SQL, another application) must be followed
+    by ``added()``/``forget()``. Only committed rows are remembered as
+    existing. Without a shared cache nothing is cached and every id is
+    looked up."""
+
+    def __init__(self, model: Type[models.Model]):
+        self.model = model
+        self.namespace = f"known_ids:{model._meta.db_table}"
+        self._lock = threading.Lock()
+        self._known: "OrderedDict[UUID, float]" = OrderedDict()
+        self._deletes: int | None = None
+        # (added generation it was built for, expiry, filter); the filter is
+        # None for tables over KNOWN_IDS_BLOOM_MAX_ROWS.
+        self._bloom: Tuple[int, float, BloomFilter | None] | None = None
+
+        post_save.connect(self._saved, sender=model, weak=False)
+        post_delete.connect(self._deleted, sender=model, weak=False)
+
+    def resolve(self, ids: Iterable[Any]) -> Tuple[Set[Any], Set[Any]]:
+        """Split ``ids`` into those known to exist and those that still have
+        to be looked up; ids the Bloom filter rules out are in neither."""
+        if not is_shared_cache():
+            return set(), set(ids)
+
+        known: Set[Any] = set()
+        lookup: Set[Any] = set()
+        now = time.monotonic()
+        deletes = generation(f"{self.namespace}:deleted")
+        bloom = self._current_bloom(now)
+
+        with self._lock:
+            if deletes != self._deletes:
+                # Deleted elsewhere: which ids is unknown, so start over.
+                self._known.clear()
+                self._deletes = deletes
+
+            for _id in ids:
+                key = as_uuid(_id)
+                if key is None:
+                    lookup.add(_id)
+                elif self._is_known(key, now):
+                    known.add(_id)
+                elif bloom is None or key in bloom:
+                    lookup.add(_id)
+
+        return known, lookup
+
+    def remember(self, ids: Iterable[UUID]) -> None:
+        ids = [key for key in map(as_uuid, ids) if key is not None]
+        if ids and is_shared_cache():
+            transaction.on_commit(lambda: self._remember(ids))
+
+    def added(self) -> None:
+        if not is_shared_cache():
+            return
+        bump_generation(f"{self.namespace}:added")
+        # Readers may rebuild from the pre-commit table in between.
+        transaction.on_commit(lambda: bump_generation(f"{self.namespace}:added"))
+
+    def forget(self, ids: Iterable[Any]) -> None:
+        if not is_shared_cache():
+            return
+        with self._lock:
+            for key in map(as_uuid, ids):
+                self._known.pop(key, None)
+        bump_generation(f"{self.namespace}:deleted")
+
+    def _remember(self, ids: Iterable[UUID]) -> None:
+        expires = time.monotonic() + settings.KNOWN_IDS_CACHE_TIMEOUT
+        with self._lock:
+            for key in ids:
+                self._known[key] = expires
+                self._known.move_to_end(key)
+            while len(self._known) > settings.KNOWN_IDS_CACHE_SIZE:
+                self._known.popitem(last=False)
+
+    def _is_known(self, key: UUID, now: float) -> bool:
+        expires = self._known.get(key)
+        if expires is None:
+            return False
+        if expires < now:
+            del self._known[key]
+            return False
+        self._known.move_to_end(key)
+        return True
+
+    def _current_bloom(self, now: float) -> BloomFilter | None:
+        """The filter for the current ``added`` generation, rebuilt outside
+        the lock so readers never wait on the table scan. A table found too
+        big is only measured again once the timeout has passed, not after
+        every insert."""
+        added = generation(f"{self.namespace}:added")
+        state = self._bloom
+
+        if state is not None and state[1] >= now:
+            built_for, _, bloom = state
+            if built_for == added or bloom is None:
+                return bloom
+
+        bloom = self._build_bloom()
+        self._bloom = (added, now + settings.KNOWN_IDS_CACHE_TIMEOUT, bloom)
+        return bloom
+
+    def _build_bloom(self) -> BloomFilter | None:
+        limit = settings.KNOWN_IDS_BLOOM_MAX_ROWS
+        ids = list(self.model.objects.values_list("pk", flat=True)[: limit + 1])
+        if len(ids) > limit:
+            return None
+
+        # Sized for at least MIN_BLOOM_CAPACITY ids: a filter sized for a
+        # handful of rows has so few bits that most lookups hit set ones.
+        bloom = BloomFilter(max(len(ids), MIN_BLOOM_CAPACITY))
+        for key in ids:
+            bloom.add(key)
+        return bloom
+
+    def _saved(self, instance: models.Model, created: bool, **kwargs) -> None:
+        if created:
+            self.added()
+
+    def _deleted(self, instance: models.Model, **kwargs) -> None:
+        self.forget([instance.pk])
+
+
+def as_uuid(_id: Any) -> UUID | None:
+    if isinstance(_id, UUID):
+        return _id
+    try:
+        return UUID(str(getattr(_id, "value", _id)))
+    except ValueError:
+        return None
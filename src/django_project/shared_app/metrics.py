@@ -0,0 +1,13 @@
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from src.core._shared.metrics import registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@require_GET
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Use case, repository and storage metrics in Prometheus text format,
+    aggregated over every process sharing ``METRICS_DIR``."""
+    return HttpResponse(registry.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,91 @@
+from contextlib import ExitStack
+import logging
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCounter:
+    """``execute_wrapper`` hook totalling the queries run through it and the
+    time spent in the database driver."""
+
+    def __init__(self):
+        self.queries = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.queries += 1
+
+
+class QueryBudgetMiddleware:
+    """Counts the ORM queries of every request and reports them in the
+    ``X-DB-Queries`` and ``Server-Timing`` response headers. Requests that
+    exceed the budget of their view action (``QUERY_BUDGETS``, keyed by
+    ``"<router basename>.<action>"``, falling back to ``QUERY_BUDGET_DEFAULT``)
+    are logged as warnings.
+
+    Unlike ``DEBUG`` query logging it keeps no SQL around, only two numbers
+    per request. Queries issued while a streaming response is consumed happen
+    after the headers are sent and are not counted."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        counter = QueryCounter()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+
+        duration = counter.duration * 1000
+
+        response["X-DB-Queries"] = str(counter.queries)
+        timing = f'db;dur={duration:.1f};desc="{counter.queries} queries"'
+        if response.has_header("Server-Timing"):
+            timing = f"{response['Server-Timing']}, {timing}"
+        response["Server-Timing"] = timing
+
+        name = getattr(request, "query_budget_name", None)
+        budget = settings.QUERY_BUDGETS.get(name, settings.QUERY_BUDGET_DEFAULT)
+
+        if budget is not None and counter.queries > budget:
+            logger.warning(
+                "%s %s (%s) ran %d queries in %.1f ms, over its budget of %d",
+                request.method,
+                request.path,
+                name,
+                counter.queries,
+                duration,
+                budget,
+            )
+
+        return response
+
+    def process_view(self, request: HttpRequest, view_func, view_args, view_kwargs):
+        request.query_budget_name = view_name(request, view_func)
+        return None
+
+
+def view_name(request: HttpRequest, view_func) -> str | None:
+    """``"<basename>.<action>"`` for router-registered viewsets (e.g.
+    ``"videos.list"``), the URL name for anything else."""
+    actions = getattr(view_func, "actions", None)
+    basename = getattr(view_func, "initkwargs", {}).get("basename")
+
+    if actions and basename:
+        return f"{basename}.{actions.get(request.method.lower())}"
+
+    match = request.resolver_match
+    return match.view_name if match else None
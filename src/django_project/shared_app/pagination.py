@@ -0,0 +1,82 @@
+from typing import List, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Q
+
+from src.core._shared.domain.exceptions import InvalidArgumentException
+from src.core._shared.domain.repositories.cursor import Cursor
+from src.core._shared.domain.repositories.search_params import SortDirection
+
+
+def ordering_for(sort: str, sort_dir: SortDirection | None) -> Tuple[str, str]:
+    prefix = "-" if sort_dir == SortDirection.DESC else ""
+    return f"{prefix}{sort}", f"{prefix}id"
+
+
+def paginate_by_page(
+    query: models.QuerySet, page: int, per_page: int
+) -> List[models.Model]:
+    """Slice the page directly; the total is resolved separately so callers
+    can skip it. Pages past the end come back empty."""
+    offset = (page - 1) * per_page
+    return list(query[offset : offset + per_page])
+
+
+def paginate_by_cursor(
+    query: models.QuerySet,
+    sort: str,
+    sort_dir: SortDirection | None,
+    cursor: str,
+    per_page: int,
+) -> Tuple[List[models.Model], str | None]:
+    """Seek on ``(sort, id)`` instead of counting and skipping rows, so every
+    page costs the same regardless of how deep it is. An empty ``cursor``
+    starts at the first page."""
+    query = query.order_by(*ordering_for(sort, sort_dir))
+
+    if cursor:
+        position = Cursor.decode(cursor)
+
+        if position.sort != sort:
+            raise InvalidArgumentException(
+                f"Cursor was issued for sort '{position.sort}', not '{sort}'"
+            )
+
+        value, _id = _position_values(query.model, position, cursor)
+        lookup = "lt" if sort_dir == SortDirection.DESC else "gt"
+        # The bound on ``sort`` alone is implied by the OR below, but it is
+        # what lets the planner seek into the (sort, id) index instead of
+        # walking it from the start.
+        query = query.filter(
+            Q(**{f"{sort}__{lookup}e": value}),
+            Q(**{f"{sort}__{lookup}": value}) | Q(**{sort: value, f"id__{lookup}": _id}),
+        )
+
+    page = list(query[: per_page + 1])
+
+    if len(page) <= per_page:
+        return page, None
+
+    page = page[:per_page]
+    last = page[-1]
+    next_cursor = Cursor(sort=sort, value=getattr(last, sort), id=str(last.id)).encode()
+
+    return page, next_cursor
+
+
+def _position_values(
+    model: type[models.Model], position: Cursor, token: str
+) -> Tuple[object, object]:
+    """The cursor's sort value and id as the model's fields take them; a
+    cursor that was tampered with is rejected before it reaches the query."""
+    try:
+        value = model._meta.get_field(position.sort).to_python(position.value)
+        _id = model._meta.get_field("id").to_python(position.id)
+    except (ValidationError, TypeError, ValueError):
+        raise InvalidArgumentException(f"Invalid cursor: {token}")
+
+    if value is None or _id is None:
+        raise InvalidArgumentException(f"Invalid cursor: {token}")
+
+    return value, _id
@@ -1,14 +1,18 @@
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Any, List
-from pydantic import TypeAdapter
+from typing import Any, ClassVar, List
 
 from src.core._shared.application.pagination_output import PaginationOutput
+from src.core._shared.domain.repositories.search_params import CountMode
+from src.core._shared.domain.validators.type_adapter_registry import (
+    TypeAdapterRegistry,
+)
+from src.django_project.shared_app.encoders import EncoderRegistry
 
 
 class ResourcePresenter(ABC):
     def serialize(self):
-        data = TypeAdapter(self.__class__).dump_python(self)
+        data = TypeAdapterRegistry.get(self.__class__).dump_python(self)
         return {"data": data}
 
 
@@ -17,8 +21,22 @@ class CollectionPresenter(ABC):
     data: List[Any] = field(init=False)
     pagination: PaginationOutput[Any] | None = field(init=False, default=None)
 
+    # When set, ``data`` holds use case outputs that are encoded with the
+    # generated encoder of this presenter instead of presenter instances.
+    # Items that are already dicts (read model documents) pass through.
+    item_presenter: ClassVar[type | None] = None
+
     def serialize(self):
-        data = [TypeAdapter(item.__class__).dump_python(item) for item in self.data]
+        if self.item_presenter is not None:
+            encode = EncoderRegistry.get(self.item_presenter)
+            data = [
+                item if isinstance(item, dict) else encode(item) for item in self.data
+            ]
+        else:
+            data = [
+                TypeAdapterRegistry.get(item.__class__).dump_python(item)
+                for item in self.data
+            ]
         meta = (
             {
                 "total": self.pagination.total,
@@ -29,4 +47,14 @@ class CollectionPresenter(ABC):
             if self.pagination is not None
             else None
         )
+
+        if meta is not None and self.pagination.cursor is not None:
+            meta["next_cursor"] = self.pagination.next_cursor
+
+        if meta is not None and self.pagination.count != CountMode.EXACT:
+            meta["count"] = self.pagination.count.value
+
+            if self.pagination.total is None:
+                del meta["total"], meta["last_page"]
+
         return {"data": data, "meta": meta}
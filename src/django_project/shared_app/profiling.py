@@ -0,0 +1,143 @@
+import cProfile
+import datetime
+import hmac
+import pstats
+import random
+import re
+import threading
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+MAX_DEPTH = 200
+# Subtrees below this share of the request are left out of the stacks.
+MIN_SHARE = 1e-4
+
+# Held while a request is profiled. Since Python 3.12 cProfile is built on
+# sys.monitoring, which takes one profiler per interpreter: a second
+# Profile running in another thread fails to start.
+_profiling = threading.Lock()
+
+Function = Tuple[str, int, str]
+
+
+class ProfilerMiddleware:
+    """Runs ``cProfile`` around a request when it carries
+    ``X-Profile: <PROFILER_TOKEN>`` or is drawn by ``PROFILER_SAMPLE_RATE``,
+    and writes ``<id>.prof`` (pstats) and ``<id>.collapsed`` (flame graph
+    input) to ``PROFILER_DIR``. The id is returned in ``X-Profile-Id``.
+
+    Every other request, and every request while ``PROFILER_DIR`` is unset,
+    goes straight through. One request is profiled at a time: a request
+    sending the token waits for the one being profiled, a sampled request
+    goes through unprofiled."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not settings.PROFILER_DIR:
+            return self.get_response(request)
+
+        requested = self._requested(request)
+        if requested is False or (
+            requested is None and random.random() >= settings.PROFILER_SAMPLE_RATE
+        ):
+            return self.get_response(request)
+
+        if not _profiling.acquire(blocking=bool(requested)):
+            return self.get_response(request)
+        try:
+            profiler = cProfile.Profile()
+            response = profiler.runcall(self.get_response, request)
+        finally:
+            _profiling.release()
+
+        response[PROFILE_ID_HEADER] = self._save(request, profiler)
+
+        return response
+
+    def _requested(self, request: HttpRequest) -> bool | None:
+        """Whether the request sent the right token; ``None`` when it sent
+        none, and is left to sampling."""
+        token = request.headers.get(PROFILE_HEADER)
+        if token and settings.PROFILER_TOKEN:
+            return hmac.compare_digest(token, settings.PROFILER_TOKEN)
+
+        return None
+
+    def _save(self, request: HttpRequest, profiler: cProfile.Profile) -> str:
+        directory = Path(settings.PROFILER_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        path = re.sub(r"[^A-Za-z0-9]+", "_", request.path).strip("_")[:80]
+        profile_id = "-".join(
+            [
+                datetime.datetime.now(datetime.UTC).strftime("%Y%m%dT%H%M%S"),
+                request.method,
+                path or "root",
+                uuid.uuid4().hex[:8],
+            ]
+        )
+
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(directory / f"{profile_id}.prof")
+
+        with open(directory / f"{profile_id}.collapsed", "w") as collapsed:
+            root = cProfile.label(self.get_response.__code__)
+            for stack, microseconds in collapsed_stacks(stats, root):
+                collapsed.write(f"{stack} {microseconds}\n")
+
+        return profile_id
+
+
+def collapsed_stacks(
+    stats: pstats.Stats, root: Function
+) -> Iterator[Tuple[str, int]]:
+    """``"root;caller;callee" microseconds`` lines of self time under
+    ``root``, the function the profiler was started with.
+
+    cProfile only records caller -> callee edges, so deeper frames are
+    apportioned by the share of a function's time spent under each caller;
+    recursive calls are folded into the first frame and subtrees below
+    ``MIN_SHARE`` of the total are dropped."""
+    callees: Dict[Function, Dict[Function, Tuple[float, float]]] = {}
+
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, tt, ct) in callers.items():
+            callees.setdefault(caller, {})[function] = (tt, ct)
+
+    labels = {function: _label(function) for function in stats.stats}
+    stack: List[Function] = []
+
+    def walk(function: Function, tt: float, ct: float) -> Iterator[Tuple[str, int]]:
+        stack.append(function)
+        total = stats.stats[function][3]
+        share = ct / total if total else 0.0
+
+        if tt * 1e6 >= 1:
+            yield ";".join(labels[frame] for frame in stack), round(tt * 1e6)
+
+        if len(stack) < MAX_DEPTH:
+            for callee, (callee_tt, callee_ct) in callees.get(function, {}).items():
+                if callee_ct * share >= threshold and callee not in stack:
+                    yield from walk(callee, callee_tt * share, callee_ct * share)
+
+        stack.pop()
+
+    if root in stats.stats:
+        _, _, tt, ct, _ = stats.stats[root]
+        threshold = max(ct * MIN_SHARE, 1e-6)
+        yield from walk(root, tt, ct)
+
+
+def _label(function: Function) -> str:
+    filename, line, name = function
+    if filename == "~":
+        return name.replace(";", ",")
+    return f"{name} ({Path(filename).name}:{line})".replace(";", ",")
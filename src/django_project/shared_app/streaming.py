@@ -0,0 +1,36 @@
+from typing import Any, Iterable, Iterator
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+
+from src.django_project.shared_app.encoders import EncoderRegistry
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def ndjson_response(
+    items: Iterable[Any], presenter: type, buffer_size: int = 64 * 1024
+) -> StreamingHttpResponse:
+    """Stream ``items`` as newline-delimited JSON with the field layout of
+    ``presenter``. Lines are rendered exactly like the DRF JSON renderer
+    renders a single resource and written in ``buffer_size`` blocks."""
+    return StreamingHttpResponse(
+        _ndjson_lines(items, EncoderRegistry.get(presenter), buffer_size),
+        content_type=NDJSON_CONTENT_TYPE,
+    )
+
+
+def _ndjson_lines(items: Iterable[Any], encode, buffer_size: int) -> Iterator[bytes]:
+    renderer = JSONRenderer()
+    buffer = bytearray()
+
+    for item in items:
+        buffer += renderer.render(encode(item))
+        buffer += b"\n"
+
+        if len(buffer) >= buffer_size:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
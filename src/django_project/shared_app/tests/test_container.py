@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from src.core._shared.domain.repositories.unit_of_work_interface import IUnitOfWork
+from src.core.video.application.use_cases.list_videos import ListVideosUseCase
+from src.core.video.application.use_cases.upload_audio_video_media import (
+    UploadAudioVideoMediaUseCase,
+)
+from src.django_project.container import container
+from src.django_project.shared_app.container import Container
+
+
+class Dependency:
+    pass
+
+
+class TestContainer:
+
+    def setup_method(self):
+        self.container = Container()
+
+    def test_singleton_is_built_once(self):
+        self.container.singleton(Dependency, lambda c: Dependency())
+
+        assert self.container.resolve(Dependency) is self.container.resolve(Dependency)
+
+    def test_singleton_is_built_once_under_concurrency(self):
+        calls = []
+        barrier = threading.Barrier(8)
+
+        def provider(_):
+            calls.append(1)
+            return Dependency()
+
+        def resolve(_):
+            barrier.wait()
+            return self.container.resolve(Dependency)
+
+        self.container.singleton(Dependency, provider)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = set(map(id, executor.map(resolve, range(8))))
+
+        assert len(calls) == 1
+        assert len(instances) == 1
+
+    def test_factory_builds_a_new_instance_per_resolve(self):
+        self.container.factory(Dependency, lambda c: Dependency())
+
+        assert self.container.resolve(Dependency) is not self.container.resolve(
+            Dependency
+        )
+
+    def test_thread_scope_builds_one_instance_per_thread(self):
+        self.container.thread(Dependency, lambda c: Dependency())
+
+        main = self.container.resolve(Dependency)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(self.container.resolve, Dependency).result()
+
+        assert main is self.container.resolve(Dependency)
+        assert other is not main
+
+    def test_reset_drops_built_instances(self):
+        self.container.singleton(Dependency, lambda c: Dependency())
+        instance = self.container.resolve(Dependency)
+
+        self.container.reset()
+
+        assert self.container.resolve(Dependency) is not instance
+
+    def test_resolve_unregistered_key(self):
+        with pytest.raises(LookupError, match="Dependency is not registered"):
+            self.container.resolve(Dependency)
+
+
+class TestProjectContainer:
+
+    def test_stateless_use_cases_are_shared(self):
+        assert container.resolve(ListVideosUseCase) is container.resolve(
+            ListVideosUseCase
+        )
+
+    def test_unit_of_work_is_not_shared(self):
+        first = container.resolve(UploadAudioVideoMediaUseCase)
+        second = container.resolve(UploadAudioVideoMediaUseCase)
+
+        assert first.app_service.uow is not second.app_service.uow
+        assert first.video_repo is second.video_repo
+        assert container.resolve(IUnitOfWork) is not container.resolve(IUnitOfWork)
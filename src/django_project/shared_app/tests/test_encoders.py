@@ -0,0 +1,130 @@
+import datetime
+from decimal import Decimal
+import uuid
+
+import pytest
+from pydantic import TypeAdapter
+from rest_framework.renderers import JSONRenderer
+
+from src.core.cast_member.application.use_cases.common.cast_member_output import (
+    CastMemberOutput,
+)
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.category.application.use_cases.common.category_output import (
+    CategoryOutput,
+)
+from src.core.genre.application.use_cases.common.genre_output import GenreOutput
+from src.core.video.application.use_cases.common.video_output import VideoOutput
+from src.core.video.domain.audio_video_media import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.django_project.cast_member_app.presenters import CastMemberPresenter
+from src.django_project.category_app.presenters import CategoryPresenter
+from src.django_project.genre_app.presenters import GenrePresenter
+from src.django_project.shared_app.encoders import EncoderRegistry
+from src.django_project.video_app.presenters import VideoPresenter
+
+NOW = datetime.datetime.now(datetime.UTC)
+
+
+def video_output(**kwargs) -> VideoOutput:
+    return VideoOutput(
+        **{
+            "id": uuid.uuid4(),
+            "title": "Video",
+            "description": "Video description",
+            "launch_year": 2024,
+            "duration": Decimal("90.5"),
+            "rating": Rating.AGE_12,
+            "opened": True,
+            "published": False,
+            "categories_id": {str(uuid.uuid4()) for _ in range(20)},
+            "genres_id": {str(uuid.uuid4()) for _ in range(2)},
+            "cast_members_id": set(),
+            "banner": ImageMedia(name="banner.png", raw_location="banner.png"),
+            "thumbnail": None,
+            "thumbnail_half": None,
+            "trailer": None,
+            "video": AudioVideoMedia(
+                name="video.mp4",
+                raw_location="video.mp4",
+                encoded_location="",
+                status=MediaStatus.PENDING,
+                media_type=MediaType.VIDEO,
+            ),
+            "created_at": NOW,
+            **kwargs,
+        }
+    )
+
+
+OUTPUTS = [
+    pytest.param(
+        CategoryPresenter,
+        CategoryOutput(
+            id=uuid.uuid4(),
+            name="Movie",
+            description=None,
+            is_active=True,
+            created_at=NOW,
+        ),
+        id="category",
+    ),
+    pytest.param(
+        GenrePresenter,
+        GenreOutput(
+            id=uuid.uuid4(),
+            name="Drama",
+            categories_id={str(uuid.uuid4()) for _ in range(10)},
+            is_active=False,
+            created_at=NOW,
+        ),
+        id="genre",
+    ),
+    pytest.param(
+        CastMemberPresenter,
+        CastMemberOutput(
+            id=uuid.uuid4(), name="Actor", type="DIRECTOR", created_at=NOW
+        ),
+        id="cast member with str type",
+    ),
+    pytest.param(VideoPresenter, video_output(), id="video"),
+    pytest.param(
+        VideoPresenter,
+        video_output(rating="age_18", banner=None, video=None),
+        id="video with str rating and no media",
+    ),
+]
+
+
+@pytest.mark.filterwarnings("ignore::UserWarning")
+class TestEncoderRegistry:
+
+    @pytest.mark.parametrize("presenter, output", OUTPUTS)
+    def test_encoder_matches_pydantic_dump(self, presenter, output):
+        expected = TypeAdapter(presenter).dump_python(presenter.from_output(output))
+
+        encoded = EncoderRegistry.get(presenter)(output)
+
+        assert encoded == expected
+        assert list(encoded) == list(expected)
+        assert JSONRenderer().render(encoded) == JSONRenderer().render(expected)
+
+    def test_encoder_is_compiled_once_per_presenter(self):
+        assert EncoderRegistry.get(VideoPresenter) is EncoderRegistry.get(
+            VideoPresenter
+        )
+        assert EncoderRegistry.get(VideoPresenter) is not EncoderRegistry.get(
+            GenrePresenter
+        )
+
+    def test_encoder_coerces_enum_fields(self):
+        encoded = EncoderRegistry.get(CastMemberPresenter)(
+            CastMemberOutput(id=uuid.uuid4(), name="Actor", type="ACTOR", created_at=NOW)
+        )
+
+        assert encoded["type"] is CastMemberType.ACTOR
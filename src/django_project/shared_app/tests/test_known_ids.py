@@ -0,0 +1,179 @@
+import uuid
+
+from django.db import connection
+import pytest
+
+from src.core.category.domain.category import Category
+from src.django_project.category_app.models import CategoryModel
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.shared_app.known_ids import BloomFilter
+from src.django_project.shared_app.relations import DjangoRelationsLookup
+
+
+class TestBloomFilter:
+    def test_has_no_false_negatives_and_few_false_positives(self):
+        added = [uuid.uuid4() for _ in range(1000)]
+        bloom = BloomFilter(len(added), error_rate=0.01)
+        for key in added:
+            bloom.add(key)
+
+        assert all(key in bloom for key in added)
+        false_positives = sum(uuid.uuid4() in bloom for _ in range(10_000))
+        assert false_positives < 300
+
+
+@pytest.mark.django_db
+class TestKnownIds:
+    @pytest.fixture(autouse=True)
+    def setup(self, shared_cache):
+        # A new cache means new generations: every process-local state
+        # starts over.
+        self.repository = CategoryDjangoRepository()
+        self.category = Category(name="Movie")
+        self.repository.insert(self.category)
+        self.category_id = self.category.id.value
+
+    def test_known_ids_need_no_query_once_committed(
+        self, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            self.repository.exists_by_id([self.category_id])
+
+        with django_assert_num_queries(0):
+            result = self.repository.exists_by_id([self.category_id])
+
+        assert result == {"exists": [self.category_id], "not_exists": []}
+
+    def test_ids_found_in_an_open_transaction_are_not_remembered(
+        self, django_assert_num_queries
+    ):
+        self.repository.exists_by_id([self.category_id])
+
+        with django_assert_num_queries(1):
+            self.repository.exists_by_id([self.category_id])
+
+    def test_the_bloom_filter_rules_out_absent_ids_without_a_query(
+        self, django_assert_num_queries
+    ):
+        missing_id = uuid.uuid4()
+        self.repository.exists_by_id([missing_id])
+
+        with django_assert_num_queries(0):
+            result = self.repository.exists_by_id([missing_id])
+
+        assert result == {"exists": [], "not_exists": [missing_id]}
+
+    @pytest.mark.parametrize("via", ["insert", "bulk_insert", "objects.create"])
+    def test_rows_added_after_the_filter_was_built_are_found(self, via):
+        self.repository.exists_by_id([uuid.uuid4()])
+
+        category = Category(name="Documentary")
+        if via == "insert":
+            self.repository.insert(category)
+        elif via == "bulk_insert":
+            self.repository.bulk_insert([category])
+        else:
+            CategoryModel.objects.create(id=category.id.value, name=category.name)
+
+        result = self.repository.exists_by_id([category.id.value])
+
+        assert result == {"exists": [category.id.value], "not_exists": []}
+
+    def test_deleted_ids_are_forgotten(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            self.repository.exists_by_id([self.category_id])
+
+        self.repository.delete(self.category_id)
+
+        result = self.repository.exists_by_id([self.category_id])
+        assert result == {"exists": [], "not_exists": [self.category_id]}
+
+    def test_keeps_at_most_the_configured_number_of_ids(
+        self, settings, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        settings.KNOWN_IDS_CACHE_SIZE = 1
+        other = Category(name="Documentary")
+        self.repository.insert(other)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.repository.exists_by_id([self.category_id])
+            self.repository.exists_by_id([other.id.value])
+
+        with django_assert_num_queries(0):
+            self.repository.exists_by_id([other.id.value])
+        with django_assert_num_queries(1):
+            self.repository.exists_by_id([self.category_id])
+
+    def test_known_ids_expire(
+        self, settings, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        settings.KNOWN_IDS_CACHE_TIMEOUT = -1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.repository.exists_by_id([self.category_id])
+
+        # Expired: the filter is rebuilt and the id looked up again.
+        with django_assert_num_queries(2):
+            self.repository.exists_by_id([self.category_id])
+
+    def test_relations_lookup_skips_the_query_for_known_and_absent_ids(
+        self, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        lookup = DjangoRelationsLookup(
+            {Category: CategoryModel},
+            known_ids={Category: CategoryDjangoRepository.known_ids},
+        )
+        missing_id = uuid.uuid4()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            lookup.find_missing({Category: {self.category_id, missing_id}})
+
+        with django_assert_num_queries(0):
+            missing = lookup.find_missing({Category: {self.category_id, missing_id}})
+
+        assert missing == {Category: {missing_id}}
+
+    def test_rows_inserted_with_raw_sql_are_seen_once_added(self):
+        self.repository.exists_by_id([uuid.uuid4()])
+        category_id = uuid.uuid4()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO categories (id, name, description, is_active, created_at)"
+                " VALUES (%s, 'Raw', '', 1, CURRENT_TIMESTAMP)",
+                [category_id.hex],
+            )
+
+        CategoryDjangoRepository.known_ids.added()
+
+        result = self.repository.exists_by_id([category_id])
+        assert result == {"exists": [category_id], "not_exists": []}
+
+    def test_tables_over_the_bloom_limit_are_not_rescanned_on_every_insert(
+        self, settings, django_assert_num_queries
+    ):
+        settings.KNOWN_IDS_BLOOM_MAX_ROWS = 0
+        self.repository.exists_by_id([uuid.uuid4()])
+        self.repository.insert(Category(name="Documentary"))
+
+        # Only the lookup itself: the table is still known to be too big.
+        with django_assert_num_queries(1):
+            self.repository.exists_by_id([uuid.uuid4()])
+
+
+@pytest.mark.django_db
+class TestKnownIdsWithoutASharedCache:
+    def test_every_id_is_looked_up(self, django_assert_num_queries):
+        repository = CategoryDjangoRepository()
+        category_id = uuid.uuid4()
+        repository.exists_by_id([category_id])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO categories (id, name, description, is_active, created_at)"
+                " VALUES (%s, 'Raw', '', 1, CURRENT_TIMESTAMP)",
+                [category_id.hex],
+            )
+
+        with django_assert_num_queries(1):
+            result = repository.exists_by_id([category_id])
+
+        assert result == {"exists": [category_id], "not_exists": []}
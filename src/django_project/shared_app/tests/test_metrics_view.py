@@ -0,0 +1,24 @@
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    def test_exposes_use_case_and_repository_metrics(self):
+        client = APIClient()
+        client.get("/api/categories/")
+
+        response = client.get("/metrics")
+
+        text = response.content.decode()
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert 'usecase_duration_seconds_count{use_case="ListCategoriesUseCase"}' in text
+        assert (
+            "repository_duration_seconds_count"
+            '{method="search",repository="CategoryDjangoRepository"}'
+        ) in text
+        assert 'usecase_in_progress{use_case="ListCategoriesUseCase"} 0' in text
+
+    def test_only_accepts_get(self):
+        assert APIClient().post("/metrics").status_code == 405
@@ -0,0 +1,94 @@
+import pstats
+import threading
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from rest_framework.test import APIClient
+
+from src.core.category.domain.category import Category
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.shared_app import profiling
+from src.django_project.shared_app.profiling import ProfilerMiddleware
+
+
+@pytest.mark.django_db
+class TestProfilerMiddleware:
+    def setup_method(self):
+        CategoryDjangoRepository().insert(Category(name="Movie"))
+
+    def test_profiles_requests_sending_the_token(self, tmp_path):
+        with override_settings(PROFILER_DIR=str(tmp_path), PROFILER_TOKEN="secret"):
+            response = APIClient().get("/api/categories/", HTTP_X_PROFILE="secret")
+
+        profile_id = response["X-Profile-Id"]
+        assert response.status_code == 200
+        assert profile_id.endswith(
+            "-GET-api_categories-" + profile_id.rsplit("-", 1)[-1]
+        )
+
+        stats = pstats.Stats(str(tmp_path / f"{profile_id}.prof"))
+        assert any(name == "list" for _, _, name in stats.stats)
+
+        lines = (tmp_path / f"{profile_id}.collapsed").read_text().splitlines()
+        assert lines
+        assert any("list (views.py:" in line for line in lines)
+        for line in lines:
+            stack, microseconds = line.rsplit(" ", 1)
+            assert stack and int(microseconds) > 0
+
+    def test_ignores_a_wrong_token(self, tmp_path):
+        with override_settings(PROFILER_DIR=str(tmp_path), PROFILER_TOKEN="secret"):
+            response = APIClient().get("/api/categories/", HTTP_X_PROFILE="guess")
+
+        assert not response.has_header("X-Profile-Id")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_profiles_sampled_requests(self, tmp_path):
+        with override_settings(PROFILER_DIR=str(tmp_path), PROFILER_SAMPLE_RATE=1.0):
+            response = APIClient().get("/api/categories/")
+
+        assert (tmp_path / f"{response['X-Profile-Id']}.prof").exists()
+
+    def test_does_nothing_without_a_directory(self, tmp_path):
+        with override_settings(PROFILER_TOKEN="secret", PROFILER_SAMPLE_RATE=1.0):
+            response = APIClient().get("/api/categories/", HTTP_X_PROFILE="secret")
+
+        assert not response.has_header("X-Profile-Id")
+
+
+class TestProfilerMiddlewareConcurrency:
+    def middleware(self, seen):
+        def get_response(request):
+            seen.append(request)
+            return HttpResponse()
+
+        return ProfilerMiddleware(get_response)
+
+    def test_sampled_requests_go_through_while_another_is_profiled(self, tmp_path):
+        seen = []
+        request = RequestFactory().get("/")
+
+        with override_settings(PROFILER_DIR=str(tmp_path), PROFILER_SAMPLE_RATE=1.0):
+            with profiling._profiling:
+                response = self.middleware(seen)(request)
+
+        assert seen == [request]
+        assert not response.has_header("X-Profile-Id")
+
+    def test_requests_sending_the_token_wait_their_turn(self, tmp_path):
+        seen = []
+        request = RequestFactory().get("/", HTTP_X_PROFILE="secret")
+        responses = []
+
+        with override_settings(PROFILER_DIR=str(tmp_path), PROFILER_TOKEN="secret"):
+            with profiling._profiling:
+                thread = threading.Thread(
+                    target=lambda: responses.append(self.middleware(seen)(request))
+                )
+                thread.start()
+                thread.join(0.1)
+                assert seen == []
+            thread.join()
+
+        assert (tmp_path / f"{responses[0]['X-Profile-Id']}.prof").exists()
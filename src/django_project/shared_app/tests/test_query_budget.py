@@ -0,0 +1,48 @@
+import logging
+
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from src.core.category.domain.category import Category
+from src.django_project.category_app.repository import CategoryDjangoRepository
+
+
+@pytest.mark.django_db
+class TestQueryBudgetMiddleware:
+    def setup_method(self):
+        self.category = Category(name="Movie")
+        CategoryDjangoRepository().insert(self.category)
+
+    def test_reports_queries_in_response_headers(self):
+        response = APIClient().get("/api/categories/", {"count": "exact"})
+
+        assert response["X-DB-Queries"] == "2"
+        assert response["Server-Timing"].startswith("db;dur=")
+        assert response["Server-Timing"].endswith('desc="2 queries"')
+
+    def test_counts_are_per_request(self):
+        client = APIClient()
+        client.get("/api/categories/", {"count": "exact"})
+
+        response = client.get(f"/api/categories/{self.category.id}/")
+
+        assert response["X-DB-Queries"] == "1"
+
+    @override_settings(QUERY_BUDGETS={"category.list": 1})
+    def test_logs_requests_over_the_budget_of_their_action(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            APIClient().get("/api/categories/", {"count": "exact"})
+            APIClient().get(f"/api/categories/{self.category.id}/")
+
+        [record] = caplog.records
+        assert record.getMessage().startswith(
+            "GET /api/categories/ (category.list) ran 2 queries"
+        )
+
+    @override_settings(QUERY_BUDGETS={}, QUERY_BUDGET_DEFAULT=None)
+    def test_does_not_log_without_a_budget(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            APIClient().get("/api/categories/", {"count": "exact"})
+
+        assert caplog.records == []
@@ -0,0 +1,158 @@
+import itertools
+import re
+import uuid
+from typing import Any, Callable, Dict, List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.core._shared.domain.repositories.cursor import Cursor
+from src.core.cast_member.domain.cast_member_repository import (
+    CastMemberFilter,
+    CastMemberSearchParams,
+)
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.category.domain.category_repository import CategorySearchParams
+from src.core.genre.domain.genre_repository import GenreFilter, GenreSearchParams
+from src.core.video.domain.video_repository import VideoFilter, VideoSearchParams
+from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.genre_app.repository import GenreDjangoRepository
+from src.django_project.video_app.listing import VideoListingDjangoRepository
+from src.django_project.video_app.repository import VideoDjangoRepository
+
+# "SCAN video" reads every row of the table; "SCAN video USING INDEX ..." walks
+# an index in the requested order and stops at the LIMIT.
+FULL_SCAN = re.compile(r"\bSCAN (\w+)$")
+TEMP_SORT = re.compile(r"USE TEMP B-TREE")
+# No B-tree index can answer a substring match, so counting one reads every
+# row whichever access path the planner picks.
+SUBSTRING_MATCH = re.compile(r"LIKE '%")
+
+RELATION_ID = str(uuid.uuid4())
+CURSOR_VALUES = {"created_at": "2024-01-01T00:00:00+00:00", "name": "m", "title": "m"}
+
+
+def plans(search: Callable[[], object]) -> List[tuple[str, List[str]]]:
+    """Run ``search`` and return every SELECT it issued with its plan lines."""
+    with CaptureQueriesContext(connection) as queries:
+        search()
+
+    result = []
+    with connection.cursor() as cursor:
+        for query in queries.captured_queries:
+            if not query["sql"].startswith("SELECT"):
+                continue
+            cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+            result.append((query["sql"], [row[3] for row in cursor.fetchall()]))
+
+    return result
+
+
+def assert_indexed(search: Callable[[], object]) -> None:
+    """Fail on a full table scan, or on a temp B-tree sort over rows that
+    were not first narrowed down through an index (a relation lookup or the
+    FTS5 table), i.e. a sort of the whole table."""
+    for sql, plan in plans(search):
+        narrowed = plan[0].startswith("SEARCH") or "VIRTUAL TABLE" in plan[0]
+
+        for line in plan:
+            if not SUBSTRING_MATCH.search(sql):
+                assert not FULL_SCAN.search(line), f"full scan: {line}\n{sql}"
+            if not narrowed:
+                assert not TEMP_SORT.search(line), f"temp sort: {line}\n{sql}"
+
+
+def variants(sortable: List[str], filters: Dict[str, Any]):
+    """Every sort, direction, filter and pagination mode of a search."""
+    for sort, sort_dir, (label, _filter), cursor in itertools.product(
+        [None, *sortable], ["asc", "desc"], filters.items(), [False, True]
+    ):
+        position = sort or "created_at"
+        params = dict(
+            init_sort=sort,
+            init_sort_dir=sort_dir,
+            init_filter=_filter,
+            init_cursor=(
+                Cursor(position, CURSOR_VALUES[position], RELATION_ID).encode()
+                if cursor
+                else None
+            ),
+            init_count="exact",
+        )
+        yield pytest.param(
+            params,
+            id=f"{sort or 'default'}-{sort_dir}-{label}-{'cursor' if cursor else 'page'}",
+        )
+
+
+@pytest.mark.django_db
+class TestSearchQueryPlans:
+    @pytest.mark.parametrize(
+        "variant",
+        list(variants(["name", "created_at"], {"all": None, "name": "action"})),
+    )
+    def test_category_search(self, variant):
+        repository = CategoryDjangoRepository()
+
+        assert_indexed(lambda: repository.search(CategorySearchParams(**variant)))
+
+    @pytest.mark.parametrize(
+        "variant",
+        list(
+            variants(
+                ["name", "created_at"],
+                {
+                    "all": None,
+                    "name": GenreFilter(name="drama"),
+                    "categories": GenreFilter(categories_id={RELATION_ID}),
+                },
+            )
+        ),
+    )
+    def test_genre_search(self, variant):
+        repository = GenreDjangoRepository()
+
+        assert_indexed(lambda: repository.search(GenreSearchParams(**variant)))
+
+    @pytest.mark.parametrize(
+        "variant",
+        list(
+            variants(
+                ["name", "created_at"],
+                {
+                    "all": None,
+                    "name": CastMemberFilter(name="bento"),
+                    "type": CastMemberFilter(type=CastMemberType.ACTOR),
+                },
+            )
+        ),
+    )
+    def test_cast_member_search(self, variant):
+        repository = CastMemberDjangoRepository()
+
+        assert_indexed(lambda: repository.search(CastMemberSearchParams(**variant)))
+
+    @pytest.mark.parametrize(
+        "variant",
+        list(
+            variants(
+                ["title", "created_at"],
+                {
+                    "all": None,
+                    "title": VideoFilter(title="star"),
+                    "categories": VideoFilter(categories_id={RELATION_ID}),
+                    "genres": VideoFilter(genres_id={RELATION_ID}),
+                    "cast_members": VideoFilter(cast_members_id={RELATION_ID}),
+                },
+            )
+        ),
+    )
+    @pytest.mark.parametrize(
+        "repository_class", [VideoDjangoRepository, VideoListingDjangoRepository]
+    )
+    def test_video_search(self, repository_class, variant):
+        repository = repository_class()
+
+        assert_indexed(lambda: repository.search(VideoSearchParams(**variant)))
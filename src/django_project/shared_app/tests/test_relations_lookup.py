@@ -0,0 +1,83 @@
+import uuid
+
+import pytest
+
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.django_project.cast_member_app.models import CastMemberModel
+from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
+from src.django_project.category_app.models import CategoryModel
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.genre_app.models import GenreModel
+from src.django_project.genre_app.repository import GenreDjangoRepository
+from src.django_project.shared_app.relations import DjangoRelationsLookup
+
+
+@pytest.mark.django_db
+class TestDjangoRelationsLookup:
+    def setup_method(self):
+        self.category = Category(name="Movie")
+        CategoryDjangoRepository().insert(self.category)
+        self.genre = Genre(name="Drama", categories_id={self.category.id})
+        GenreDjangoRepository().insert(self.genre)
+        self.cast_member = CastMember(name="John", type=CastMemberType.ACTOR)
+        CastMemberDjangoRepository().insert(self.cast_member)
+
+        self.lookup = DjangoRelationsLookup(
+            {
+                Category: CategoryModel,
+                Genre: GenreModel,
+                CastMember: CastMemberModel,
+            }
+        )
+
+    def test_resolves_every_relation_in_one_query(self, django_assert_num_queries):
+        missing_category = uuid.uuid4()
+        missing_cast_member = uuid.uuid4()
+
+        with django_assert_num_queries(1):
+            missing = self.lookup.find_missing(
+                {
+                    Category: {self.category.id.value, missing_category},
+                    Genre: {self.genre.id.value},
+                    CastMember: {self.cast_member.id.value, missing_cast_member},
+                }
+            )
+
+        assert missing == {
+            Category: {missing_category},
+            Genre: set(),
+            CastMember: {missing_cast_member},
+        }
+
+    def test_ids_are_not_matched_across_relations(self):
+        missing = self.lookup.find_missing(
+            {Category: {self.genre.id.value}, Genre: {self.category.id.value}}
+        )
+
+        assert missing == {
+            Category: {self.genre.id.value},
+            Genre: {self.category.id.value},
+        }
+
+    def test_accepts_value_objects_strings_and_malformed_ids(
+        self, django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            missing = self.lookup.find_missing(
+                {
+                    Category: {self.category.id},
+                    Genre: {str(self.genre.id), "not-a-uuid"},
+                    CastMember: set(),
+                }
+            )
+
+        assert missing == {Category: set(), Genre: {"not-a-uuid"}, CastMember: set()}
+
+    def test_skips_the_query_when_nothing_is_requested(
+        self, django_assert_num_queries
+    ):
+        with django_assert_num_queries(0):
+            assert self.lookup.find_missing({Category: set()}) == {Category: set()}
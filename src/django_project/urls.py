@@ -20,10 +20,11 @@ from django.urls import path, include
 
 from rest_framework.routers import DefaultRouter
 
-from src.django_project.video_app.views import VideoViewSet
+from src.django_project.video_app.views import VideoUploadViewSet, VideoViewSet
 from src.django_project.cast_member_app.views import CastMemberViewSet
 from src.django_project.genre_app.views import GenreViewSet
 from src.django_project.category_app.views import CategoryViewSet
+from src.django_project.shared_app.metrics import metrics_view
 
 
 class CustomRouter(DefaultRouter):
@@ -37,9 +38,15 @@ router.register(r"api/categories", CategoryViewSet, basename="category")
 router.register(r"api/genres", GenreViewSet, basename="genre")
 router.register(r"api/cast-members", CastMemberViewSet, basename="cast_member")
 router.register(r"api/videos", VideoViewSet, basename="videos")
+router.register(
+    r"api/videos/(?P<video_pk>[^/.]+)/uploads",
+    VideoUploadViewSet,
+    basename="video_uploads",
+)
 
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", metrics_view, name="metrics"),
     path("", include(router.urls)),
 ] + router.urls
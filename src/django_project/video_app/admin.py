@@ -7,16 +7,30 @@ from src.django_project.video_app.models import (
 )
 
 
-# Register your models here.
-class VideoAdmin(admin.ModelAdmin):
+class ReadOnlyAdmin(admin.ModelAdmin):
+    """Videos and their media are written through the API only: the video
+    repository keeps the ``video_listing`` read model in step with each
+    write, and saving the models here would leave it stale."""
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+class VideoAdmin(ReadOnlyAdmin):
     pass
 
 
-class AudioVideoMediaAdmin(admin.ModelAdmin):
+class AudioVideoMediaAdmin(ReadOnlyAdmin):
     pass
 
 
-class ImageMediaAdmin(admin.ModelAdmin):
+class ImageMediaAdmin(ReadOnlyAdmin):
     pass
 
 
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class VideoAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'src.django_project.video_app'
+
+    def ready(self):
+        from src.django_project.video_app import signals
+
+        signals.connect()
@@ -0,0 +1,143 @@
+from itertools import islice
+from typing import Iterable, List
+import uuid
+
+from django.db import transaction
+
+from src.core._shared.domain.repositories.search_params import SortDirection
+from src.core.video.application.use_cases.common.video_output import VideoOutput
+from src.core.video.domain.video import Video, VideoId
+from src.core.video.domain.video_repository import (
+    IVideoListingRepository,
+    VideoSearchParams,
+    VideoListingSearchResult,
+)
+from src.django_project.shared_app.count_cache import CountCache
+from src.django_project.shared_app.encoders import EncoderRegistry
+from src.django_project.shared_app.pagination import (
+    ordering_for,
+    paginate_by_cursor,
+    paginate_by_page,
+)
+from src.django_project.shared_app.relations import linked_to
+from src.django_project.video_app.models import VideoListingModel, VideoModel
+from src.django_project.video_app.presenters import VideoPresenter
+from src.django_project.video_app.search_index import VideoSearchIndex
+
+# Listing rows share their ids with videos, so relation filters read the
+# video M2M tables.
+RELATION_FILTERS = {
+    "categories_id": VideoModel.categories,
+    "genres_id": VideoModel.genres,
+    "cast_members_id": VideoModel.cast_members,
+}
+
+
+class VideoListingProjection:
+    """Writes ``video_listing`` rows from video aggregates. Callers run it in
+    the same transaction as the write to the videos table."""
+
+    def save(self, videos: Iterable[Video]) -> None:
+        VideoListingModel.objects.bulk_create(
+            [self._to_model(video) for video in videos],
+            update_conflicts=True,
+            unique_fields=["id"],
+            update_fields=["title", "created_at", "document"],
+        )
+
+    def delete(self, video_ids: Iterable[VideoId | uuid.UUID]) -> None:
+        VideoListingModel.objects.filter(id__in=list(video_ids)).delete()
+
+    def rebuild(self, videos: Iterable[Video], batch_size: int = 500) -> int:
+        """Replace the whole table with rows built from ``videos``."""
+        total = 0
+        videos = iter(videos)
+
+        with transaction.atomic():
+            VideoListingModel.objects.all().delete()
+
+            while batch := list(islice(videos, batch_size)):
+                self.save(batch)
+                total += len(batch)
+
+        return total
+
+    def _to_model(self, video: Video) -> VideoListingModel:
+        return VideoListingModel(
+            id=video.id.value,
+            title=video.title,
+            created_at=video.created_at,
+            document=EncoderRegistry.get(VideoPresenter)(
+                VideoOutput.from_entity(video)
+            ),
+        )
+
+
+class VideoListingDjangoRepository(IVideoListingRepository):
+    sortable_fields: List[str] = ["title", "created_at"]
+    count_cache = CountCache("video_listing")
+    search_index = VideoSearchIndex()
+
+    def search(self, props: VideoSearchParams) -> VideoListingSearchResult:
+        query = VideoListingModel.objects.only("id", "title", "created_at", "document")
+
+        if props.filter:
+            if props.filter.title:
+                query = self.search_index.filter(query, props.filter.title)
+
+            for field, relation in RELATION_FILTERS.items():
+                ids = getattr(props.filter, field)
+                if ids:
+                    query = query.filter(linked_to(relation, self._valid_ids(ids)))
+
+        if props.sort and props.sort in self.sortable_fields:
+            sort, sort_dir = props.sort, props.sort_dir
+        else:
+            sort, sort_dir = "created_at", SortDirection.DESC
+
+        if props.is_cursor_mode:
+            page, next_cursor = paginate_by_cursor(
+                query, sort, sort_dir, props.cursor, props.per_page
+            )
+
+            return VideoListingSearchResult(
+                items=[model.document for model in page],
+                total=self.count_cache.count(query, props),
+                current_page=props.page,
+                per_page=props.per_page,
+                cursor=props.cursor,
+                next_cursor=next_cursor,
+                count=props.count,
+            )
+
+        # Title matches come back by relevance unless a sort was asked for.
+        if props.sort not in self.sortable_fields and self.search_index.is_ranked(
+            query
+        ):
+            query = self.search_index.order_by_rank(query)
+        else:
+            query = query.order_by(*ordering_for(sort, sort_dir))
+
+        page = paginate_by_page(query, props.page, props.per_page)
+
+        return VideoListingSearchResult(
+            items=[model.document for model in page],
+            total=self.count_cache.count(query, props),
+            current_page=props.page,
+            per_page=props.per_page,
+            count=props.count,
+        )
+
+    def _valid_ids(self, entity_ids: Iterable[str] | str) -> List[uuid.UUID]:
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+
+        valid_ids = []
+
+        for entity_id in entity_ids:
+            try:
+                valid_ids.append(uuid.UUID(str(entity_id)))
+            except ValueError:
+                continue
+
+        return valid_ids
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from src.core.video.application.use_cases.purge_expired_upload_sessions import (
+    PurgeExpiredUploadSessionsInput,
+    PurgeExpiredUploadSessionsUseCase,
+)
+from src.django_project.container import container
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes upload sessions older than UPLOAD_SESSION_TIMEOUT and their '
+        'spool files, and spool files left without a session'
+    )
+
+    def handle(self, *args, **options):
+        output = container.resolve(PurgeExpiredUploadSessionsUseCase).execute(
+            PurgeExpiredUploadSessionsInput()
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Purged {output.sessions} upload sessions and '
+                f'{output.orphaned_files} orphaned spool files'
+            )
+        )
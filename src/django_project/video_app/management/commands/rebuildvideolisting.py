@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from src.django_project.video_app.repository import VideoDjangoRepository
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the video_listing read model from the videos table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=settings.EXPORT_CHUNK_SIZE
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        repository = VideoDjangoRepository()
+
+        total = repository.listing.rebuild(
+            repository.stream_all(chunk_size=chunk_size), batch_size=chunk_size
+        )
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt video_listing: {total} videos'))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from src.django_project.video_app.search_index import VideoSearchIndex
+
+
+class Command(BaseCommand):
+    help = (
+        'Rebuilds the video_search full-text index from the videos table '
+        '(needed after writing to it with the triggers dropped)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        index = VideoSearchIndex()
+
+        if not index.enabled(options['database']):
+            raise CommandError('Full-text search is only available on SQLite')
+
+        index.rebuild(options['database'])
+
+        self.stdout.write(self.style.SUCCESS('Rebuilt video_search'))
@@ -0,0 +1,27 @@
+# Generated by Django 5.1 on 2026-10-18 16:57
+
+import rest_framework.utils.encoders
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoListingModel',
+            fields=[
+                ('id', models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('document', models.JSONField(encoder=rest_framework.utils.encoders.JSONEncoder)),
+            ],
+            options={
+                'db_table': 'video_listing',
+                'indexes': [models.Index(fields=['created_at', 'id'], name='video_listing_created_idx'), models.Index(fields=['title', 'id'], name='video_listing_title_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+from django.db import migrations
+
+# External-content FTS5 index over video.title/description, keyed by the
+# video rowid and maintained by triggers so every write path stays in sync.
+# Only created on SQLite; other backends keep using icontains.
+FORWARD = [
+    """
+    CREATE VIRTUAL TABLE video_search USING fts5(
+        title,
+        description,
+        content='video',
+        content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER video_search_after_insert AFTER INSERT ON video BEGIN
+        INSERT INTO video_search(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER video_search_after_delete AFTER DELETE ON video BEGIN
+        INSERT INTO video_search(video_search, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER video_search_after_update AFTER UPDATE OF title, description
+    ON video BEGIN
+        INSERT INTO video_search(video_search, rowid, title, description)
+        VALUES ('delete', old.rowid, old.title, old.description);
+        INSERT INTO video_search(rowid, title, description)
+        VALUES (new.rowid, new.title, new.description);
+    END
+    """,
+    # Rank title hits well above description hits.
+    "INSERT INTO video_search(video_search, rank) VALUES ('rank', 'bm25(10.0, 1.0)')",
+    "INSERT INTO video_search(video_search) VALUES ('rebuild')",
+]
+
+BACKWARD = [
+    "DROP TRIGGER IF EXISTS video_search_after_update",
+    "DROP TRIGGER IF EXISTS video_search_after_delete",
+    "DROP TRIGGER IF EXISTS video_search_after_insert",
+    "DROP TABLE IF EXISTS video_search",
+]
+
+
+def run(statements):
+    def apply(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0002_videolistingmodel'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(FORWARD), run(BACKWARD)),
+    ]
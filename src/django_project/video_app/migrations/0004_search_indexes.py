@@ -0,0 +1,38 @@
+# Generated by Django 5.1 on 2026-10-18 17:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0003_video_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='videomodel',
+            index=models.Index(fields=['created_at', 'id'], name='video_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videomodel',
+            index=models.Index(fields=['title', 'id'], name='video_title_idx'),
+        ),
+        # Videos of a category/genre/cast member, answered from the index
+        # alone (see genre_app 0002).
+        migrations.RunSQL(
+            'CREATE INDEX video_categories_reverse_idx '
+            'ON video_categories (categorymodel_id, videomodel_id)',
+            'DROP INDEX video_categories_reverse_idx',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX video_genres_reverse_idx '
+            'ON video_genres (genremodel_id, videomodel_id)',
+            'DROP INDEX video_genres_reverse_idx',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX video_cast_members_reverse_idx '
+            'ON video_cast_members (castmembermodel_id, videomodel_id)',
+            'DROP INDEX video_cast_members_reverse_idx',
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1 on 2026-10-18 17:31
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0004_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadSessionModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('field', models.CharField(choices=[('video', 'video'), ('trailer', 'trailer')], max_length=16)),
+                ('file_name', models.CharField(max_length=255)),
+                ('content_type', models.CharField(blank=True, max_length=255)),
+                ('length', models.BigIntegerField()),
+                ('offset', models.BigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='upload_sessions', to='video_app.videomodel')),
+            ],
+            options={
+                'db_table': 'video_upload_session',
+            },
+        ),
+    ]
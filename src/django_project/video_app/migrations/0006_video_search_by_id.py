@@ -0,0 +1,95 @@
+from importlib import import_module
+
+from django.db import migrations
+
+# 0003 keyed video_search on video.rowid, which SQLite may renumber on VACUUM
+# and which changes whenever the table is rebuilt. The index now stores the
+# video id: video_search_key hands out a stable integer per video for the
+# FTS5 rowid, so the triggers reach a video's entry through an indexed
+# lookup, and searches join on video_search.video_id.
+FORWARD = [
+    "DROP TRIGGER IF EXISTS video_search_after_update",
+    "DROP TRIGGER IF EXISTS video_search_after_delete",
+    "DROP TRIGGER IF EXISTS video_search_after_insert",
+    "DROP TABLE IF EXISTS video_search",
+    """
+    CREATE TABLE video_search_key (
+        id INTEGER PRIMARY KEY,
+        video_id char(32) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE video_search USING fts5(
+        video_id UNINDEXED,
+        title,
+        description,
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER video_search_after_insert AFTER INSERT ON video BEGIN
+        INSERT INTO video_search_key(video_id) VALUES (new.id);
+        INSERT INTO video_search(rowid, video_id, title, description)
+        SELECT id, new.id, new.title, new.description
+        FROM video_search_key WHERE video_id = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER video_search_after_delete AFTER DELETE ON video BEGIN
+        DELETE FROM video_search WHERE rowid = (
+            SELECT id FROM video_search_key WHERE video_id = old.id
+        );
+        DELETE FROM video_search_key WHERE video_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER video_search_after_update AFTER UPDATE OF title, description
+    ON video BEGIN
+        UPDATE video_search SET title = new.title, description = new.description
+        WHERE rowid = (SELECT id FROM video_search_key WHERE video_id = new.id);
+    END
+    """,
+    # Rank title hits well above description hits; video_id is not indexed.
+    "INSERT INTO video_search(video_search, rank) "
+    "VALUES ('rank', 'bm25(0.0, 10.0, 1.0)')",
+    "INSERT INTO video_search_key(video_id) SELECT id FROM video",
+    """
+    INSERT INTO video_search(rowid, video_id, title, description)
+    SELECT video_search_key.id, video.id, video.title, video.description
+    FROM video_search_key JOIN video ON video.id = video_search_key.video_id
+    """,
+]
+
+BACKWARD = [
+    "DROP TRIGGER IF EXISTS video_search_after_update",
+    "DROP TRIGGER IF EXISTS video_search_after_delete",
+    "DROP TRIGGER IF EXISTS video_search_after_insert",
+    "DROP TABLE IF EXISTS video_search",
+    "DROP TABLE IF EXISTS video_search_key",
+    *import_module(
+        "src.django_project.video_app.migrations.0003_video_search"
+    ).FORWARD,
+]
+
+
+def run(statements):
+    def apply(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('video_app', '0005_upload_session'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(FORWARD), run(BACKWARD)),
+    ]
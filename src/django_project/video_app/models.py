@@ -5,6 +5,7 @@ from django.db import models
 from uuid import uuid4
 
 from django.db import models
+from rest_framework.utils.encoders import JSONEncoder
 
 from src.core.video.domain.audio_video_media import MediaStatus, Rating
 from src.django_project.cast_member_app.models import CastMemberModel
@@ -65,6 +66,10 @@ class VideoModel(models.Model):
     class Meta:
         db_table = "video"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="video_created_idx"),
+            models.Index(fields=["title", "id"], name="video_title_idx"),
+        ]
 
 
 class ImageMediaModel(models.Model):
@@ -85,3 +90,44 @@ class AudioVideoMediaModel(models.Model):
     status = models.CharField(
         max_length=255, choices=STATUS_CHOICES, default=MediaStatus.PENDING.value
     )
+
+
+class VideoListingModel(models.Model):
+    """Read model for the video list: one row per video holding its encoded
+    list representation, plus the columns the list sorts on. It shares its
+    ids with ``VideoModel``, so relation filters go through the video M2M
+    tables."""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    title = models.CharField(max_length=255)
+    created_at = models.DateTimeField()
+    document = models.JSONField(encoder=JSONEncoder)
+
+    class Meta:
+        db_table = "video_listing"
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="video_listing_created_idx"),
+            models.Index(fields=["title", "id"], name="video_listing_title_idx"),
+        ]
+
+
+class UploadSessionModel(models.Model):
+    """A resumable upload of a video or trailer file. Chunks are appended to
+    a spool file named after the session; ``offset`` is how many bytes of
+    ``length`` have been written so far."""
+
+    FIELD_CHOICES = [("video", "video"), ("trailer", "trailer")]
+
+    id = models.UUIDField(primary_key=True, editable=False, default=uuid4)
+    video = models.ForeignKey(
+        VideoModel, related_name="upload_sessions", on_delete=models.CASCADE
+    )
+    field = models.CharField(max_length=16, choices=FIELD_CHOICES)
+    file_name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=255, blank=True)
+    length = models.BigIntegerField()
+    offset = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "video_upload_session"
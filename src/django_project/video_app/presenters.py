@@ -66,10 +66,8 @@ class VideoPresenter(ResourcePresenter):
 class VideoCollectionPresenter(CollectionPresenter):
     output: ListVideosOutput
 
-    def __post_init__(self):
-        self.data = [
-            VideoPresenter.from_output(item)  # Passar o objeto item diretamente
-            for item in self.output.items
-        ]
+    item_presenter = VideoPresenter
 
+    def __post_init__(self):
+        self.data = self.output.items
         self.pagination = self.output
@@ -1,11 +1,11 @@
-from typing import Dict,List, Set
+from typing import Dict, Iterator, List, Set, Tuple
 import uuid
 
-from django.core.paginator import Paginator
-from django.db import models
+from django.db import models, transaction
 
 from src.core._shared.domain.repositories.search_params import SortDirection
 from src.core._shared.domain.exceptions import NotFoundException
+from src.core.video.domain.audio_video_media import AudioVideoMedia, ImageMedia
 from src.core.video.domain.video import Video, VideoId
 from src.core.video.domain.video_repository import (
     IVideoRepository,
@@ -13,7 +13,9 @@ from src.core.video.domain.video_repository import (
     VideoSearchResult,
 )
 
-from src.django_project.video_app.mappers import VideoModelMapper
+from src.django_project.video_app.listing import VideoListingProjection
+from src.django_project.video_app.search_index import VideoSearchIndex
+from src.django_project.video_app.mappers import VideoModelMapper, VideoRelations
 from src.django_project.video_app.models import (
     AudioVideoMediaModel,
     ImageMediaModel,
@@ -22,41 +24,88 @@ from src.django_project.video_app.models import (
 from src.django_project.category_app.models import CategoryModel
 from src.django_project.cast_member_app.models import CastMemberModel
 from src.django_project.genre_app.models import GenreModel
+from src.django_project.shared_app.count_cache import CountCache
+from src.django_project.shared_app.relations import bulk_link, linked_to
+from src.django_project.shared_app.pagination import (
+    ordering_for,
+    paginate_by_cursor,
+    paginate_by_page,
+)
 
 
 class VideoDjangoRepository(IVideoRepository):
     sortable_fields: List[str] = ["title", "created_at"]
+    count_cache = CountCache("videos", dependents=("video_listing",))
+    listing = VideoListingProjection()
+    search_index = VideoSearchIndex()
 
+    @transaction.atomic
     def insert(self, entity: Video) -> None:
         model, relations = VideoModelMapper.to_model(entity)
         model.save()
 
-        model.categories.set(relations.categories_ids)
-        model.genres.set(relations.genres_ids)
-        model.cast_members.set(relations.cast_members_ids)
+        self._link_relations([(model, relations)])
+        self.listing.save([entity])
+
+        self.count_cache.invalidate()
 
+    @transaction.atomic
     def bulk_insert(self, entities: List[Video]) -> None:
-        VideoModel.objects.bulk_create(list(map(VideoModelMapper.to_model, entities)))
+        models_and_relations = list(map(VideoModelMapper.to_model, entities))
+        VideoModel.objects.bulk_create([model for model, _ in models_and_relations])
+
+        self._link_relations(models_and_relations)
+        self.listing.save(entities)
+
+        self.count_cache.invalidate()
+
+    def _link_relations(
+        self, models_and_relations: List[Tuple[VideoModel, VideoRelations]]
+    ) -> None:
+        for relation, attribute in (
+            (VideoModel.categories, "categories_ids"),
+            (VideoModel.genres, "genres_ids"),
+            (VideoModel.cast_members, "cast_members_ids"),
+        ):
+            bulk_link(
+                relation,
+                (
+                    (model.id, related_id)
+                    for model, relations in models_and_relations
+                    for related_id in getattr(relations, attribute)
+                ),
+            )
 
     def find_by_id(self, entity_id: VideoId) -> Video | None:
-        model = VideoModel.objects.filter(id=entity_id).first()
+        model = self._entities().filter(id=entity_id).first()
         return VideoModelMapper.to_entity(model) if model else None
 
     def find_by_ids(self, entity_ids: Set[VideoId]) -> List[Video]:
-        models = VideoModel.objects.filter(
+        models = self._entities().filter(
             id__in=[str(video_id) for video_id in entity_ids]
         )
         return [VideoModelMapper.to_entity(model) for model in models]
 
     def find_all(self) -> List[Video]:
-        models = VideoModel.objects.all()
+        models = self._entities()
         return [VideoModelMapper.to_entity(model) for model in models]
 
+    def stream_all(self, chunk_size: int = 500) -> Iterator[Video]:
+        query = self._entities().order_by("created_at", "id")
+
+        for model in query.iterator(chunk_size=chunk_size):
+            yield VideoModelMapper.to_entity(model)
+
     def exists_by_id(self, entity_ids: List[VideoId]) -> Dict[str, List[VideoId]]:
         raise NotImplementedError
 
+    @transaction.atomic
     def update(self, entity: Video) -> None:
-        model = VideoModel.objects.filter(pk=entity.id.value).first()
+        model = (
+            VideoModel.objects.select_related(*self._media_fields())
+            .filter(pk=entity.id.value)
+            .first()
+        )
 
         if not model:
             raise NotFoundException(entity.id.value, self.get_entity())
@@ -70,56 +119,13 @@ class VideoDjangoRepository(IVideoRepository):
         model.published = entity.published
         model.created_at = entity.created_at
 
-        AudioVideoMediaModel.objects.filter(id=model.video_id).delete()
-
-        model.banner = (
-            ImageMediaModel.objects.create(
-                name=entity.banner.name,
-                raw_location=entity.banner.raw_location,
-            )
-            if entity.banner
-            else None
-        )
-
-        model.thumbnail = (
-            ImageMediaModel.objects.create(
-                name=entity.thumbnail.name,
-                raw_location=entity.thumbnail.raw_location,
-            )
-            if entity.thumbnail
-            else None
-        )
-
-        model.thumbnail_half = (
-            ImageMediaModel.objects.create(
-                name=entity.thumbnail_half.name,
-                raw_location=entity.thumbnail_half.raw_location,
-            )
-            if entity.thumbnail_half
-            else None
-        )
-
-        model.video = (
-            AudioVideoMediaModel.objects.create(
-                name=entity.video.name,
-                raw_location=entity.video.raw_location,
-                encoded_location=entity.video.encoded_location,
-                status=entity.video.status,
-            )
-            if entity.video
-            else None
-        )
-
-        model.trailer = (
-            AudioVideoMediaModel.objects.create(
-                name=entity.trailer.name,
-                raw_location=entity.trailer.raw_location,
-                encoded_location=entity.trailer.encoded_location,
-                status=entity.trailer.status,
-            )
-            if entity.trailer
-            else None
-        )
+        # Media rows belong to a single video, so a changed value object is
+        # written in place and only a newly attached media gets a new row.
+        detached = [
+            media_model
+            for field in self._media_fields()
+            if (media_model := self._sync_media(model, field, getattr(entity, field)))
+        ]
 
         model.categories.set(
             [category_id.value for category_id in entity.categories_id]
@@ -131,67 +137,145 @@ class VideoDjangoRepository(IVideoRepository):
 
         model.save()
 
+        for media_model in detached:
+            media_model.delete()
+
+        self.listing.save([entity])
+
+        self.count_cache.invalidate()
+
+    @transaction.atomic
     def delete(self, entity_id: VideoId) -> None:
         VideoModel.objects.filter(id=entity_id).delete()
+        self.listing.delete([entity_id])
+
+        self.count_cache.invalidate()
 
     def search(self, props: VideoSearchParams) -> VideoSearchResult:
-        query = (
-            VideoModel.objects.all()
-            .distinct()
-            .prefetch_related(
-                self._prefetch_categories(),
-                self._prefetch_genres(),
-                self._prefetch_cast_members(),
-            )
-        )
+        query = self._entities()
 
         if props.filter:
             if props.filter.title:
-                query = query.filter(title__icontains=props.filter.title)
+                query = self.search_index.filter(query, props.filter.title)
 
             if props.filter.categories_id:
                 query = query.filter(
-                    categories__id__in=self._filter_valid_uuids(
-                        props.filter.categories_id
+                    linked_to(
+                        VideoModel.categories,
+                        self._filter_valid_uuids(props.filter.categories_id),
                     )
                 )
 
             if props.filter.genres_id:
                 query = query.filter(
-                    genres__id__in=self._filter_valid_uuids(props.filter.genres_id),
+                    linked_to(
+                        VideoModel.genres,
+                        self._filter_valid_uuids(props.filter.genres_id),
+                    )
                 )
             if props.filter.cast_members_id:
                 query = query.filter(
-                    cast_members__id__in=self._filter_valid_uuids(
-                        props.filter.cast_members_id
+                    linked_to(
+                        VideoModel.cast_members,
+                        self._filter_valid_uuids(props.filter.cast_members_id),
                     )
                 )
 
         if props.sort and props.sort in self.sortable_fields:
-            if props.sort_dir == SortDirection.DESC:
-                props.sort = f"-{props.sort}"
-            query = query.order_by(props.sort)
+            sort, sort_dir = props.sort, props.sort_dir
         else:
-            query = query.order_by("-created_at")
+            sort, sort_dir = "created_at", SortDirection.DESC
+
+        if props.is_cursor_mode:
+            page, next_cursor = paginate_by_cursor(
+                query, sort, sort_dir, props.cursor, props.per_page
+            )
 
-        paginator = Paginator(query, props.per_page)
+            return VideoSearchResult(
+                items=[VideoModelMapper.to_entity(model) for model in page],
+                total=self.count_cache.count(query, props),
+                current_page=props.page,
+                per_page=props.per_page,
+                cursor=props.cursor,
+                next_cursor=next_cursor,
+                count=props.count,
+            )
 
-        if props.page <= paginator.num_pages:
-            page_obj = paginator.page(props.page)
+        # Title matches come back by relevance unless a sort was asked for.
+        if props.sort not in self.sortable_fields and self.search_index.is_ranked(
+            query
+        ):
+            query = self.search_index.order_by_rank(query)
         else:
-            page_obj = paginator.page(paginator.num_pages)
-            page_obj.object_list = []
+            query = query.order_by(*ordering_for(sort, sort_dir))
+
+        page = paginate_by_page(query, props.page, props.per_page)
 
         return VideoSearchResult(
-            items=[VideoModelMapper.to_entity(model) for model in page_obj.object_list],
-            total=paginator.count,
+            items=[VideoModelMapper.to_entity(model) for model in page],
+            total=self.count_cache.count(query, props),
             current_page=props.page,
             per_page=props.per_page,
+            count=props.count,
         )
 
     def get_entity(self) -> Video:
         return Video
 
+    def _sync_media(
+        self,
+        model: VideoModel,
+        field: str,
+        media: ImageMedia | AudioVideoMedia | None,
+    ) -> ImageMediaModel | AudioVideoMediaModel | None:
+        """Point ``model.<field>`` at a row matching ``media`` and return the
+        row it no longer references, if any."""
+        current = getattr(model, field)
+
+        if media is None:
+            setattr(model, field, None)
+            return current
+
+        values = self._media_values(media)
+
+        if current is None:
+            media_model = model._meta.get_field(field).related_model
+            setattr(model, field, media_model.objects.create(**values))
+            return None
+
+        changed = [
+            name for name, value in values.items() if getattr(current, name) != value
+        ]
+        if changed:
+            for name in changed:
+                setattr(current, name, values[name])
+            current.save(update_fields=changed)
+
+        return None
+
+    def _media_values(self, media: ImageMedia | AudioVideoMedia) -> Dict[str, str]:
+        values = {"name": media.name, "raw_location": media.raw_location}
+
+        if isinstance(media, AudioVideoMedia):
+            values["encoded_location"] = media.encoded_location
+            values["status"] = media.status
+
+        return values
+
+    def _entities(self) -> models.QuerySet:
+        """Everything ``VideoModelMapper.to_entity`` reads: media through
+        joins and relation ids through one prefetch per relation."""
+        return VideoModel.objects.select_related(
+            *self._media_fields()
+        ).prefetch_related(
+            self._prefetch_categories(),
+            self._prefetch_genres(),
+            self._prefetch_cast_members(),
+        )
+
+    def _media_fields(self) -> List[str]:
+        return ["banner", "thumbnail", "thumbnail_half", "trailer", "video"]
+
     def _prefetch_categories(self):
         return models.Prefetch("categories", queryset=CategoryModel.objects.only("id"))
 
@@ -0,0 +1,125 @@
+import re
+
+from django.conf import settings
+from django.db import connections, models, transaction
+
+from src.django_project.video_app.models import VideoModel
+
+TABLE = "video_search"
+KEYS = "video_search_key"
+RANK = "search_rank"
+
+# The triggers of migration 0006. They belong to the video table, so SQLite
+# drops them whenever a migration rebuilds it; ``restore_triggers`` puts them
+# back after ``migrate``.
+TRIGGERS = {
+    "video_search_after_insert": f"""
+        CREATE TRIGGER video_search_after_insert AFTER INSERT ON video BEGIN
+            INSERT INTO {KEYS}(video_id) VALUES (new.id);
+            INSERT INTO {TABLE}(rowid, video_id, title, description)
+            SELECT id, new.id, new.title, new.description
+            FROM {KEYS} WHERE video_id = new.id;
+        END
+    """,
+    "video_search_after_delete": f"""
+        CREATE TRIGGER video_search_after_delete AFTER DELETE ON video BEGIN
+            DELETE FROM {TABLE} WHERE rowid = (
+                SELECT id FROM {KEYS} WHERE video_id = old.id
+            );
+            DELETE FROM {KEYS} WHERE video_id = old.id;
+        END
+    """,
+    "video_search_after_update": f"""
+        CREATE TRIGGER video_search_after_update AFTER UPDATE OF title, description
+        ON video BEGIN
+            UPDATE {TABLE} SET title = new.title, description = new.description
+            WHERE rowid = (SELECT id FROM {KEYS} WHERE video_id = new.id);
+        END
+    """,
+}
+
+
+class VideoSearchIndex:
+    """Full-text title/description search over the ``video_search`` FTS5
+    table, keyed by video id (see migration 0006). Queries on other
+    backends, or with the index switched off, fall back to
+    ``title__icontains``."""
+
+    def filter(self, query: models.QuerySet, text: str) -> models.QuerySet:
+        """Restrict ``query`` (over ``VideoModel`` or a model sharing its
+        ids) to videos matching ``text``; matches are annotated with
+        ``search_rank``, lower being more relevant."""
+        expression = self.match_expression(text)
+
+        if expression is None or not self.enabled(query.db):
+            return query.filter(title__icontains=text)
+
+        return query.extra(
+            select={RANK: f"{TABLE}.rank"},
+            tables=[TABLE],
+            where=[
+                f"{TABLE}.video_id = {query.model._meta.db_table}.id",
+                f"{TABLE} MATCH %s",
+            ],
+            params=[expression],
+        )
+
+    def is_ranked(self, query: models.QuerySet) -> bool:
+        return RANK in query.query.extra
+
+    def order_by_rank(self, query: models.QuerySet) -> models.QuerySet:
+        return query.order_by(RANK, "id")
+
+    def rebuild(self, using: str = "default") -> None:
+        video = VideoModel._meta.db_table
+
+        with transaction.atomic(using), connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE}")
+            cursor.execute(f"DELETE FROM {KEYS}")
+            cursor.execute(f"INSERT INTO {KEYS}(video_id) SELECT id FROM {video}")
+            cursor.execute(
+                f"INSERT INTO {TABLE}(rowid, video_id, title, description) "
+                f"SELECT {KEYS}.id, {video}.id, {video}.title, {video}.description "
+                f"FROM {KEYS} JOIN {video} ON {video}.id = {KEYS}.video_id"
+            )
+
+    def restore_triggers(self, using: str = "default") -> bool:
+        """Recreate the triggers a migration dropped along with the video
+        table and rebuild the index, which missed the rows copied over;
+        returns whether any were missing."""
+        connection = connections[using]
+
+        if connection.vendor != "sqlite":
+            return False
+        if KEYS not in connection.introspection.table_names():
+            return False
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s",
+                [VideoModel._meta.db_table],
+            )
+            existing = {name for name, in cursor.fetchall()}
+            missing = [name for name in TRIGGERS if name not in existing]
+
+            for name in missing:
+                cursor.execute(TRIGGERS[name])
+
+        if missing:
+            self.rebuild(using)
+
+        return bool(missing)
+
+    def enabled(self, using: str) -> bool:
+        return settings.VIDEO_FULL_TEXT_SEARCH and connections[using].vendor == "sqlite"
+
+    @staticmethod
+    def match_expression(text: str) -> str | None:
+        """Every word of ``text`` as a quoted prefix term, so input typed in
+        the admin search box can never be read as FTS5 query syntax."""
+        terms = re.findall(r"\w+", text or "")
+
+        if not terms:
+            return None
+
+        return " ".join(f'"{term}"*' for term in terms)
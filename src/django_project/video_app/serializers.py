@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from src.core._shared.application.storage_interface import check_file_name
+from src.core._shared.domain.exceptions import InvalidArgumentException
 from src.core.video.domain.audio_video_media import Rating
 
 
@@ -38,6 +40,26 @@ class UploadAudioVideoMediaInputSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
 
+class UploadSessionIdsInputSerializer(serializers.Serializer):
+    video_id = serializers.UUIDField()
+    id = serializers.UUIDField(required=False)
+
+
+class CreateUploadSessionInputSerializer(serializers.Serializer):
+    field = serializers.ChoiceField(choices=["video", "trailer"])
+    file_name = serializers.CharField(max_length=255)
+    content_type = serializers.CharField(
+        max_length=255, required=False, allow_blank=True, default=""
+    )
+    length = serializers.IntegerField(min_value=1)
+
+    def validate_file_name(self, value: str) -> str:
+        try:
+            return check_file_name(value)
+        except InvalidArgumentException as error:
+            raise serializers.ValidationError(str(error))
+
+
 class UploadImageMediaInputSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
@@ -0,0 +1,52 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_migrate, pre_delete
+
+from src.django_project.cast_member_app.models import CastMemberModel
+from src.django_project.category_app.models import CategoryModel
+from src.django_project.genre_app.models import GenreModel
+
+# Deleting a category, genre or cast member cascades to the video relation
+# tables, so the listing documents of the videos that pointed at it are
+# rebuilt in the same transaction.
+
+
+def remember_linked_videos(sender, instance, **kwargs) -> None:
+    instance._listing_video_ids = list(instance.videos.values_list("id", flat=True))
+
+
+def refresh_linked_videos(sender, instance, **kwargs) -> None:
+    video_ids = getattr(instance, "_listing_video_ids", None)
+
+    if not video_ids:
+        return
+
+    from src.django_project.video_app.repository import VideoDjangoRepository
+
+    repository = VideoDjangoRepository()
+    repository.listing.save(repository.find_by_ids(set(video_ids)))
+
+
+def restore_search_triggers(sender, using, **kwargs) -> None:
+    from src.django_project.video_app.search_index import VideoSearchIndex
+
+    VideoSearchIndex().restore_triggers(using)
+
+
+def connect() -> None:
+    for model in (CategoryModel, GenreModel, CastMemberModel):
+        pre_delete.connect(
+            remember_linked_videos,
+            sender=model,
+            dispatch_uid=f"video_listing_pre_delete_{model.__name__}",
+        )
+        post_delete.connect(
+            refresh_linked_videos,
+            sender=model,
+            dispatch_uid=f"video_listing_post_delete_{model.__name__}",
+        )
+
+    post_migrate.connect(
+        restore_search_triggers,
+        sender=apps.get_app_config("video_app"),
+        dispatch_uid="video_search_post_migrate",
+    )
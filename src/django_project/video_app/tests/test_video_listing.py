@@ -0,0 +1,191 @@
+import datetime
+from decimal import Decimal
+from io import StringIO
+import uuid
+
+import pytest
+from django.contrib.admin.sites import site
+from django.core.management import call_command
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from src.core.category.domain.category import Category
+from src.core.video.application.use_cases.list_videos import (
+    ListVideosInput,
+    ListVideosUseCase,
+)
+from src.core.video.application.use_cases.process_audio_video_media import (
+    ProcessAudioVideoMediaInput,
+    ProcessAudioVideoMediaUseCase,
+)
+from src.core.video.domain.audio_video_media import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoFilter, VideoSearchParams
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.video_app.listing import VideoListingDjangoRepository
+from src.django_project.video_app.models import (
+    AudioVideoMediaModel,
+    ImageMediaModel,
+    VideoListingModel,
+    VideoModel,
+)
+from src.django_project.video_app.presenters import VideoCollectionPresenter
+from src.django_project.video_app.repository import VideoDjangoRepository
+
+
+@pytest.mark.django_db
+class TestVideoListing:
+    repo: VideoDjangoRepository
+    listing_repo: VideoListingDjangoRepository
+
+    def setup_method(self):
+        self.repo = VideoDjangoRepository()
+        self.listing_repo = VideoListingDjangoRepository()
+
+        self.movie = Category(name="Movie")
+        self.series = Category(name="Series")
+        CategoryDjangoRepository().bulk_insert([self.movie, self.series])
+
+    def make_video(self, title: str, category: Category, days: int = 0) -> Video:
+        return Video(
+            title=title,
+            description="Some description",
+            launch_year=2024,
+            duration=Decimal("90.50"),
+            rating=Rating.L,
+            opened=False,
+            published=False,
+            categories_id={category.id},
+            genres_id=set(),
+            cast_members_id=set(),
+            created_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+            + datetime.timedelta(days=days),
+        )
+
+    def search(self, **kwargs) -> list[str]:
+        result = self.listing_repo.search(VideoSearchParams(**kwargs))
+        return [item["title"] for item in result.items]
+
+    def test_list_renders_the_same_as_the_aggregate_path(self):
+        videos = [
+            self.make_video("Alpha", self.movie, days=0),
+            self.make_video("Beta", self.series, days=1),
+        ]
+        videos[0].banner = ImageMedia(name="banner.png", raw_location="raw/banner.png")
+        self.repo.bulk_insert(videos)
+        self.repo.update(videos[0])
+
+        def render(use_case: ListVideosUseCase) -> bytes:
+            output = use_case.execute(ListVideosInput())
+            return JSONRenderer().render(VideoCollectionPresenter(output).serialize())
+
+        assert render(ListVideosUseCase(self.repo, self.listing_repo)) == render(
+            ListVideosUseCase(self.repo)
+        )
+
+    def test_search_filters_and_sorts_from_the_listing_table(self):
+        self.repo.bulk_insert(
+            [
+                self.make_video("Gamma", self.movie, days=0),
+                self.make_video("Alpha", self.series, days=1),
+                self.make_video("Beta", self.movie, days=2),
+            ]
+        )
+
+        assert self.search() == ["Beta", "Alpha", "Gamma"]
+        assert self.search(init_sort="title") == ["Alpha", "Beta", "Gamma"]
+        assert self.search(init_filter=VideoFilter(title="alp")) == ["Alpha"]
+        assert self.search(
+            init_sort="title",
+            init_filter=VideoFilter(categories_id={str(self.movie.id)}),
+        ) == ["Beta", "Gamma"]
+        assert self.search(
+            init_filter=VideoFilter(categories_id={"not-a-uuid"})
+        ) == []
+        assert self.search(
+            init_filter=VideoFilter(categories_id={str(uuid.uuid4())})
+        ) == []
+
+    def test_update_and_delete_keep_the_listing_in_step(self):
+        video = self.make_video("Alpha", self.movie)
+        self.repo.insert(video)
+
+        video.change_title("Renamed")
+        self.repo.update(video)
+        assert self.search() == ["Renamed"]
+
+        self.repo.delete(video.id.value)
+        assert not VideoListingModel.objects.exists()
+
+    def test_processing_media_refreshes_the_document(self):
+        video = self.make_video("Alpha", self.movie)
+        video.video = AudioVideoMedia(
+            name="video.mp4",
+            raw_location="raw/video.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+        )
+        self.repo.insert(video)
+        self.repo.update(video)
+
+        ProcessAudioVideoMediaUseCase(video_repo=self.repo).execute(
+            ProcessAudioVideoMediaInput(
+                video_id=video.id.value,
+                encoded_location="",
+                media_type=MediaType.VIDEO,
+                status=MediaStatus.ERROR,
+            )
+        )
+
+        document = VideoListingModel.objects.get(pk=video.id.value).document
+        assert document["video"]["status"] == MediaStatus.ERROR
+
+    def test_deleting_a_category_refreshes_linked_videos(self):
+        video = self.make_video("Alpha", self.movie)
+        self.repo.insert(video)
+
+        CategoryDjangoRepository().delete(self.movie.id.value)
+
+        document = VideoListingModel.objects.get(pk=video.id.value).document
+        assert document["categories_id"] == []
+        assert (
+            self.search(init_filter=VideoFilter(categories_id={str(self.movie.id)}))
+            == []
+        )
+
+    def test_rebuild_command_backfills_the_table(self):
+        self.repo.bulk_insert(
+            [self.make_video(f"Video {i}", self.movie, days=i) for i in range(3)]
+        )
+        VideoListingModel.objects.all().delete()
+        VideoListingModel.objects.create(
+            id=uuid.uuid4(),
+            title="Stale",
+            created_at=datetime.datetime.now(datetime.UTC),
+            document={},
+        )
+
+        out = StringIO()
+        call_command("rebuildvideolisting", "--chunk-size", "2", stdout=out)
+
+        assert "3 videos" in out.getvalue()
+        assert self.search(init_sort="title") == ["Video 0", "Video 1", "Video 2"]
+
+
+@pytest.mark.parametrize("model", [VideoModel, AudioVideoMediaModel, ImageMediaModel])
+def test_admin_cannot_write_videos_or_media(model, admin_user):
+    request = RequestFactory().get("/admin/")
+    request.user = admin_user
+    model_admin = site._registry[model]
+
+    assert model_admin.has_view_permission(request)
+    assert not model_admin.has_add_permission(request)
+    assert not model_admin.has_change_permission(request)
+    assert not model_admin.has_delete_permission(request)
@@ -0,0 +1,222 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from src.core.cast_member.domain.cast_member import CastMember
+from src.core.cast_member.domain.cast_member_type import CastMemberType
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.core.video.domain.audio_video_media import (
+    AudioVideoMedia,
+    ImageMedia,
+    MediaStatus,
+    MediaType,
+    Rating,
+)
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoSearchParams
+from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
+from src.django_project.category_app.repository import CategoryDjangoRepository
+from src.django_project.genre_app.repository import GenreDjangoRepository
+from src.django_project.video_app.models import (
+    AudioVideoMediaModel,
+    ImageMediaModel,
+    VideoModel,
+)
+from src.django_project.video_app.repository import VideoDjangoRepository
+
+
+@pytest.mark.django_db
+class TestVideoDjangoRepository:
+    repo: VideoDjangoRepository
+
+    def setup_method(self):
+        self.repo = VideoDjangoRepository()
+
+        self.category = Category(name="Movie")
+        CategoryDjangoRepository().insert(self.category)
+
+        self.genre = Genre(name="Drama", categories_id={self.category.id})
+        GenreDjangoRepository().insert(self.genre)
+
+        self.cast_member = CastMember(name="John Doe", type=CastMemberType.ACTOR)
+        CastMemberDjangoRepository().insert(self.cast_member)
+
+    def make_video(self, title: str = "Video") -> Video:
+        return Video(
+            title=title,
+            description="Some description",
+            launch_year=2024,
+            duration=Decimal("90.00"),
+            rating=Rating.L,
+            opened=False,
+            published=False,
+            categories_id={self.category.id},
+            genres_id={self.genre.id},
+            cast_members_id={self.cast_member.id},
+        )
+
+    def test_insert_links_relations(self):
+        video = self.make_video()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.repo.insert(video)
+
+        assert not [q for q in queries if q["sql"].startswith("SELECT")]
+
+        saved = self.repo.find_by_id(video.id.value)
+        assert saved.categories_id == {self.category.id}
+        assert saved.genres_id == {self.genre.id}
+        assert saved.cast_members_id == {self.cast_member.id}
+
+    def test_bulk_insert_links_relations(self):
+        videos = [self.make_video(f"Video {i}") for i in range(3)]
+
+        self.repo.bulk_insert(videos)
+
+        saved = self.repo.find_all()
+        assert {video.id for video in saved} == {video.id for video in videos}
+        for video in saved:
+            assert video.categories_id == {self.category.id}
+            assert video.genres_id == {self.genre.id}
+            assert video.cast_members_id == {self.cast_member.id}
+
+    def insert_with_media(self, size: int) -> list[Video]:
+        videos = [self.make_video(f"Video {i}") for i in range(size)]
+        for video in videos:
+            video.banner = ImageMedia(name="banner.png", raw_location="raw/banner.png")
+            video.thumbnail = ImageMedia(name="thumb.png", raw_location="raw/thumb.png")
+            video.trailer = AudioVideoMedia(
+                name="trailer.mp4",
+                raw_location="raw/trailer.mp4",
+                encoded_location="",
+                status=MediaStatus.PENDING,
+                media_type=MediaType.TRAILER,
+            )
+            self.repo.insert(video)
+            self.repo.update(video)
+        return videos
+
+    def test_find_by_id_issues_a_fixed_number_of_queries(self):
+        video = self.insert_with_media(1)[0]
+
+        # The video with its media, then one prefetch per relation.
+        with CaptureQueriesContext(connection) as queries:
+            found = self.repo.find_by_id(video.id.value)
+
+        assert len(queries) == 4
+        assert found.banner == video.banner
+        assert found.trailer == video.trailer
+        assert found.categories_id == {self.category.id}
+
+    def test_search_issues_a_fixed_number_of_queries_per_page(self):
+        self.insert_with_media(15)
+
+        for per_page in (2, 15):
+            params = VideoSearchParams(init_per_page=per_page, init_count="none")
+
+            with CaptureQueriesContext(connection) as queries:
+                result = self.repo.search(params)
+
+            assert len(result.items) == per_page
+            assert all(video.banner is not None for video in result.items)
+            assert len(queries) == 4
+
+    def test_bulk_insert_issues_a_constant_number_of_statements(self):
+        def statements(size: int) -> int:
+            videos = [self.make_video(f"Video {i}") for i in range(size)]
+            with CaptureQueriesContext(connection) as queries:
+                self.repo.bulk_insert(videos)
+            return len(queries)
+
+        # See the genre repository test: lift Django's 999 variable cap so
+        # SQLite does not split the INSERTs.
+        with patch.object(connection.features, "max_query_params", 32766):
+            assert statements(1000) == statements(10)
+
+
+@pytest.mark.django_db
+class TestVideoDjangoRepositoryUpdateMedia:
+    repo: VideoDjangoRepository
+
+    def setup_method(self):
+        self.repo = VideoDjangoRepository()
+        self.video = Video(
+            title="Video",
+            description="Some description",
+            launch_year=2024,
+            duration=Decimal("90.00"),
+            rating=Rating.L,
+            opened=False,
+            published=False,
+            categories_id=set(),
+            genres_id=set(),
+            cast_members_id=set(),
+        )
+        self.video.banner = ImageMedia(name="banner.png", raw_location="raw/banner.png")
+        self.video.thumbnail = ImageMedia(
+            name="thumbnail.png", raw_location="raw/thumbnail.png"
+        )
+        self.video.video = AudioVideoMedia(
+            name="video.mp4",
+            raw_location="raw/video.mp4",
+            encoded_location="",
+            status=MediaStatus.PENDING,
+            media_type=MediaType.VIDEO,
+        )
+        self.repo.insert(self.video)
+        self.repo.update(self.video)
+
+    def media_tables(self):
+        return (ImageMediaModel._meta.db_table, AudioVideoMediaModel._meta.db_table)
+
+    def test_title_only_update_issues_no_media_writes(self):
+        self.video.change_title("New title")
+
+        with CaptureQueriesContext(connection) as queries:
+            self.repo.update(self.video)
+
+        media_writes = [
+            query["sql"]
+            for query in queries
+            if not query["sql"].startswith("SELECT")
+            and any(table in query["sql"] for table in self.media_tables())
+        ]
+        assert media_writes == []
+
+        saved = self.repo.find_by_id(self.video.id.value)
+        assert saved.title == "New title"
+        assert saved.banner == self.video.banner
+        assert saved.video == self.video.video
+
+    def test_changed_media_is_updated_in_place(self):
+        banner_id = VideoModel.objects.get(pk=self.video.id.value).banner_id
+        self.video.video = self.video.video.complete("encoded/video.mp4")
+        self.video.banner = ImageMedia(name="new.png", raw_location="raw/new.png")
+
+        self.repo.update(self.video)
+
+        model = VideoModel.objects.get(pk=self.video.id.value)
+        assert model.banner_id == banner_id
+        assert ImageMediaModel.objects.count() == 2
+        assert AudioVideoMediaModel.objects.count() == 1
+
+        saved = self.repo.find_by_id(self.video.id.value)
+        assert saved.banner == self.video.banner
+        assert saved.video == self.video.video
+
+    def test_new_and_removed_media(self):
+        self.video.thumbnail = None
+        self.video.thumbnail_half = ImageMedia(
+            name="half.png", raw_location="raw/half.png"
+        )
+
+        self.repo.update(self.video)
+
+        saved = self.repo.find_by_id(self.video.id.value)
+        assert saved.thumbnail is None
+        assert saved.thumbnail_half == self.video.thumbnail_half
+        assert ImageMediaModel.objects.count() == 2
@@ -0,0 +1,175 @@
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection, models
+from django.test import override_settings
+
+from src.core.video.domain.audio_video_media import Rating
+from src.core.video.domain.video import Video
+from src.core.video.domain.video_repository import VideoFilter, VideoSearchParams
+from src.django_project.video_app.listing import VideoListingDjangoRepository
+from src.django_project.video_app.models import VideoModel
+from src.django_project.video_app.repository import VideoDjangoRepository
+from src.django_project.video_app.search_index import VideoSearchIndex
+
+
+def make_video(title: str, description: str = "Some description") -> Video:
+    return Video(
+        title=title,
+        description=description,
+        launch_year=2024,
+        duration=Decimal("90.00"),
+        rating=Rating.L,
+        opened=False,
+        published=False,
+        categories_id=set(),
+        genres_id=set(),
+        cast_members_id=set(),
+    )
+
+
+class TestMatchExpression:
+    def test_words_become_quoted_prefix_terms(self):
+        assert VideoSearchIndex.match_expression("star wa") == '"star"* "wa"*'
+
+    def test_query_syntax_is_not_interpreted(self):
+        expression = VideoSearchIndex.match_expression('title:"x" OR NEAR(a')
+
+        assert expression == '"title"* "x"* "OR"* "NEAR"* "a"*'
+
+    def test_returns_none_without_words(self):
+        assert VideoSearchIndex.match_expression(" -- ") is None
+
+
+@pytest.mark.django_db
+class TestVideoFullTextSearch:
+    repo: VideoDjangoRepository
+
+    def setup_method(self):
+        self.repo = VideoDjangoRepository()
+
+    def search(self, title: str, repository=None, **kwargs) -> list[str]:
+        repository = repository or self.repo
+        result = repository.search(
+            VideoSearchParams(init_filter=VideoFilter(title=title), **kwargs)
+        )
+        return [
+            item.title if isinstance(item, Video) else item["title"]
+            for item in result.items
+        ]
+
+    def test_matches_word_prefixes_in_title_and_description(self):
+        self.repo.bulk_insert(
+            [
+                make_video("Star Wars"),
+                make_video("Ação Total"),
+                make_video("Documentary", description="Behind the stars"),
+                make_video("Mustard"),
+            ]
+        )
+
+        assert sorted(self.search("star")) == ["Documentary", "Star Wars"]
+        assert self.search("acao") == ["Ação Total"]
+        assert self.search("wars star") == ["Star Wars"]
+        assert self.search("tard") == []
+
+    def test_ranks_title_matches_first(self):
+        self.repo.bulk_insert(
+            [
+                make_video("Documentary", description="A story about space"),
+                make_video("Space Odyssey"),
+            ]
+        )
+
+        assert self.search("space") == ["Space Odyssey", "Documentary"]
+        assert self.search("space", init_sort="title") == [
+            "Documentary",
+            "Space Odyssey",
+        ]
+
+    def test_index_follows_update_and_delete(self):
+        video = make_video("Alpha")
+        self.repo.insert(video)
+
+        video.change_title("Omega")
+        self.repo.update(video)
+        assert self.search("alpha") == []
+        assert self.search("omega") == ["Omega"]
+
+        self.repo.delete(video.id.value)
+        assert self.search("omega") == []
+
+    def test_listing_search_uses_the_index(self):
+        self.repo.bulk_insert([make_video("Star Wars"), make_video("Mustard")])
+
+        listing = VideoListingDjangoRepository()
+        assert self.search("star", repository=listing) == ["Star Wars"]
+
+    @override_settings(VIDEO_FULL_TEXT_SEARCH=False)
+    def test_falls_back_to_icontains_when_disabled(self):
+        self.repo.bulk_insert([make_video("Star Wars"), make_video("Mustard")])
+
+        assert self.search("tard") == ["Mustard"]
+
+    def test_rebuild_command_restores_the_index(self):
+        self.repo.insert(make_video("Star Wars"))
+
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM video_search")
+        assert self.search("star") == []
+
+        call_command("rebuildvideosearch", stdout=StringIO())
+
+        assert self.search("star") == ["Star Wars"]
+
+    def test_index_is_keyed_by_video_id_not_rowid(self):
+        videos = [make_video("Star Wars"), make_video("Mustard")]
+        self.repo.bulk_insert(videos)
+
+        # What a VACUUM may do to a table without an integer primary key.
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE video SET rowid = 1000 - rowid")
+
+        assert self.search("star") == ["Star Wars"]
+
+        videos[0].change_title("Alpha")
+        self.repo.update(videos[0])
+        self.repo.delete(videos[1].id.value)
+        assert self.search("star") == []
+        assert self.search("alpha") == ["Alpha"]
+        assert self.search("mustard") == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_migrate_restores_triggers_dropped_with_the_video_table():
+    repo = VideoDjangoRepository()
+    repo.insert(make_video("Star Wars"))
+    old_field = VideoModel._meta.get_field("title")
+    new_field = models.CharField(max_length=300)
+    new_field.set_attributes_from_name("title")
+
+    # SQLite alters the column by rebuilding the table, triggers included.
+    with connection.schema_editor() as editor:
+        editor.alter_field(VideoModel, old_field, new_field)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM sqlite_master WHERE type = 'trigger'")
+            assert cursor.fetchone() == (0,)
+        repo.insert(make_video("Space Odyssey"))
+
+        call_command("migrate", verbosity=0)
+
+        assert not VideoSearchIndex().restore_triggers()
+        repo.insert(make_video("Star Trek"))
+        result = repo.search(VideoSearchParams(init_filter=VideoFilter(title="s")))
+        assert sorted(video.title for video in result.items) == [
+            "Space Odyssey",
+            "Star Trek",
+            "Star Wars",
+        ]
+    finally:
+        with connection.schema_editor() as editor:
+            editor.alter_field(VideoModel, new_field, old_field)
+        call_command("migrate", verbosity=0)
@@ -0,0 +1,359 @@
+import datetime
+import io
+from decimal import Decimal
+from io import StringIO
+import os
+import threading
+from pathlib import Path
+import uuid
+
+import pytest
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.core._shared.application.application_service import ApplicationService
+from src.core._shared.infra.storage.local_storage import LocalStorage
+from src.core._shared.domain.exceptions import InvalidArgumentException
+from src.core.video.application.use_cases.append_upload_chunk import (
+    AppendUploadChunkInput,
+    AppendUploadChunkUseCase,
+)
+from src.core.video.application.use_cases.upload_audio_video_media import (
+    UploadAudioVideoMediaInput,
+    UploadAudioVideoMediaUseCase,
+)
+from src.core.video.domain.audio_video_media import Rating
+from src.core.video.domain.upload_session import (
+    UploadSession,
+    UploadSessionConflictException,
+)
+from src.core.video.domain.video import Video
+from src.core.video.infra.upload_session_in_memory_repository import (
+    UploadSessionInMemoryRepository,
+)
+from src.django_project.container import container
+from src.django_project.shared_app.container import Scope
+from src.django_project.shared_app.unit_of_work import UnitOfWork
+from src.django_project.video_app.models import UploadSessionModel
+from src.django_project.video_app.repository import VideoDjangoRepository
+from src.django_project.video_app.uploads import UploadSpool
+
+CONTENT = b"0123456789" * 1000
+
+
+class NoEvents:
+    def handle(self, events) -> None:
+        pass
+
+
+@pytest.fixture
+def storage(tmp_path: Path, monkeypatch) -> LocalStorage:
+    storage = LocalStorage(str(tmp_path / "storage"))
+    monkeypatch.setitem(
+        container._providers,
+        UploadAudioVideoMediaUseCase,
+        (
+            Scope.FACTORY,
+            lambda c: UploadAudioVideoMediaUseCase(
+                video_repo=VideoDjangoRepository(),
+                storage=storage,
+                app_service=ApplicationService(
+                    uow=UnitOfWork(), domain_event_mediator=NoEvents()
+                ),
+            ),
+        ),
+    )
+    return storage
+
+
+class PausingStream:
+    """Hands out its first read, then waits for ``resume`` before the rest."""
+
+    def __init__(self, content: bytes):
+        self.content = io.BytesIO(content)
+        self.paused = threading.Event()
+        self.resume = threading.Event()
+
+    def read(self, size: int) -> bytes:
+        if self.content.tell():
+            self.paused.set()
+            self.resume.wait(5)
+        return self.content.read(size)
+
+
+class TestAppendUploadChunkConcurrency:
+    def test_a_chunk_racing_another_at_the_same_offset_writes_nothing(
+        self, tmp_path: Path, settings
+    ):
+        settings.UPLOAD_READ_SIZE = 5
+        repository = UploadSessionInMemoryRepository()
+        spool = UploadSpool(str(tmp_path))
+        session = UploadSession(
+            video_id=uuid.uuid4(), field="video", file_name="video.mp4", length=20
+        )
+        repository.insert(session)
+        spool.create(session.id)
+        use_case = AppendUploadChunkUseCase(
+            repository, spool, datetime.timedelta(hours=1)
+        )
+        first = PausingStream(b"A" * 20)
+        results = {}
+
+        def append(name: str, content) -> None:
+            try:
+                results[name] = use_case.execute(
+                    AppendUploadChunkInput(
+                        video_id=session.video_id,
+                        id=session.id,
+                        offset=0,
+                        content=content,
+                        size=20,
+                    )
+                )
+            except UploadSessionConflictException as error:
+                results[name] = error
+
+        threads = [
+            threading.Thread(target=append, args=("first", first)),
+            threading.Thread(target=append, args=("second", io.BytesIO(b"B" * 20))),
+        ]
+        threads[0].start()
+        assert first.paused.wait(5)
+        threads[1].start()
+        threads[1].join(0.2)
+        assert threads[1].is_alive()
+
+        first.resume.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert results["first"].offset == 20
+        assert isinstance(results["second"], UploadSessionConflictException)
+        assert results["second"].session.offset == 20
+        assert spool.path(session.id).read_bytes() == b"A" * 20
+
+
+@pytest.mark.django_db
+class TestVideoUploadAPI:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path: Path, settings):
+        settings.UPLOAD_SPOOL_DIR = str(tmp_path / "spool")
+        settings.UPLOAD_READ_SIZE = 1024
+        self.client = APIClient()
+        self.video = Video(
+            title="Movie",
+            description="A movie",
+            launch_year=2024,
+            duration=Decimal("90.00"),
+            rating=Rating.L,
+            opened=False,
+            published=False,
+            categories_id=set(),
+            genres_id=set(),
+            cast_members_id=set(),
+        )
+        VideoDjangoRepository().insert(self.video)
+        self.url = f"/api/videos/{self.video.id}/uploads/"
+
+    def open_session(self, length: int = len(CONTENT)) -> str:
+        response = self.client.post(
+            self.url,
+            {"field": "trailer", "file_name": "trailer.mp4", "length": length},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return f"{self.url}{response.data['data']['id']}/"
+
+    def patch(self, url: str, offset: int, chunk: bytes):
+        return self.client.generic(
+            "PATCH",
+            url,
+            chunk,
+            content_type="application/offset+octet-stream",
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_uploads_in_chunks_and_reports_progress(self):
+        url = self.open_session()
+
+        response = self.patch(url, 0, CONTENT[:4000])
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Upload-Offset"] == "4000"
+
+        response = self.client.head(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Upload-Offset"] == "4000"
+        assert response["Upload-Length"] == str(len(CONTENT))
+
+        response = self.patch(url, 4000, CONTENT[4000:])
+        assert response["Upload-Offset"] == str(len(CONTENT))
+
+    def test_rejects_a_chunk_at_the_wrong_offset(self):
+        url = self.open_session()
+        self.patch(url, 0, CONTENT[:4000])
+
+        response = self.patch(url, 2000, CONTENT[2000:6000])
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response["Upload-Offset"] == "4000"
+
+    def test_rejects_a_chunk_past_the_length(self):
+        url = self.open_session(length=10)
+
+        response = self.patch(url, 0, CONTENT[:11])
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    def test_requires_the_upload_offset_header(self):
+        url = self.open_session()
+
+        response = self.client.generic("PATCH", url, CONTENT[:10])
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    # The unit of work toggles autocommit, which the test transaction forbids.
+    @pytest.mark.django_db(transaction=True)
+    def test_finalize_stores_the_file_on_the_video(self, storage: LocalStorage):
+        url = self.open_session()
+        self.patch(url, 0, CONTENT[:5000])
+        self.patch(url, 5000, CONTENT[5000:])
+
+        response = self.client.post(f"{url}finalize/")
+
+        assert response.status_code == status.HTTP_200_OK
+        file_path = Path("videos") / str(self.video.id) / "trailer.mp4"
+        assert storage.get(file_path) == CONTENT
+        video = VideoDjangoRepository().find_by_id(self.video.id.value)
+        assert video.trailer.raw_location == str(file_path)
+        assert not UploadSessionModel.objects.exists()
+        assert self.client.head(url).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_finalize_requires_every_byte(self):
+        url = self.open_session()
+        self.patch(url, 0, CONTENT[:5000])
+
+        response = self.client.post(f"{url}finalize/")
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_cancel_discards_the_spooled_chunks(self, settings):
+        url = self.open_session()
+        self.patch(url, 0, CONTENT[:5000])
+
+        response = self.client.delete(url)
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert list(Path(settings.UPLOAD_SPOOL_DIR).iterdir()) == []
+
+    @pytest.mark.parametrize(
+        "file_name", ["../../escape.mp4", "/etc/passwd", "a/b.mp4", "..", "a\\b.mp4"]
+    )
+    def test_rejects_file_names_that_are_paths(self, file_name):
+        response = self.client.post(
+            self.url,
+            {"field": "video", "file_name": file_name, "length": 10},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "file_name" in response.data
+        assert not UploadSessionModel.objects.exists()
+
+    def test_media_is_never_stored_outside_the_video_directory(
+        self, storage: LocalStorage
+    ):
+        use_case = container.resolve(UploadAudioVideoMediaUseCase)
+
+        with pytest.raises(InvalidArgumentException):
+            use_case.execute(
+                UploadAudioVideoMediaInput(
+                    id=self.video.id.value,
+                    field="video",
+                    file_name="../../../escape.mp4",
+                    content=io.BytesIO(CONTENT),
+                    content_type="video/mp4",
+                )
+            )
+
+        assert list(storage.bucket.rglob("*")) == []
+
+    @pytest.mark.parametrize(
+        "method, suffix",
+        [("get", ""), ("head", ""), ("patch", ""), ("delete", ""), ("post", "finalize/")],
+    )
+    def test_rejects_ids_that_are_not_uuids(self, method, suffix):
+        response = getattr(self.client, method)(
+            f"/api/videos/not-a-uuid/uploads/bad/{suffix}",
+            HTTP_UPLOAD_OFFSET="0",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = self.client.get(f"{self.url}bad/")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "id" in response.data
+
+    def test_create_rejects_a_video_id_that_is_not_a_uuid(self):
+        response = self.client.post(
+            "/api/videos/not-a-uuid/uploads/",
+            {"field": "video", "file_name": "video.mp4", "length": 10},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "video_id" in response.data
+
+    def test_returns_404_for_an_unknown_video(self):
+        response = self.client.post(
+            f"/api/videos/{uuid.uuid4()}/uploads/",
+            {"field": "video", "file_name": "video.mp4", "length": 10},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_returns_404_for_an_unknown_session(self):
+        session_id = uuid.uuid4()
+
+        response = self.client.head(f"{self.url}{session_id}/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = self.patch(f"{self.url}{session_id}/", 0, CONTENT[:10])
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data == {
+            "message": f"UploadSession with id {session_id} not found"
+        }
+
+    def test_expired_sessions_are_not_found(self, settings):
+        url = self.open_session()
+        settings.UPLOAD_SESSION_TIMEOUT = 0
+
+        assert self.client.head(url).status_code == status.HTTP_404_NOT_FOUND
+        response = self.patch(url, 0, CONTENT[:10])
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_purge_removes_expired_sessions_and_orphaned_spool_files(self, settings):
+        expired_url = self.open_session()
+        settings.UPLOAD_SESSION_TIMEOUT = 60
+        UploadSessionModel.objects.update(
+            created_at=datetime.datetime.now(datetime.UTC)
+            - datetime.timedelta(minutes=2)
+        )
+        live_url = self.open_session()
+        spool = Path(settings.UPLOAD_SPOOL_DIR)
+        orphan = spool / str(uuid.uuid4())
+        orphan.touch()
+        an_hour_ago = datetime.datetime.now().timestamp() - 3600
+        os.utime(orphan, (an_hour_ago, an_hour_ago))
+
+        out = StringIO()
+        call_command("purgeuploadsessions", stdout=out)
+
+        assert "Purged 1 upload sessions and 1 orphaned spool files" in out.getvalue()
+        live_id = live_url.rstrip("/").rsplit("/", 1)[-1]
+        assert [
+            str(session_id)
+            for session_id in UploadSessionModel.objects.values_list("id", flat=True)
+        ] == [live_id]
+        assert [path.name for path in spool.iterdir()] == [live_id]
+        assert self.client.head(expired_url).status_code == status.HTTP_404_NOT_FOUND
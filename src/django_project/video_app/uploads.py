@@ -0,0 +1,130 @@
+from contextlib import contextmanager
+import datetime
+import fcntl
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator, List
+from uuid import UUID
+
+from django.conf import settings
+
+from src.core.video.application.upload_spool_interface import IUploadSpool
+from src.core.video.domain.upload_session import UploadSession
+from src.core.video.domain.upload_session_repository import IUploadSessionRepository
+from src.django_project.video_app.models import UploadSessionModel
+
+
+class UploadSessionDjangoRepository(IUploadSessionRepository):
+    def insert(self, session: UploadSession) -> None:
+        UploadSessionModel.objects.create(
+            id=session.id,
+            video_id=session.video_id,
+            field=session.field,
+            file_name=session.file_name,
+            content_type=session.content_type,
+            length=session.length,
+            offset=session.offset,
+            created_at=session.created_at,
+        )
+
+    def find_by_id(self, video_id: UUID, session_id: UUID) -> UploadSession | None:
+        model = UploadSessionModel.objects.filter(
+            id=session_id, video_id=video_id
+        ).first()
+        return self._to_entity(model) if model else None
+
+    def advance(self, session: UploadSession, offset: int) -> bool:
+        return bool(
+            UploadSessionModel.objects.filter(
+                id=session.id, offset=session.offset
+            ).update(offset=offset)
+        )
+
+    def delete(self, session_id: UUID) -> None:
+        UploadSessionModel.objects.filter(id=session_id).delete()
+
+    def delete_created_before(self, moment: datetime.datetime) -> List[UUID]:
+        query = UploadSessionModel.objects.filter(created_at__lt=moment)
+        session_ids = list(query.values_list("id", flat=True))
+        UploadSessionModel.objects.filter(id__in=session_ids).delete()
+        return session_ids
+
+    @staticmethod
+    def _to_entity(model: UploadSessionModel) -> UploadSession:
+        return UploadSession(
+            id=model.id,
+            video_id=model.video_id,
+            field=model.field,
+            file_name=model.file_name,
+            content_type=model.content_type,
+            length=model.length,
+            offset=model.offset,
+            created_at=model.created_at,
+        )
+
+
+class UploadSpool(IUploadSpool):
+    """Spool files of resumable uploads, one per session under
+    ``UPLOAD_SPOOL_DIR``. Chunks are written at their offset as they are
+    read from the request, so no more than ``UPLOAD_READ_SIZE`` bytes of an
+    upload are in memory at a time."""
+
+    def __init__(self, directory: str | None = None):
+        self.directory = Path(directory or settings.UPLOAD_SPOOL_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def create(self, session_id: UUID) -> None:
+        self.path(session_id).touch()
+
+    @contextmanager
+    def lock(self, session_id: UUID) -> Iterator[None]:
+        """An exclusive ``flock`` on the spool file, which every worker
+        writing to the spool directory sees."""
+        with open(self.path(session_id), "rb") as file:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    def write(
+        self, session_id: UUID, offset: int, stream: BinaryIO | None, size: int
+    ) -> int:
+        written = 0
+        read_size = settings.UPLOAD_READ_SIZE
+
+        with open(self.path(session_id), "r+b") as file:
+            file.seek(offset)
+            while stream is not None and written < size:
+                chunk = stream.read(min(read_size, size - written))
+                if not chunk:
+                    break
+                file.write(chunk)
+                written += len(chunk)
+
+        return written
+
+    def open(self, session_id: UUID) -> BinaryIO:
+        return open(self.path(session_id), "rb")
+
+    def discard(self, session_id: UUID) -> None:
+        try:
+            os.remove(self.path(session_id))
+        except FileNotFoundError:
+            pass
+
+    def discard_untouched_since(self, moment: datetime.datetime) -> int:
+        discarded = 0
+
+        for path in self.directory.iterdir():
+            try:
+                if path.stat().st_mtime < moment.timestamp():
+                    path.unlink()
+                    discarded += 1
+            except FileNotFoundError:
+                pass
+
+        return discarded
+
+    def path(self, session_id: UUID) -> Path:
+        return self.directory / str(session_id)
@@ -1,20 +1,12 @@
 from uuid import UUID
+from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.decorators import action
 
-from src.core._shared.application.application_service import ApplicationService
-from src.core.cast_member.application.validations.cast_members_ids_exists_in_database_validator import (
-    CastMembersIdExistsInDatabaseValidator,
-)
-from src.core.category.application.validations.categories_ids_exists_in_database_validator import (
-    CategoriesIdExistsInDatabaseValidator,
-)
-from src.core.genre.application.validations.genres_ids_exists_in_database_validator import (
-    GenresIdExistsInDatabaseValidator,
-)
 from src.core.video.application.use_cases.update_video import (
     UpdateVideoInput,
     UpdateVideoUseCase,
@@ -23,13 +15,14 @@ from src.core.video.application.use_cases.upload_image_media import (
     UploadImageMediaInput,
     UploadImageMediaUseCase,
 )
-from src.core._shared.domain.events.domain_event_mediator import DomainEventMediator
-from src.core._shared.infra.storage.local_storage import LocalStorage
-from src.core._shared.infra.storage.s3_storage import S3Storage
 from src.core.video.application.use_cases.upload_audio_video_media import (
     UploadAudioVideoMediaInput,
     UploadAudioVideoMediaUseCase,
 )
+from src.core.video.application.use_cases.export_videos import (
+    ExportVideosInput,
+    ExportVideosUseCase,
+)
 from src.core.video.application.use_cases.delete_video import (
     DeleteVideoInput,
     DeleteVideoUseCase,
@@ -44,75 +37,74 @@ from src.core.video.application.use_cases.list_videos import (
     ListVideosUseCase,
 )
 from src.core.video.application.use_cases.common.video_output import VideoOutput
+from src.core.video.application.use_cases.bulk_create_videos import (
+    BulkCreateVideosUseCase,
+)
 from src.core.video.application.use_cases.create_video import (
     CreateVideoInput,
     CreateVideoUseCase,
 )
 
+from src.core.video.application.use_cases.append_upload_chunk import (
+    AppendUploadChunkInput,
+    AppendUploadChunkUseCase,
+)
+from src.core.video.application.use_cases.cancel_upload_session import (
+    CancelUploadSessionInput,
+    CancelUploadSessionUseCase,
+)
+from src.core.video.application.use_cases.common.upload_session_output import (
+    UploadSessionOutput,
+)
+from src.core.video.application.use_cases.create_upload_session import (
+    CreateUploadSessionInput,
+    CreateUploadSessionUseCase,
+)
+from src.core.video.application.use_cases.finalize_upload_session import (
+    FinalizeUploadSessionInput,
+    FinalizeUploadSessionUseCase,
+)
+from src.core.video.application.use_cases.get_upload_session import (
+    GetUploadSessionInput,
+    GetUploadSessionUseCase,
+)
+from src.core._shared.domain.exceptions import InvalidArgumentException
+from src.core.video.domain.upload_session import (
+    UploadSession,
+    UploadSessionConflictException,
+    UploadTooLargeException,
+)
+from src.django_project.container import container
+from src.django_project.shared_app.bulk import bulk_create_response
+from src.django_project.shared_app.streaming import ndjson_response
 from src.django_project.shared_app.filter_extractor import FilterExtractor
-from src.django_project.cast_member_app.repository import CastMemberDjangoRepository
-from src.django_project.category_app.repository import CategoryDjangoRepository
-from src.django_project.genre_app.repository import GenreDjangoRepository
-from src.django_project.shared_app.unit_of_work import UnitOfWork
 from src.django_project.video_app.presenters import (
     VideoCollectionPresenter,
     VideoPresenter,
 )
-from src.django_project.video_app.repository import VideoDjangoRepository
 from src.django_project.video_app.serializers import (
+    CreateUploadSessionInputSerializer,
     CreateVideoInputSerializer,
     DeleteVideoInputSerializer,
     GetVideoInputSerializer,
     UpdateVideoInputSerializer,
     UploadAudioVideoMediaInputSerializer,
     UploadImageMediaInputSerializer,
+    UploadSessionIdsInputSerializer,
 )
 
 
 class VideoViewSet(viewsets.ViewSet, FilterExtractor):
     def __init__(self, **kwargs):
-        video_repo = VideoDjangoRepository()
-        category_repo = CategoryDjangoRepository()
-        genre_repo = GenreDjangoRepository()
-        cast_member_repo = CastMemberDjangoRepository()
-
-        storage = S3Storage()
-        local_storage = LocalStorage()
-
-        uow = UnitOfWork()
-
-        app_service = ApplicationService(
-            uow=uow,
-            domain_event_mediator=DomainEventMediator(),
-        )
-
-        categories_id_validator = CategoriesIdExistsInDatabaseValidator(category_repo)
-        genres_id_validator = GenresIdExistsInDatabaseValidator(genre_repo)
-        cast_members_id_validator = CastMembersIdExistsInDatabaseValidator(
-            cast_member_repo
-        )
-
-        self.create_use_case = CreateVideoUseCase(
-            video_repo,
-            categories_id_validator,
-            genres_id_validator,
-            cast_members_id_validator,
-        )
-        self.get_use_case = GetVideoUseCase(video_repo)
-        self.list_use_case = ListVideosUseCase(video_repo)
-        self.delete_use_case = DeleteVideoUseCase(video_repo)
-        self.update_use_case = UpdateVideoUseCase(
-            video_repo,
-            categories_id_validator,
-            genres_id_validator,
-            cast_members_id_validator,
-        )
-        self.upload_audio_video_media = UploadAudioVideoMediaUseCase(
-            video_repo=video_repo,
-            storage=storage,
-            app_service=app_service,
-        )
-        self.upload_image_media = UploadImageMediaUseCase(video_repo, storage)
+        self.create_use_case = container.resolve(CreateVideoUseCase)
+        self.get_use_case = container.resolve(GetVideoUseCase)
+        self.list_use_case = container.resolve(ListVideosUseCase)
+        self.delete_use_case = container.resolve(DeleteVideoUseCase)
+        self.export_use_case = container.resolve(ExportVideosUseCase)
+        self.bulk_create_use_case = container.resolve(BulkCreateVideosUseCase)
+        self.update_use_case = container.resolve(UpdateVideoUseCase)
+        self.upload_audio_video_media = container.resolve(UploadAudioVideoMediaUseCase)
+        self.upload_image_media = container.resolve(UploadImageMediaUseCase)
 
     def create(self, request: Request) -> Response:
         serializer = CreateVideoInputSerializer(data=request.data)
@@ -197,7 +189,7 @@ class VideoViewSet(viewsets.ViewSet, FilterExtractor):
             **serializer.validated_data,
             field="video" if "video" in request.FILES else "trailer",
             file_name=file.name,
-            content=file.read(),
+            content=file,
             content_type=file.content_type,
         )
 
@@ -247,6 +239,24 @@ class VideoViewSet(viewsets.ViewSet, FilterExtractor):
             data=VideoViewSet.serialize(output),
         )
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        return bulk_create_response(
+            self,
+            request,
+            serializer_class=CreateVideoInputSerializer,
+            input_class=CreateVideoInput,
+            use_case=self.bulk_create_use_case,
+            serialize=VideoViewSet.serialize,
+        )
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request: Request) -> StreamingHttpResponse:
+        input = ExportVideosInput(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        output = self.export_use_case.execute(input)
+
+        return ndjson_response(output, VideoPresenter)
+
     def destroy(self, request: Request, pk: UUID = None):
         serializer = DeleteVideoInputSerializer(data={"id": pk})
         serializer.is_valid(raise_exception=True)
@@ -260,3 +270,120 @@ class VideoViewSet(viewsets.ViewSet, FilterExtractor):
     @staticmethod
     def serialize(output: VideoOutput):
         return VideoPresenter.from_output(output).serialize()
+
+
+class VideoUploadViewSet(viewsets.ViewSet):
+    """Resumable uploads of a video or trailer file.
+
+    ``POST`` opens a session for ``length`` bytes, ``PATCH`` appends the raw
+    request body at the ``Upload-Offset`` header (which must be the current
+    offset), ``HEAD``/``GET`` report the offset to resume from and
+    ``POST .../finalize`` stores the complete file on the video. Sessions
+    expire ``UPLOAD_SESSION_TIMEOUT`` seconds after they were opened."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.create_use_case = container.resolve(CreateUploadSessionUseCase)
+        self.get_use_case = container.resolve(GetUploadSessionUseCase)
+        self.append_use_case = container.resolve(AppendUploadChunkUseCase)
+        self.cancel_use_case = container.resolve(CancelUploadSessionUseCase)
+        self.finalize_use_case = container.resolve(FinalizeUploadSessionUseCase)
+
+    def create(self, request: Request, video_pk: UUID = None) -> Response:
+        ids = self.validate_ids(video_id=video_pk)
+        serializer = CreateUploadSessionInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        input = CreateUploadSessionInput(**ids, **serializer.validated_data)
+        output = self.create_use_case.execute(input)
+
+        return self.session_response(
+            output,
+            status.HTTP_201_CREATED,
+            Location=f"/api/videos/{output.video_id}/uploads/{output.id}/",
+        )
+
+    def retrieve(self, request: Request, video_pk: UUID = None, pk: UUID = None):
+        ids = self.validate_ids(video_id=video_pk, id=pk)
+        output = self.get_use_case.execute(GetUploadSessionInput(**ids))
+
+        return self.session_response(output, status.HTTP_200_OK)
+
+    def partial_update(self, request: Request, video_pk: UUID = None, pk: UUID = None):
+        ids = self.validate_ids(video_id=video_pk, id=pk)
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            size = int(request.headers.get("Content-Length") or 0)
+        except (KeyError, ValueError):
+            raise InvalidArgumentException(
+                "Upload-Offset and Content-Length headers are required"
+            )
+
+        input = AppendUploadChunkInput(
+            **ids,
+            offset=offset,
+            content=request.stream,
+            size=size,
+        )
+
+        try:
+            output = self.append_use_case.execute(input)
+        except UploadSessionConflictException as error:
+            return self.session_response(error.session, status.HTTP_409_CONFLICT)
+        except UploadTooLargeException as error:
+            return Response(
+                {"message": str(error)},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        return self.session_response(output, status.HTTP_200_OK)
+
+    def destroy(self, request: Request, video_pk: UUID = None, pk: UUID = None):
+        ids = self.validate_ids(video_id=video_pk, id=pk)
+        self.cancel_use_case.execute(CancelUploadSessionInput(**ids))
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=True, methods=["post"])
+    def finalize(self, request: Request, video_pk: UUID = None, pk: UUID = None):
+        ids = self.validate_ids(video_id=video_pk, id=pk)
+        try:
+            output = self.finalize_use_case.execute(FinalizeUploadSessionInput(**ids))
+        except UploadSessionConflictException as error:
+            return self.session_response(error.session, status.HTTP_409_CONFLICT)
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=VideoViewSet.serialize(output),
+        )
+
+    @staticmethod
+    def validate_ids(**ids: str) -> dict:
+        serializer = UploadSessionIdsInputSerializer(data=ids)
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data
+
+    @staticmethod
+    def session_response(
+        session: UploadSessionOutput | UploadSession, status_code: int, **headers
+    ) -> Response:
+        return Response(
+            {
+                "data": {
+                    "id": session.id,
+                    "field": session.field,
+                    "file_name": session.file_name,
+                    "content_type": session.content_type,
+                    "length": session.length,
+                    "offset": session.offset,
+                }
+            },
+            status=status_code,
+            headers={
+                "Upload-Offset": str(session.offset),
+                "Upload-Length": str(session.length),
+                "Cache-Control": "no-store",
+                **headers,
+            },
+        )